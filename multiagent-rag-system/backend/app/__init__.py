@@ -7,9 +7,24 @@ from .core.models.models import (
 )
 
 # 새로운 모듈화된 agent 시스템
-from .core.agents.orchestrator import TriageAgent, OrchestratorAgent
-from .core.agents.worker_agents import DataGathererAgent, ProcessorAgent
-from .core.agents.conversational_agent import SimpleAnswererAgent
+# 패키지 임포트(app.main 포함) 시 LLM/검색 스택 전체가 로드되지 않도록 첫 접근 시 임포트
+_LAZY_AGENTS = {
+    "TriageAgent": ".core.agents.orchestrator",
+    "OrchestratorAgent": ".core.agents.orchestrator",
+    "DataGathererAgent": ".core.agents.worker_agents",
+    "ProcessorAgent": ".core.agents.worker_agents",
+    "SimpleAnswererAgent": ".core.agents.conversational_agent",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_AGENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __version__ = "2.0.0"
 __author__ = "이성민"
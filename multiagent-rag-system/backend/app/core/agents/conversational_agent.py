@@ -2,7 +2,7 @@ import json
 import asyncio
 import os
 import sys
-from typing import AsyncGenerator, List
+from typing import Any, AsyncGenerator, Dict, List, Union
 from datetime import datetime
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
@@ -159,8 +159,11 @@ class SimpleAnswererAgent:
             else:
                 raise e
 
-    async def answer_streaming(self, state: StreamingAgentState, run_manager=None) -> AsyncGenerator[str, None]:
-        """스트리밍으로 페르소나 기반 답변을 생성하는 메서드"""
+    async def answer_streaming(self, state: StreamingAgentState, run_manager=None) -> AsyncGenerator[Union[str, Dict[str, Any]], None]:
+        """스트리밍으로 페르소나 기반 답변을 생성하는 메서드
+
+        답변 텍스트는 str 청크로, 검색 결과/full_data_dict 이벤트는 {"type": ...} dict로 yield합니다.
+        """
         print("\n>> SimpleAnswerer: 스트리밍 답변 시작")
 
         query = state["original_query"]  # 딕셔너리 접근 방식 사용
@@ -194,7 +197,7 @@ class SimpleAnswererAgent:
             web_results = await self._simple_web_search(web_search_query)
             if web_results:
                 search_results.extend(web_results)
-                # 웹 검색 결과를 프론트엔드로 스트리밍 (JSON 이벤트로)
+                # 웹 검색 결과를 프론트엔드로 스트리밍 (이벤트 dict로)
                 search_event = {
                     "type": "search_results",
                     "step": 1,
@@ -216,7 +219,7 @@ class SimpleAnswererAgent:
                     "section_context": None,
                     "message_id": state.get("message_id")
                 }
-                yield json.dumps(search_event)
+                yield search_event
                 print(f"- 웹 검색 결과 스트리밍 완료: {len(web_results)}개 결과")
 
         # 벡터 검색 수행 및 결과 스트리밍
@@ -229,7 +232,7 @@ class SimpleAnswererAgent:
             vector_results = await self._simple_vector_search(vector_search_query)
             if vector_results:
                 search_results.extend(vector_results)
-                # 벡터 검색 결과를 프론트엔드로 스트리밍 (JSON 이벤트로)
+                # 벡터 검색 결과를 프론트엔드로 스트리밍 (이벤트 dict로)
                 search_event = {
                     "type": "search_results",
                     "step": 2,
@@ -252,7 +255,7 @@ class SimpleAnswererAgent:
                     "section_context": None,
                     "message_id": state.get("message_id")
                 }
-                yield json.dumps(search_event)
+                yield search_event
                 print(f"- 벡터 검색 결과 스트리밍 완료: {len(vector_results)}개 결과")
 
         # 스크래핑 수행 및 결과 스트리밍
@@ -295,7 +298,7 @@ class SimpleAnswererAgent:
                     "section_context": None,
                     "message_id": state.get("message_id")
                 }
-                yield json.dumps(search_event)
+                yield search_event
                 print(f"- 스크래핑 결과 스트리밍 완료: {len(scraping_results)}개 결과")
 
         # 대화 히스토리 추출 및 메모리 컨텍스트 생성
@@ -390,13 +393,13 @@ class SimpleAnswererAgent:
 
             state["metadata"]["sources"] = sources_data
 
-            # full_data_dict를 프론트엔드로 전송 (JSON 이벤트로)
+            # full_data_dict를 프론트엔드로 전송 (이벤트 dict로)
             if full_data_dict:
                 full_data_event = {
                     "type": "full_data_dict",
                     "data_dict": full_data_dict
                 }
-                yield json.dumps(full_data_event)
+                yield full_data_event
                 print(f"- SimpleAnswerer full_data_dict 전송 완료: {len(full_data_dict)}개 항목")
 
         print(f"- 스트리밍 답변 생성 완료 (길이: {len(full_response)}자)")
@@ -15,6 +15,7 @@ from .worker_agents import DataGathererAgent, ProcessorAgent
 from ...services.search.search_tools import scrape_and_extract_content
 from sentence_transformers import SentenceTransformer
 from ...utils.session_logger import get_session_logger
+from ...utils.json_utils import find_json_object
 from ...services.database.neo4j_rag_tool import neo4j_graph_search
 
 # --- 페르소나 프롬프트 로드 ---
@@ -34,6 +35,14 @@ except json.JSONDecodeError:
     print(f"경고: {file_path} 파일 파싱에 실패했습니다. JSON 형식을 확인해주세요.")
 # -----------------------------
 
+# 동시에 스트리밍할 섹션 수 상한 (LLM 제공자 rate limit 보호)
+SECTION_GENERATION_CONCURRENCY = int(os.getenv("SECTION_GENERATION_CONCURRENCY", "4"))
+# 동시에 생성할 차트 수 상한
+CHART_GENERATION_CONCURRENCY = int(os.getenv("CHART_GENERATION_CONCURRENCY", "5"))
+CHART_MARKER = "[GENERATE_CHART]"
+# 계획의 하위 질문에서 앞 단계 결과를 참조하는 플레이스홀더
+_STEP_PLACEHOLDER_RE = re.compile(r"\[step-(\d+)의 결과\]")
+
 class TriageAgent:
     """요청 분류 및 라우팅 담당 Agent"""
 
@@ -76,10 +85,9 @@ JSON으로 응답:
                 classification = json.loads(response_content)
             except json.JSONDecodeError:
                 # JSON 블록 찾기 시도
-                import re
-                json_match = re.search(r'\{.*\}', response_content, re.DOTALL)
-                if json_match:
-                    classification = json.loads(json_match.group())
+                json_str = find_json_object(response_content)
+                if json_str:
+                    classification = json.loads(json_str)
                 else:
                     raise ValueError("Valid JSON not found in response")
 
@@ -456,7 +464,7 @@ class OrchestratorAgent:
 
     def _inject_context_into_query(self, query: str, context: Dict[int, str]) -> str:
         """'[step-X의 결과]' 플레이스홀더를 실제 컨텍스트로 교체하는 헬퍼 함수"""
-        match = re.search(r"\[step-(\d+)의 결과\]", query)
+        match = _STEP_PLACEHOLDER_RE.search(query)
         if match:
             step_index = int(match.group(1))
             if step_index in context:
@@ -740,11 +748,9 @@ class OrchestratorAgent:
             content = response.content.strip()
 
             json_match = re.search(r'```json\s*(\{.*?\})\s*```', content, re.DOTALL)
-            if not json_match:
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            json_str = json_match.group(1) if json_match else find_json_object(content)
 
-            if json_match:
-                json_str = json_match.group(1) if '```' in json_match.group(0) else json_match.group(0)
+            if json_str:
                 plan = json.loads(json_str)
             else:
                 raise ValueError("Valid JSON plan not found in response")
@@ -867,7 +873,7 @@ class OrchestratorAgent:
             )
 
             # JSON 파싱
-            result = json.loads(re.search(r'\{.*\}', response.content, re.DOTALL).group())
+            result = json.loads(find_json_object(response.content))
             selected_indexes = result.get("selected_indexes", [])
             reasoning = result.get("reasoning", "")
             rejected_reason = result.get("rejected_reason", "")
@@ -936,6 +942,9 @@ class OrchestratorAgent:
             selected_persona = "기본"
             state["persona"] = selected_persona
 
+        # 섹션/차트 생성에서 반복 조회하지 않도록 페르소나 프롬프트를 state에 한 번만 고정
+        self.processor._resolve_persona(state)
+
         yield self._create_status_event("PLANNING", "PERSONA_CONFIRMED", f"'{selected_persona}' 페르소나로 보고서 생성을 시작합니다.")
 
         # 차트 카운터 초기화
@@ -989,6 +998,14 @@ class OrchestratorAgent:
         yield self._create_status_event("PLANNING", "GENERATE_PLAN_START", "분석 계획 수립 중...")
         state_with_plan = await self.generate_plan(state)
         plan = state_with_plan.get("plan", {})
+        # 앞 단계 결과에 의존하지 않는 질문들은 실행 때와 같은 쿼리이므로 최적화를 미리 시작
+        # (이후 단계 질문의 최적화가 앞 단계 데이터 수집과 겹쳐 실행됨)
+        self.data_gatherer.prewarm([
+            (sq["question"], sq["tool"])
+            for step in plan.get("execution_steps", [])
+            for sq in step.get("sub_questions", [])
+            if sq.get("question") and sq.get("tool") and not _STEP_PLACEHOLDER_RE.search(sq["question"])
+        ])
 
         yield {"type": "plan", "data": {"plan": plan}}
 
@@ -1032,8 +1049,9 @@ class OrchestratorAgent:
                     yield event
                 elif event["type"] == "collection_complete":
                     # worker로부터 받은 dict 리스트를 다시 SearchResult 객체 리스트로 변환합니다.
+                    # (이미 검증된 SearchResult의 model_dump 결과이므로 재검증 생략)
                     collected_dicts = event["data"]["collected_data"]
-                    step_collected_data = [SearchResult(**data_dict) for data_dict in collected_dicts]
+                    step_collected_data = [SearchResult.model_construct(**data_dict) for data_dict in collected_dicts]
 
             # 중복 제거 없이 원본 데이터 사용
             unique_step_data = step_collected_data
@@ -1141,7 +1159,7 @@ class OrchestratorAgent:
                     elif event["type"] == "collection_complete":
                         additional_data_dicts = event["data"]["collected_data"]
                         for data_dict in additional_data_dicts:
-                            additional_data_collected_objects.append(SearchResult(**data_dict))
+                            additional_data_collected_objects.append(SearchResult.model_construct(**data_dict))
 
             # if 문의 조건 변수를 additional_data_collected_objects로 변경합니다.
             if additional_data_collected_objects:
@@ -1180,6 +1198,12 @@ class OrchestratorAgent:
 
         yield {"type": "full_data_dict", "data": {"data_dict": full_data_dict}}
 
+        # 섹션 프롬프트용 데이터 블록은 보고서당 한 번만 포맷하여 모든 섹션이 공유
+        state["formatted_data_blocks"] = {
+            "synthesis": self.processor._prebuild_data_blocks(full_data_dict),
+            "full_data_for_chart": self.processor._prebuild_data_blocks(full_data_dict, include_url=True),
+        }
+
         section_titles = [s.get('section_title', '제목 없음') for s in design.get('structure', [])]
         yield self._create_status_event("PROCESSING", "DESIGN_STRUCTURE_COMPLETE", "보고서 구조 설계 완료.", details={
             "report_title": design.get("title"),
@@ -1211,9 +1235,51 @@ class OrchestratorAgent:
         for i, sec in enumerate(structure):
             awareness_context += f"- **섹션 {i+1}. {sec.get('section_title', '')}**: {sec.get('description', '')}\n"
 
+        # 모든 섹션이 같은 구조 블록을 쓰므로 한 번만 렌더링해 state에 보관
+        state["_awareness_context_rendered"] = self.processor.render_awareness_context(awareness_context)
+
         # 5. 각 섹션의 결과를 담을 Queue 리스트와 병렬 실행할 Task 리스트 생성
         section_queues = [asyncio.Queue() for _ in structure]
         producer_tasks = []
+        section_semaphore = asyncio.Semaphore(SECTION_GENERATION_CONCURRENCY)
+        # 섹션별로 미리 시작한 차트 생성 Task (마커 등장 순서대로, Consumer가 하나씩 꺼내 씀)
+        chart_semaphore = asyncio.Semaphore(CHART_GENERATION_CONCURRENCY)
+        pending_charts = [[] for _ in structure]
+        # 섹션별로 생성한 모든 차트 Task와 완성된 섹션 내용 (이후 시작하는 차트의 중복 방지 컨텍스트용)
+        section_chart_tasks = [[] for _ in structure]
+        section_results = [None for _ in structure]
+        chart_logger = get_session_logger(state.get("session_id", "unknown"), "OrchestratorAgent")
+
+        async def _generate_section_chart(section_index, section_data_list, section_title, generated_content):
+            """섹션 차트를 생성하여 차트 데이터(또는 None)를 반환
+
+            차트들은 세마포어 한도 내에서 동시에 생성되므로, 중복 방지 컨텍스트에는
+            시작 시점까지 완료된 앞 섹션 내용과 차트만 담습니다 (다른 차트를 기다리지 않음).
+            """
+            # 차트 생성 과정의 상태 메시지를 위한 콜백
+            async def chart_yield_callback(event_data):
+                print(f"차트 생성 상태: {event_data}")
+                return event_data
+
+            async with chart_semaphore:
+                previous_charts = []
+                for j in range(section_index + 1):
+                    for t in section_chart_tasks[j]:
+                        if not t.done() or t.cancelled() or t.exception() is not None or not t.result():
+                            continue
+                        previous_charts.append({"section": structure[j].get('section_title', f'섹션 {j+1}'), "chart": t.result()})
+
+                # 동시 실행되므로 state는 복사본 사용
+                chart_state = {**state, "chart_context": {
+                    "previous_sections": [r for r in section_results[:section_index] if r],
+                    "previous_charts": previous_charts,
+                    "current_section_content": generated_content
+                }}
+
+                async for result in self.processor.process("create_chart_data", section_data_list, section_title, generated_content, "", chart_yield_callback, state=chart_state):
+                    if result.get("type") == "chart":
+                        return result.get("data")
+            return None
 
         # 백그라운드에서 각 섹션 내용을 생성하고 Queue에 넣는 코루틴
         async def _produce_section_content(section_index: int):
@@ -1221,26 +1287,56 @@ class OrchestratorAgent:
             q = section_queues[section_index]
 
             use_contents = section_info.get("use_contents", [])
+            section_title = section_info.get('section_title', f'섹션 {section_index+1}')
+            section_data_list = [final_collected_data[idx] for idx in use_contents if 0 <= idx < len(final_collected_data)]
+            section_text_parts = []
+            scan_tail = ""
 
             try:
-                # generate_section_streaming을 호출하여 비동기적으로 청크를 받음
-                async for chunk in self.processor.generate_section_streaming(
-                    section_info, full_data_dict, query, use_contents,
-                    awareness_context=awareness_context,
-                    state=state
-                ):
-                    # 🛑 Abort 체크
-                    if run_manager and run_manager.is_abort_requested(state.get("metadata", {}).get("run_id")):
-                        await q.put(None)  # 스트림 종료
-                        return
-
-                    await q.put(chunk)  # 받은 청크를 큐에 넣음
+                # 동시 LLM 스트림 수를 제한하고, generate_section_streaming을 호출하여 비동기적으로 청크를 받음
+                async with section_semaphore:
+                    async for chunk in self.processor.generate_section_streaming(
+                        section_info, full_data_dict, query, use_contents,
+                        awareness_context=awareness_context,
+                        state=state
+                    ):
+                        # 🛑 Abort 체크
+                        if run_manager and run_manager.is_abort_requested(state.get("metadata", {}).get("run_id")):
+                            await q.put(None)  # 스트림 종료
+                            return
+
+                        await q.put(chunk)  # 받은 청크를 큐에 넣음
+                        section_text_parts.append(chunk)
+
+                        # 차트 마커가 보이면 Consumer 차례를 기다리지 않고 바로 차트 생성 시작
+                        scan_text = scan_tail + chunk
+                        search_from = 0
+                        while True:
+                            marker_pos = scan_text.find(CHART_MARKER, search_from)
+                            if marker_pos == -1:
+                                break
+                            search_from = marker_pos + len(CHART_MARKER)
+                            generated_so_far = "".join(section_text_parts).replace(CHART_MARKER, "")
+                            chart_task = asyncio.create_task(_generate_section_chart(
+                                section_index, section_data_list, section_title, generated_so_far
+                            ))
+                            section_chart_tasks[section_index].append(chart_task)
+                            pending_charts[section_index].append(chart_task)
+                        scan_tail = scan_text[search_from:][-(len(CHART_MARKER) - 1):]
             except Exception as e:
                 # 오류 발생 시 에러 메시지를 큐에 넣음
                 error_message = f"*'{section_info.get('section_title', '')}' 섹션 생성 중 오류가 발생했습니다: {str(e)}*\n\n"
                 await q.put(error_message)
                 print(f">> 섹션 생성(Producer) 오류: {error_message}")
             finally:
+                # 뒤 섹션 차트가 참고할 완성된 섹션 내용 기록 (accumulated_context와 같은 형식)
+                section_full_text = "".join(section_text_parts)
+                if section_full_text:
+                    section_results[section_index] = {
+                        "title": section_title,
+                        "content": section_full_text,
+                        "data_indices": use_contents
+                    }
                 # 스트림이 끝나면 None을 넣어 종료를 알림
                 await q.put(None)
 
@@ -1250,63 +1346,64 @@ class OrchestratorAgent:
             producer_tasks.append(task)
 
         # 6. 순차적으로 Queue에서 결과를 꺼내 스트리밍 (Consumer)
-        for i, section in enumerate(structure):
-            section_title = section.get('section_title', f'섹션 {i+1}')
-            use_contents = section.get("use_contents", [])
-
-            yield self._create_status_event("GENERATING", "GENERATE_SECTION_START", f"'{section_title}' 섹션 생성 중...", details={
-                "section_index": i, "section_title": section_title, "using_indices": use_contents
-            })
-
-            buffer = ""
-            # ✅ section_full_content 변수 초기화 추가
-            section_full_content = ""
-            section_data_list = [final_collected_data[idx] for idx in use_contents if 0 <= idx < len(final_collected_data)]
-             # ✅ section_content_generated 변수 추가 (생성 실패 여부 확인용)
-            section_content_generated = False
-
-            # 해당 섹션의 Queue에서 결과가 나올 때까지 대기
-            while True:
-                chunk = await section_queues[i].get()
-
-                # None을 받으면 해당 섹션 스트리밍이 끝난 것
-                if chunk is None:
-                    break
-
-                # ✅ 청크를 받았다면 내용이 생성된 것으로 간주
-                section_content_generated = True
-                buffer += chunk
-                # ✅ 전체 섹션 내용도 별도로 누적
-                section_full_content += chunk
-
-                # 차트 생성 마커가 있는지 확인
-                if "[GENERATE_CHART]" in buffer:
-                    parts = buffer.split("[GENERATE_CHART]", 1)
-
-                    if parts[0]:
-                        yield {"type": "content", "data": {"chunk": parts[0]}}
-
-                    buffer = parts[1]
-
-                    yield self._create_status_event("GENERATING", "GENERATE_CHART_START", f"'{section_title}' 차트 생성 중...")
-
-                    # 차트 생성 과정의 상태 메시지를 위한 콜백
-                    async def chart_yield_callback(event_data):
-                        print(f"차트 생성 상태: {event_data}")
-                        return event_data
+        # Producer들은 모두 동시에 실행되고, 앞 섹션을 내보내는 동안 뒤 섹션 청크는 각자의 Queue에 쌓임
+        try:
+            for i, section in enumerate(structure):
+                section_title = section.get('section_title', f'섹션 {i+1}')
+                use_contents = section.get("use_contents", [])
 
-                    # 이전까지 생성된 context를 차트 생성에 전달
-                    chart_context = {
-                        "previous_sections": accumulated_context["generated_sections"],
-                        "previous_charts": accumulated_context["chart_data"],
-                        "current_section_content": buffer
-                    }
-                    state['chart_context'] = chart_context
+                yield self._create_status_event("GENERATING", "GENERATE_SECTION_START", f"'{section_title}' 섹션 생성 중...", details={
+                    "section_index": i, "section_title": section_title, "using_indices": use_contents
+                })
 
-                    chart_data = None
-                    async for result in self.processor.process("create_chart_data", section_data_list, section_title, buffer, "", chart_yield_callback, state=state):
-                        if result.get("type") == "chart":
-                            chart_data = result.get("data")
+                buffer = ""
+                # ✅ section_full_content 변수 초기화 추가
+                section_full_content = ""
+                section_data_list = [final_collected_data[idx] for idx in use_contents if 0 <= idx < len(final_collected_data)]
+                 # ✅ section_content_generated 변수 추가 (생성 실패 여부 확인용)
+                section_content_generated = False
+
+                # 해당 섹션의 Queue에서 결과가 나올 때까지 대기
+                while True:
+                    chunk = await section_queues[i].get()
+
+                    # None을 받으면 해당 섹션 스트리밍이 끝난 것
+                    if chunk is None:
+                        break
+
+                    # ✅ 청크를 받았다면 내용이 생성된 것으로 간주
+                    section_content_generated = True
+                    buffer += chunk
+                    # ✅ 전체 섹션 내용도 별도로 누적
+                    section_full_content += chunk
+
+                    # 차트 생성 마커가 있는지 확인
+                    if "[GENERATE_CHART]" in buffer:
+                        parts = buffer.split("[GENERATE_CHART]", 1)
+
+                        if parts[0]:
+                            yield {"type": "content", "data": {"chunk": parts[0]}}
+
+                        buffer = parts[1]
+
+                        yield self._create_status_event("GENERATING", "GENERATE_CHART_START", f"'{section_title}' 차트 생성 중...")
+
+                        # Producer가 미리 시작한 차트 Task가 있으면 그 결과를 사용, 없으면 지금 생성
+                        if pending_charts[i]:
+                            chart_task = pending_charts[i].pop(0)
+                        else:
+                            chart_task = asyncio.create_task(_generate_section_chart(
+                                i, section_data_list, section_title, buffer
+                            ))
+                            section_chart_tasks[i].append(chart_task)
+
+                        chart_data = None
+                        try:
+                            chart_data = await chart_task
+                        except Exception as chart_error:
+                            chart_logger.error(f"'{section_title}' 차트 생성 오류: {chart_error}")
+
+                        if chart_data:
                             accumulated_context["chart_data"].append({
                                 "section": section_title,
                                 "chart": chart_data
@@ -1315,66 +1412,70 @@ class OrchestratorAgent:
                             # 차트 생성 검증 로그 기록 (섹션 description 포함)
                             section_description = section.get('description', '설명 없음')
                             await self._log_chart_verification(query, section_title, section_description, section_data_list, chart_data, state)
-                            break
-
-                    if chart_data and "error" not in chart_data:
-                        current_chart_index = state.get('chart_counter', 0)
-                        chart_placeholder = f"\n\n[CHART-PLACEHOLDER-{current_chart_index}]\n\n"
-                        yield {"type": "content", "data": {"chunk": chart_placeholder}}
-                        yield {"type": "chart", "data": chart_data}
-                        state['chart_counter'] = current_chart_index + 1
-                    else:
-                        print(f"   차트 생성 실패: {chart_data}")
-                        yield self._create_status_event("GENERATING", "GENERATE_CHART_FAILURE", f"'{section_title}' 차트 생성이 완료되지 못했습니다.")
-                        yield {"type": "content", "data": {"chunk": "\n\n*[데이터 부족으로 차트 표시가 제한됩니다]*\n\n"}}
 
-                else:
-                    # 텍스트 스트리밍을 위한 버퍼 관리
-                    potential_chart_marker = "[GENERATE_CHART]"
-                    # 버퍼 끝에 마커 일부가 걸쳐있는지 확인
-                    has_partial_marker = any(potential_chart_marker.startswith(buffer[-j:]) for j in range(1, min(len(buffer) + 1, len(potential_chart_marker) + 1)))
-
-                    should_flush = (
-                        not has_partial_marker and (
-                            len(buffer) >= 120 or
-                            buffer.endswith(('.', '!', '?', '\n', '다.', '요.', '니다.', '습니다.', '됩니다.', '있습니다.')) or
-                            '\n\n' in buffer
-                        )
-                    )
-
-                    if should_flush:
-                        yield {"type": "content", "data": {"chunk": buffer}}
-                        buffer = ""
-
-            # while 루프 종료 후 남은 버퍼 처리
-            if buffer.strip():
-                yield {"type": "content", "data": {"chunk": buffer}}
+                        if chart_data and "error" not in chart_data:
+                            current_chart_index = state.get('chart_counter', 0)
+                            chart_placeholder = f"\n\n[CHART-PLACEHOLDER-{current_chart_index}]\n\n"
+                            yield {"type": "content", "data": {"chunk": chart_placeholder}}
+                            yield {"type": "chart", "data": chart_data}
+                            state['chart_counter'] = current_chart_index + 1
+                        else:
+                            print(f"   차트 생성 실패: {chart_data}")
+                            yield self._create_status_event("GENERATING", "GENERATE_CHART_FAILURE", f"'{section_title}' 차트 생성이 완료되지 못했습니다.")
+                            yield {"type": "content", "data": {"chunk": "\n\n*[데이터 부족으로 차트 표시가 제한됩니다]*\n\n"}}
 
-            # 생성된 섹션 내용을 누적 context에 추가
-            if section_full_content:
-                accumulated_context["generated_sections"].append({
-                    "title": section_title,
-                    "content": section_full_content,
-                    "data_indices": use_contents
-                })
-                # 주요 인사이트 추출
-                first_paragraph = section_full_content.split("\n\n")[0] if "\n\n" in section_full_content else section_full_content[:200]
-                accumulated_context["insights"].append({
-                    "section": section_title,
-                    "insight": first_paragraph
-                })
-
-                # 섹션 생성 검증 로그 기록 (섹션 description 포함)
-                section_description = section.get('description', '설명 없음')
-                await self._log_section_verification(query, section_title, section_description, section_data_list, section_full_content, state)
-
-            # 내용이 전혀 생성되지 않은 경우 경고 처리
-            if not section_content_generated:
-                print(f">> 경고: 섹션 '{section_title}' 내용 생성 실패")
-                yield {"type": "content", "data": {"chunk": f"*'{section_title}' 섹션 생성 중 문제가 발생했습니다.*\n\n"}}
+                    else:
+                        # 텍스트 스트리밍을 위한 버퍼 관리
+                        potential_chart_marker = "[GENERATE_CHART]"
+                        # 버퍼 끝에 마커 일부가 걸쳐있는지 확인
+                        has_partial_marker = any(potential_chart_marker.startswith(buffer[-j:]) for j in range(1, min(len(buffer) + 1, len(potential_chart_marker) + 1)))
+
+                        should_flush = (
+                            not has_partial_marker and (
+                                len(buffer) >= 120 or
+                                buffer.endswith(('.', '!', '?', '\n', '다.', '요.', '니다.', '습니다.', '됩니다.', '있습니다.')) or
+                                '\n\n' in buffer
+                            )
+                        )
 
-            # 각 섹션 사이에 공백 추가
-            yield {"type": "content", "data": {"chunk": "\n\n"}}
+                        if should_flush:
+                            yield {"type": "content", "data": {"chunk": buffer}}
+                            buffer = ""
+
+                # while 루프 종료 후 남은 버퍼 처리
+                if buffer.strip():
+                    yield {"type": "content", "data": {"chunk": buffer}}
+
+                # 생성된 섹션 내용을 누적 context에 추가
+                if section_full_content:
+                    accumulated_context["generated_sections"].append({
+                        "title": section_title,
+                        "content": section_full_content,
+                        "data_indices": use_contents
+                    })
+                    # 주요 인사이트 추출
+                    first_paragraph = section_full_content.split("\n\n")[0] if "\n\n" in section_full_content else section_full_content[:200]
+                    accumulated_context["insights"].append({
+                        "section": section_title,
+                        "insight": first_paragraph
+                    })
+
+                    # 섹션 생성 검증 로그 기록 (섹션 description 포함)
+                    section_description = section.get('description', '설명 없음')
+                    await self._log_section_verification(query, section_title, section_description, section_data_list, section_full_content, state)
+
+                # 내용이 전혀 생성되지 않은 경우 경고 처리
+                if not section_content_generated:
+                    print(f">> 경고: 섹션 '{section_title}' 내용 생성 실패")
+                    yield {"type": "content", "data": {"chunk": f"*'{section_title}' 섹션 생성 중 문제가 발생했습니다.*\n\n"}}
+
+                # 각 섹션 사이에 공백 추가
+                yield {"type": "content", "data": {"chunk": "\n\n"}}
+        finally:
+            # 클라이언트 연결 종료 등으로 Consumer가 중단되면 남은 Producer와 사용되지 않은 차트 Task를 정리
+            for task in producer_tasks + [t for tasks in pending_charts for t in tasks]:
+                if not task.done():
+                    task.cancel()
 
         # 워크플로우 완료 후 출처 정보 설정 (실제 사용된 인덱스만)
         # 모든 섹션에서 사용된 인덱스들을 수집
@@ -1462,7 +1563,7 @@ class OrchestratorAgent:
 
         try:
             response = await self._invoke_with_fallback(update_prompt, self.llm, self.llm_openai_mini)
-            result = json.loads(re.search(r'\{.*\}', response.content, re.DOTALL).group())
+            result = json.loads(find_json_object(response.content))
 
             updated_indexes = result.get("updated_use_contents", [])
             reasoning = result.get("reasoning", "")
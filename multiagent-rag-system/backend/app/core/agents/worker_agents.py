@@ -3,9 +3,16 @@ import re
 import sys
 import asyncio
 import json
+import logging
+import orjson
 import concurrent.futures
 import os
-from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple
+import copy
+import hashlib
+from collections import OrderedDict, deque
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, AsyncGenerator, Tuple, Literal, Union, FrozenSet
 
 # Fallback 시스템 import (Docker 볼륨 마운트된 utils 폴더)
 sys.path.append('/app')
@@ -17,6 +24,8 @@ from concurrent.futures import ThreadPoolExecutor
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+import aiohttp
+from lxml import etree as LET
 
 from langchain.prompts import PromptTemplate
 from langchain import hub
@@ -34,9 +43,659 @@ from ...services.search.search_tools import (
     arxiv_search,
 )
 from ...utils.session_logger import get_session_logger, set_current_session, session_print
+from ...utils.async_cache import AsyncTTLCache
+from ...utils.json_utils import find_json_object
+
+# 섹션/차트의 청크 단위 상세 로그는 APP_LOG_LEVEL=DEBUG 일 때만 생성 (출력 설정은 utils.logging_setup)
+logger = logging.getLogger(__name__)
 
 # 전역 ThreadPoolExecutor 생성 (재사용으로 성능 향상)
 _global_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="search_worker")
+# RDB/그래프 조회·스크래핑 전용 I/O executor (기본 executor 대신 스레드 수를 제한)
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="worker-io")
+
+# 쿼리 최적화 프리워밍 설정
+PREWARM_CACHE_SIZE = 64          # (query, tool) 단위 LRU 최대 크기
+
+# 차트 생성 결과 캐시 크기 (동일 프롬프트 → 동일 차트 재사용)
+CHART_CACHE_SIZE = 128
+# 차트 프롬프트 컨텍스트 길이 제한
+CHART_DATA_CONTENT_CHARS = 800      # 데이터 항목별 내용
+CHART_GENERATED_PREVIEW_CHARS = 1200  # 직전에 생성된 보고서 내용
+CHART_PREV_LABELS = 8               # 이전 차트 라벨 개수
+CHART_RETRY_SCAN_CHARS = 64 * 1024  # JSON 재시도 시 1차 추출 위치부터 후보를 찾는 범위
+
+# 외부 검색 결과 캐시 (재계획/재시도 시 동일 쿼리 반복 호출 방지)
+_ARXIV_CACHE = AsyncTTLCache(capacity=256, ttl=900)
+_RDB_CACHE = AsyncTTLCache(capacity=256, ttl=900)
+_SCRAPE_CACHE = AsyncTTLCache(capacity=256, ttl=900)
+
+# arXiv API용 공유 HTTP 세션 (Keep-Alive로 TLS 핸드셰이크 재사용)
+# aiohttp 세션은 생성된 이벤트 루프에 묶이므로 다른 루프에서 호출되면 새로 생성
+ARXIV_USER_AGENT = "MyArxivClient/1.0 (contact: youremail@example.com)"
+_ARXIV_SESSION: Optional[aiohttp.ClientSession] = None
+_ARXIV_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_arxiv_session() -> aiohttp.ClientSession:
+    """현재 이벤트 루프용 arXiv aiohttp 세션을 지연 생성하여 재사용합니다."""
+    global _ARXIV_SESSION, _ARXIV_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _ARXIV_SESSION is None or _ARXIV_SESSION.closed or _ARXIV_SESSION_LOOP is not loop:
+        if _ARXIV_SESSION is not None and not _ARXIV_SESSION.closed:
+            # 이전 루프의 세션은 이 루프에서 닫을 수 없으므로 커넥터를 떼어내고 버림
+            _ARXIV_SESSION.detach()
+        _ARXIV_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            headers={"User-Agent": ARXIV_USER_AGENT},
+        )
+        _ARXIV_SESSION_LOOP = loop
+    return _ARXIV_SESSION
+
+
+async def close_arxiv_session():
+    """공유 arXiv 세션 종료 (서버 종료 시 호출)"""
+    global _ARXIV_SESSION, _ARXIV_SESSION_LOOP
+    session, owner_loop = _ARXIV_SESSION, _ARXIV_SESSION_LOOP
+    _ARXIV_SESSION, _ARXIV_SESSION_LOOP = None, None
+    if session is None or session.closed:
+        return
+    if owner_loop is asyncio.get_running_loop():
+        await session.close()
+    else:
+        session.detach()
+
+
+# arXiv Atom 피드 스트리밍 파싱 설정
+_ARXIV_ENTRY_TAG = '{http://www.w3.org/2005/Atom}entry'
+ARXIV_STREAM_CHUNK_SIZE = 8192
+
+# arXiv Atom 피드 파싱용 XPath (모듈 로드 시 1회 컴파일)
+_ARXIV_NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+_XP_TITLE = LET.XPath('string(atom:title)', namespaces=_ARXIV_NS, smart_strings=False)
+_XP_AUTHORS = LET.XPath('atom:author/atom:name/text()', namespaces=_ARXIV_NS, smart_strings=False)
+_XP_SUMMARY = LET.XPath('string(atom:summary)', namespaces=_ARXIV_NS, smart_strings=False)
+_XP_PUBLISHED = LET.XPath('string(atom:published)', namespaces=_ARXIV_NS, smart_strings=False)
+_XP_CATS = LET.XPath('atom:category/@term', namespaces=_ARXIV_NS, smart_strings=False)
+_XP_PDF = LET.XPath('atom:link[@type="application/pdf"]/@href', namespaces=_ARXIV_NS, smart_strings=False)
+_XP_ID = LET.XPath('string(atom:id)', namespaces=_ARXIV_NS, smart_strings=False)
+
+
+def _parse_arxiv_entry(entry) -> Dict[str, str]:
+    """arXiv Atom <entry> 요소에서 논문 정보를 추출합니다."""
+    # 논문 정보 추출
+    title = _XP_TITLE(entry).strip().replace('\n', ' ')
+
+    # 저자 정보
+    author_names = _XP_AUTHORS(entry)
+    author_str = ', '.join(author_names[:3])
+    if len(author_names) > 3:
+        author_str += f' 외 {len(author_names)-3}명'
+
+    # 초록
+    summary = _XP_SUMMARY(entry).strip()
+    if len(summary) > 300:
+        summary = summary[:297] + "..."
+
+    # 발행일
+    published = _XP_PUBLISHED(entry)
+    # published는 ISO 8601(YYYY-MM-DDT...) 형식이므로 strptime 없이 슬라이싱으로 포맷
+    pub_date = f"{published[0:4]}년 {published[5:7]}월 {published[8:10]}일"
+
+    # 카테고리
+    categories_str = ', '.join(_XP_CATS(entry)[:3])
+
+    # 논문 링크
+    pdf_links = _XP_PDF(entry)
+    pdf_link = pdf_links[0] if pdf_links else _XP_ID(entry).replace('abs', 'pdf')
+
+    return {
+        "title": title,
+        "authors": author_str,
+        "date": pub_date,
+        "categories": categories_str,
+        "pdf": pdf_link,
+        "summary": summary,
+    }
+
+
+def _mk_arxiv_result(paper: Dict[str, str], query: str, ts: str) -> SearchResult:
+    """내부에서 파싱한 arXiv 논문 dict로 SearchResult를 검증 없이 생성합니다."""
+    return SearchResult.model_construct(
+        source="arxiv_search",
+        content=paper["summary"],
+        search_query=query,
+        title=paper["title"] or "arXiv 논문",
+        url=paper["pdf"],
+        score=0.95,  # 학술 논문은 높은 신뢰도
+        timestamp=ts,
+        document_type="research_paper",
+        metadata={
+            "authors": paper["authors"],
+            "date": paper["date"],
+            "categories": paper["categories"],
+            "optimized_query": query
+        },
+    )
+
+
+def _mk_web_result(item: Dict[str, str], query: str, ts: str) -> SearchResult:
+    """웹 검색 결과 텍스트에서 파싱한 dict로 SearchResult를 검증 없이 생성합니다."""
+    return SearchResult.model_construct(
+        source="web_search",
+        content=item.get("snippet", ""),
+        search_query=query,
+        title=item.get("title", "웹 검색 결과"),
+        url=item.get("link"),
+        score=0.9,  # 웹검색 결과는 높은 점수
+        timestamp=ts,
+        document_type="web",
+        metadata={
+            "optimized_query": query,
+            "link": item.get("link"),  # 출처 링크 포함
+            **item
+        },
+    )
+
+
+# 차트 JSON에 섞여 나오는 JavaScript 코드 정리용 정규식 (차트마다 재파싱하지 않도록 모듈 로드 시 컴파일)
+_CALLBACKS_RE = re.compile(r'"callbacks"\s*:\s*\{')
+_FUNC_BLOCK_RE = re.compile(r'function\s*\([^)]*\)\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+_KV_FUNC_RE = re.compile(r':\s*function\s*\([^)]*\)\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', re.DOTALL)
+_NULL_TRAILING_CODE_RE = re.compile(r'null\s+[^,}\]]*(?:if|let|var|return|context)[^,}\]]*', re.DOTALL)
+_NULL_MULTILINE_BODY_RE = re.compile(r'null\s*\n\s*if\s*\([^)]*\)\s*\{[^}]*\}\s*return[^;}]*;?\s*\}?', re.DOTALL)
+_IF_BLOCK_RE = re.compile(r'if\s*\([^)]*\)\s*\{[^}]*\}', re.DOTALL)
+_RETURN_RE = re.compile(r'return\s+[^;}]*;?', re.DOTALL)
+_LET_VAR_RE = re.compile(r'(?:let|var)\s+\w+\s*=\s*[^;]*;', re.DOTALL)
+_NULL_BETWEEN_COMMAS_RE = re.compile(r',\s*null\s*,')
+_NULL_BEFORE_CLOSE_RE = re.compile(r',\s*null\s*}')
+_NULL_AFTER_OPEN_RE = re.compile(r'{\s*null\s*,')
+_BLANK_LINES_RE = re.compile(r'\s*\n\s*\n\s*')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_BRACE_RE: "re.Pattern[str]" = re.compile(r'[{}]')
+
+
+def _replace_callbacks_object(text: str) -> str:
+    """callbacks 객체를 중첩 중괄호까지 포함해 찾아서 빈 객체로 교체합니다."""
+    match = _CALLBACKS_RE.search(text)
+    if not match:
+        return text
+
+    start_pos = match.start()
+
+    # 중괄호 균형 맞추기 (중괄호 위치만 정규식으로 건너뛰며 확인)
+    brace_count = 1
+    for brace in _BRACE_RE.finditer(text, match.end()):
+        if brace.group() == '{':
+            brace_count += 1
+        else:
+            brace_count -= 1
+            if brace_count == 0:
+                return text[:start_pos] + '"callbacks": {}' + text[brace.end():]
+    return text
+
+
+# 첫 파싱과 재시도가 같은 JSON 구간을 정리하는 경우가 많으므로 결과를 입력 문자열 기준으로 캐시
+@lru_cache(maxsize=64)
+def _clean_js_functions(json_str: str) -> str:
+    """차트 JSON에서 JavaScript 함수 코드를 제거합니다."""
+    # 1. 가장 안전한 방법: callbacks 객체 전체를 빈 객체로 교체
+    json_str = _replace_callbacks_object(json_str)
+
+    # 2. function(...) { ... } 패턴과 키-값의 function 값을 null로 교체
+    json_str = _FUNC_BLOCK_RE.sub('null', json_str)
+    json_str = _KV_FUNC_RE.sub(': null', json_str)
+
+    # 3. null 뒤에 남은 잘못된 코드 패턴 및 여러 줄 함수 본문 정리
+    json_str = _NULL_TRAILING_CODE_RE.sub('null', json_str)
+    json_str = _NULL_MULTILINE_BODY_RE.sub('null', json_str)
+
+    # 4. 남은 JavaScript 코드 조각들 제거
+    json_str = _IF_BLOCK_RE.sub('', json_str)
+    json_str = _RETURN_RE.sub('', json_str)
+    json_str = _LET_VAR_RE.sub('', json_str)
+
+    # 5. null 값 정리
+    json_str = _NULL_BETWEEN_COMMAS_RE.sub(',', json_str)
+    json_str = _NULL_BEFORE_CLOSE_RE.sub('}', json_str)
+    json_str = _NULL_AFTER_OPEN_RE.sub('{', json_str)
+
+    # 6. 빈 줄 및 객체/배열 trailing comma 정리
+    json_str = _BLANK_LINES_RE.sub('\n', json_str)
+    json_str = _TRAILING_COMMA_RE.sub(r'\1', json_str)
+
+    return json_str
+
+
+_JSON_DECODER: json.JSONDecoder = json.JSONDecoder()
+
+
+def _balanced_json_span(text: str, start: int) -> Tuple[Optional[str], Any]:
+    """start 위치의 '{'부터 짝이 맞는 '}'까지 잘라 (문자열, 파싱 결과)로 반환합니다.
+
+    유효한 JSON이면 raw_decode(C 스캐너) 한 번으로 끝 위치와 파싱 결과를 함께 얻고,
+    JavaScript 함수 등이 섞여 파싱이 안 되는 경우에만 문자열 리터럴을 고려한 중괄호 스캔으로 구간만 찾습니다.
+    """
+    try:
+        obj, end = _JSON_DECODER.raw_decode(text, start)
+    except ValueError:
+        return find_json_object(text, start), None
+    span = text[start:end]
+    return span, _strip_if_marked(span, obj)
+
+
+def _scan_chart_json(text: str, start: int = 0, window: Optional[int] = None, failed: Optional[set] = None) -> Tuple[Optional[str], Any]:
+    """응답의 start 위치부터 파싱 가능한 첫 최상위 JSON 객체를 찾아 (문자열, 파싱 결과)로 반환합니다.
+
+    앞쪽 설명문의 '{...}'처럼 파싱되지 않는 구간은 통째로 건너뛰고 다음 최상위 '{'에서 다시 시도하므로
+    내부의 작은 객체를 차트로 오인하지 않습니다. window가 주어지면 start + window 이후에 시작하는 후보는 보지 않고,
+    failed에 들어 있는 구간(앞 단계에서 이미 실패한 구간)은 다시 파싱하지 않습니다.
+    """
+    last_error: Optional[Exception] = None
+    end = len(text) if window is None else min(len(text), start + window)
+    idx = text.find("{", start, end)
+    while idx != -1:
+        if failed:
+            # 이미 실패한 구간이 이 위치의 최상위 후보와 정확히 같을 때만 건너뜀
+            if any(text.startswith(f, idx) for f in failed):
+                candidate = find_json_object(text, idx)
+                if candidate is not None and candidate in failed:
+                    idx = text.find("{", idx + len(candidate), end)
+                    continue
+        span, parsed = _balanced_json_span(text, idx)
+        if span is None:
+            break
+        if parsed is not None:
+            return span, parsed
+        try:
+            return span, _loads_cleaned_chart(span)
+        except json.JSONDecodeError as e:
+            last_error = e
+        idx = text.find("{", idx + len(span), end)
+    if last_error is not None:
+        raise last_error
+    return None, None
+
+
+def _greedy_chart_json(text: str, start: int = 0, max_chars: Optional[int] = None, failed: Optional[set] = None) -> Tuple[Optional[str], Any]:
+    """start 이후 첫 '{'부터 마지막 '}'까지를 한 번에 잘라 파싱합니다. 실패하면 (None, None)을 반환합니다.
+
+    대부분의 응답은 최상위 객체가 마지막 '}'에서 끝나므로 중괄호 균형 스캔 없이 str.find/rfind만으로 구간을 찾습니다.
+    failed에 이미 실패한 구간이면 건너뛰고, 이번에 실패한 구간은 failed에 추가해 다음 단계가 반복하지 않게 합니다.
+    """
+    first = text.find("{", start)
+    if first == -1:
+        return None, None
+    last = text.rfind("}", first)
+    if last == -1 or (max_chars is not None and last - first >= max_chars):
+        return None, None
+    span = text[first:last + 1]
+    if failed is not None and span in failed:
+        return None, None
+    try:
+        return span, _strip_if_marked(span, orjson.loads(span))
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        return span, _loads_cleaned_chart(span)
+    except json.JSONDecodeError:
+        if failed is not None:
+            failed.add(span)
+        return None, None
+
+
+def _extract_chart_json(text: str) -> Tuple[Optional[str], Any]:
+    """차트 생성 LLM 응답에서 JSON 구간을 추출합니다. 바로 파싱되면 결과도 함께 반환합니다."""
+    # 1. ```json 블록에서 추출 (대부분 유효한 JSON이므로 먼저 바로 파싱 시도)
+    if "```json" in text:
+        start = text.find("```json") + 7
+        end = text.find("```", start)
+        if end != -1:
+            json_part = text[start:end].strip()
+            try:
+                return json_part, _strip_if_marked(json_part, orjson.loads(json_part))
+            except orjson.JSONDecodeError:
+                return json_part, None
+
+    # 2. JSON: 다음에서 추출
+    if "JSON:" in text:
+        json_start = text.find("{", text.find("JSON:") + 5)
+        if json_start == -1:
+            return None, None
+        json_part, parsed = _balanced_json_span(text, json_start)
+        if json_part:
+            return json_part, parsed
+
+    # 3. 첫 번째 { }블록 추출
+    json_start = text.find("{")
+    if json_start == -1:
+        return None, None
+    return _balanced_json_span(text, json_start)
+
+
+# 프론트엔드에서 실행할 수 없는 Chart.js 콜백 키
+_CALLBACK_KEYS: FrozenSet[str] = frozenset(('callback', 'callbacks', 'generateLabels'))
+# 파싱한 JSON 문자열에 이 중 하나도 없으면 콜백 제거 순회를 생략 ('callback'은 'callbacks'도 포함)
+_CALLBACK_PROBES: Tuple[str, ...] = ('callback', 'generateLabels', 'function')
+# 정상 차트 응답에 반드시 있어야 하는 최상위 키
+_CHART_REQUIRED_KEYS: FrozenSet[str] = frozenset(('type', 'data'))
+
+
+def _strip_chart_callbacks(obj: Any) -> None:
+    """차트 JSON에서 콜백 키와 함수 문자열 값을 제자리에서 제거합니다 (재귀 없이 스택으로 순회).
+
+    JSON 파서가 만든 값은 정확히 dict/list/str 타입이므로 isinstance 대신 type() 비교 한 번으로 분기합니다.
+    """
+    stack: "deque[Any]" = deque((obj,))
+    pop, push = stack.pop, stack.append
+    callback_keys = _CALLBACK_KEYS
+    while stack:
+        node = pop()
+        node_type = type(node)
+        if node_type is dict:
+            drop: Optional[List[str]] = None
+            for key, value in node.items():
+                value_type = type(value)
+                if key in callback_keys or (value_type is str and 'function' in value):
+                    if drop is None:
+                        drop = []
+                    drop.append(key)
+                elif value_type is dict or value_type is list:
+                    push(value)
+            if drop:
+                for key in drop:
+                    del node[key]
+        elif node_type is list:
+            for item in node:
+                item_type = type(item)
+                if item_type is dict or item_type is list:
+                    push(item)
+
+
+def _chart_object_hook(obj: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON 파싱 중 만들어지는 dict마다 콜백 키와 함수 문자열 값을 바로 제거합니다."""
+    callback_keys = _CALLBACK_KEYS
+    drop = [key for key, value in obj.items() if key in callback_keys or (type(value) is str and 'function' in value)]
+    for key in drop:
+        del obj[key]
+    return obj
+
+
+# JavaScript 정리가 필요했던 응답용 디코더 (파싱과 콜백 제거를 한 번의 순회로 처리)
+_STRIPPING_DECODER: json.JSONDecoder = json.JSONDecoder(object_hook=_chart_object_hook)
+
+
+def _strip_if_marked(span: str, parsed: Any) -> Any:
+    """파싱 전 문자열에 콜백 흔적이 있을 때만 파싱 결과에서 콜백을 제거해 반환합니다."""
+    if any(probe in span for probe in _CALLBACK_PROBES):
+        _strip_chart_callbacks(parsed)
+    return parsed
+
+
+def _loads_cleaned_chart(span: str) -> Any:
+    """JavaScript 코드를 정리한 뒤 콜백을 제거하며 파싱합니다. 실패 시 json.JSONDecodeError."""
+    return _STRIPPING_DECODER.decode(_clean_js_functions(span))
+
+
+def _finalize_chart_response(chart_response: Dict[str, Any], tag: str) -> Dict[str, Any]:
+    """파싱된 정상 차트 JSON을 검증한 뒤 반환합니다. 콜백은 파싱 단계에서 이미 제거되어 있습니다."""
+    # 필수 필드 검증 (기본값 dict/list를 매번 만들지 않도록 직접 조회)
+    try:
+        datasets = chart_response["data"]["datasets"]
+    except (KeyError, TypeError):
+        datasets = ()
+    if datasets:
+        try:
+            point_count = len(datasets[0]["data"])
+        except (KeyError, IndexError, TypeError):
+            point_count = 0
+        if point_count < 2:
+            logger.warning("  - 경고: 차트 데이터 포인트가 부족함 (%s개)", point_count)
+
+    logger.info("  - 차트 생성 성공: %s 타입, %s개 데이터셋 (%s)", chart_response['type'], len(datasets), tag)
+    return chart_response
+
+
+# 파싱 실패 시 보내는 fallback 차트 (섹션 제목만 채워 넣음)
+_FALLBACK_CHART_TEMPLATE: Dict[str, Any] = {
+    "type": "bar",
+    "data": {
+        "labels": [None],
+        "datasets": [{
+            "label": "정보 수집 상태",
+            "data": [1],
+            "backgroundColor": "rgba(255, 193, 7, 0.6)",
+            "borderColor": "rgba(255, 193, 7, 1)",
+            "borderWidth": 1
+        }]
+    },
+    "options": {
+        "responsive": True,
+        "plugins": {
+            "title": {
+                "display": True,
+                "text": None
+            }
+        },
+        "scales": {
+            "y": {
+                "beginAtZero": True,
+                "max": 2,
+                "ticks": {
+                    "stepSize": 1
+                }
+            }
+        }
+    }
+}
+
+# 차트 생성 중 예외 발생 시 보내는 오류 차트
+_ERROR_CHART_TEMPLATE: Dict[str, Any] = {
+    "type": "bar",
+    "data": {
+        "labels": ["시스템 오류"],
+        "datasets": [{
+            "label": "처리 상태",
+            "data": [0],
+            "backgroundColor": "rgba(220, 53, 69, 0.6)",
+            "borderColor": "rgba(220, 53, 69, 1)",
+            "borderWidth": 1
+        }]
+    },
+    "options": {
+        "responsive": True,
+        "plugins": {
+            "title": {
+                "display": True,
+                "text": "차트 생성 중 오류 발생"
+            }
+        }
+    }
+}
+
+
+def _fallback_chart(section_title: str) -> Dict[str, Any]:
+    """fallback 차트 템플릿을 복사해 섹션 제목을 채운 차트를 반환합니다."""
+    chart = copy.deepcopy(_FALLBACK_CHART_TEMPLATE)
+    chart["data"]["labels"][0] = f"{section_title} 관련 데이터"
+    chart["options"]["plugins"]["title"]["text"] = f"{section_title} - 데이터 분석 중"
+    return chart
+
+
+def _first_chart_item(chart_response: Any) -> Dict[str, Any]:
+    """리스트 형태의 응답이면 첫 번째 항목을 사용하고, dict가 아니면 ValueError를 발생시킵니다."""
+    if isinstance(chart_response, list) and chart_response:
+        logger.debug("  - JSON 파싱 성공: 리스트 형태 (%s개 항목), 첫 번째 항목 사용", len(chart_response))
+        chart_response = chart_response[0]
+    if not isinstance(chart_response, dict):
+        raise ValueError(f"올바르지 않은 JSON 형식: {type(chart_response)}")
+    return chart_response
+
+
+def _is_chart_payload(chart_response: Dict[str, Any]) -> bool:
+    """정상 차트(type/data 포함) 또는 데이터 부족 응답인지 확인합니다."""
+    return bool(chart_response.get('insufficient_data', False)) or chart_response.keys() >= _CHART_REQUIRED_KEYS
+
+
+def _parse_chart_part(json_part: str, chart_response: Any) -> Dict[str, Any]:
+    """1차 추출한 JSON 구간을 (필요하면 JavaScript 정리 후) 파싱해 차트 dict로 반환합니다. 실패 시 ValueError."""
+    if chart_response is None:
+        # JavaScript 함수 등이 섞인 경우에만 정리 후 파싱 (콜백 제거도 파싱 중에 함께 처리)
+        cleaned_json = _clean_js_functions(json_part)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  - JavaScript 함수 제거 후: %s...", cleaned_json[:300])
+        chart_response = _STRIPPING_DECODER.decode(cleaned_json)
+
+    chart_response = _first_chart_item(chart_response)
+    logger.debug("  - 차트 타입: %s", chart_response.get('type', 'unknown'))
+    logger.debug("  - insufficient_data 여부: %s", chart_response.get('insufficient_data', False))
+    if not _is_chart_payload(chart_response):
+        raise ValueError("올바르지 않은 JSON 형식")
+    return chart_response
+
+
+def _retry_chart_parse(response_text: str, json_part: Optional[str]) -> Optional[Dict[str, Any]]:
+    """응답 전체에서 정상 차트 JSON을 다시 찾습니다. 사용할 수 없으면 None을 반환합니다."""
+    logger.debug("  - JSON 파싱 재시도 중...")
+    try:
+        # 1차 추출 구간이 시작된 위치부터 후보 추출기를 순서대로 시도 (이미 실패한 구간은 다시 파싱하지 않음)
+        retry_start = max(0, response_text.find(json_part)) if json_part else 0
+        failed = {json_part} if json_part else set()
+        retry_json, chart_response = None, None
+        for extract in _RETRY_EXTRACTORS:
+            retry_json, chart_response = extract(response_text, retry_start, CHART_RETRY_SCAN_CHARS, failed)
+            if retry_json is not None:
+                break
+        if not retry_json:
+            return None
+        chart_response = _first_chart_item(chart_response)
+    except Exception as retry_e:
+        logger.warning("  - JSON 파싱 재시도도 실패: %s", retry_e)
+        return None
+
+    logger.debug("  - 재시도 JSON 파싱 성공! (%s자)", len(retry_json))
+    if chart_response.get('insufficient_data', False):
+        logger.debug("  - 부족한 데이터 정보: %s", chart_response.get('missing_info', 'N/A'))
+        logger.debug("  - 제안된 검색어: %s", chart_response.get('suggested_search_query', 'N/A'))
+        return None
+    if not chart_response.keys() >= _CHART_REQUIRED_KEYS:
+        logger.warning("  - 재시도 성공했지만 올바르지 않은 JSON 형식")
+        return None
+    return chart_response
+
+
+# 재시도 시 순서대로 시도하는 후보 추출기: 마지막 '}'까지 통째로 → 최상위 블록 탐색
+_RETRY_EXTRACTORS = (_greedy_chart_json, _scan_chart_json)
+
+
+def _copy_chart_interned(obj: Any) -> Any:
+    """차트 JSON을 깊은 복사하면서 dict 키를 sys.intern으로 바꿔 캐시된 차트끼리 키 문자열을 공유합니다."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {
+            (sys.intern(key) if type(key) is str else key): _copy_chart_interned(value)
+            for key, value in obj.items()
+        }
+    if obj_type is list:
+        return [_copy_chart_interned(item) for item in obj]
+    # str/int/float/bool/None은 불변이므로 그대로 공유
+    return obj
+
+
+def _wrap_chart(chart: Dict[str, Any]) -> Dict[str, Any]:
+    """차트 데이터를 _create_charts가 내보내는 이벤트 형태로 감쌉니다."""
+    return {"type": "chart", "data": chart}
+
+
+# 섹션 요약 프롬프트의 참고 데이터 토큰 예산
+SECTION_CONTEXT_TOKEN_BUDGET = 6000
+
+# 한국어 기준 대략적인 문자/토큰 비율 (토크나이저 로드 없이 예산 계산)
+_CHARS_PER_TOKEN = 1.6
+
+
+def _estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 문자 수로 추정합니다."""
+    return int(len(text) / _CHARS_PER_TOKEN)
+
+
+@dataclass(slots=True)
+class NormalizedResult:
+    """섹션 요약 프롬프트용으로 출처 정보를 미리 정리해 둔 검색 결과"""
+    title: str
+    content: str
+    source_info: str
+    source_link: str
+    kind: Literal["web", "vdb", "other"]
+
+
+_MISSING = object()
+
+
+def _normalize_result(res: Any) -> NormalizedResult:
+    """검색 결과의 출처 유형을 한 번만 판별하여 NormalizedResult로 변환합니다."""
+    source = getattr(res, 'source', _MISSING)
+    title = getattr(res, 'title', _MISSING)
+    source_url = getattr(res, 'source_url', _MISSING)
+
+    # Web search 결과인 경우
+    if source is not _MISSING and 'web_search' in str(source).lower():
+        url = getattr(res, 'url', None)
+        metadata = getattr(res, 'metadata', None)
+        if url:
+            source_link, source_info = url, f"웹 출처: {url}"
+        elif metadata and 'link' in metadata:
+            source_link, source_info = metadata['link'], f"웹 출처: {metadata['link']}"
+        else:
+            source_link, source_info = "웹 검색", "웹 검색 결과"
+        kind = "web"
+    # Vector DB 결과인 경우
+    elif source_url is not _MISSING:
+        source_link, source_info = source_url, f"문서 출처: {source_url}"
+        kind = "vdb"
+    elif title is not _MISSING:
+        source_link, source_info = title, f"문서: {title}"
+        kind = "vdb"
+    else:
+        source_name = source if source is not _MISSING else 'Vector DB'
+        source_link, source_info = source_name, f"출처: {source_name}"
+        kind = "other"
+
+    return NormalizedResult(
+        title=title if title is not _MISSING else "",
+        content=getattr(res, 'content', ""),
+        source_info=source_info,
+        source_link=source_link,
+        kind=kind,
+    )
+
+
+# 차트 섹션 데이터 충분성 검사용 정규식 (수치 데이터 패턴을 하나의 alternation으로 컴파일)
+_NUMERIC_PATTERNS = [
+    r'\d+%',                    # 퍼센트
+    r'\d+\.\d+%',               # 소수점 퍼센트
+    r'\d+억원?',                 # 억원
+    r'\d+조원?',                 # 조원
+    r'\d+만원?',                 # 만원
+    r'\d+천톤',                  # 천톤
+    r'\d+톤',                   # 톤
+    r'\d+,\d+',                 # 천의 자리 콤마
+    r'\d+\s*원/\s*\d+\s*개?',     # 단가 (원/개, 원/20개 등)
+    r'단위:\s*원/\d+개?',          # "단위: 원/20개" 형태
+    r'\d+\s+\d+\s+\d+\s+\d+',     # 연속된 숫자들 (테이블 데이터)
+    r'\d{4}년\s+\d+',           # "2025년 38660" 같은 연도+숫자
+    r'\d+월\s+\d+',             # "7월 14324" 같은 월+숫자
+    r'증가율.*?\d+',             # 증가율 + 숫자
+    r'감소율.*?\d+',             # 감소율 + 숫자
+    r'점유율.*?\d+',             # 점유율 + 숫자
+    r'\d+\s+\d+\s+\d+',         # 표 형태의 연속 숫자
+    r'평년\s+\d+',              # "평년 25686" 같은 기준값
+]
+_NUMERIC_RE = re.compile('|'.join(f'(?:{p})' for p in _NUMERIC_PATTERNS))
+_TABLE_RE = re.compile(r'단위:|구분')
 
 # 추가: 페르소나 프롬프트 로드
 PERSONA_PROMPTS = {}
@@ -51,6 +710,575 @@ except Exception as e:
     print(f"ProcessorAgent: 페르소나 프롬프트 로드 실패 - {e}")
 
 
+# 섹션 생성 프롬프트 (정적 지침 → system, 호출별 변수 → user)
+# 정적 부분을 프롬프트 맨 앞에 고정해 두면 제공자 측 prefix 캐시가 섹션 간에 재사용됨
+DEFAULT_REPORT_PROMPT = "당신은 전문적인 AI 분석가입니다."
+DEFAULT_CHART_PROMPT = "주어진 데이터를 바탕으로 가장 명확하고 유용한 Chart.js 차트를 생성해주세요."
+
+SECTION_SYNTHESIS_SYSTEM_TEMPLATE = """{persona_instruction}
+
+당신은 위의 페르소나 지침을 따르는 전문가 AI입니다. 전체 보고서의 일부인 한 섹션을 작성하는 임무를 받았습니다.
+섹션 정보와 참고 데이터는 사용자 메시지로 전달됩니다.
+
+**작성 지침 (매우 중요)**:
+1. **역할 준수**: 아래 '전체 보고서 구조'와 '핵심 목표'를 반드시 인지하고, '현재 작성할 섹션'에 해당하는 내용만 깊이 있게 작성하세요.
+2. **페르소나 역할 유지**: 당신의 역할과 말투, 분석 관점을 반드시 유지하며 작성하세요.
+3. **간결성 유지**: 반드시 1~2 문단 이내로, 가장 핵심적인 내용만 간결하게 요약하여 작성하세요.
+4. **제목 반복 금지**: 주어진 섹션 제목을 절대 반복해서 출력하지 마세요. 바로 본문 내용으로 시작해야 합니다.
+5. **데이터 기반**: 참고 데이터에 있는 구체적인 수치, 사실, 인용구를 적극적으로 활용하여 내용을 구성하세요.
+6. **전문가적 문체**: 명확하고 간결하며 논리적인 전문가의 톤으로 글을 작성하세요.
+7. **⭐ 노션 스타일 마크다운 적극 활용 (매우 중요) - 반드시 지켜야 함**:
+
+**기본 포맷팅 (필수)**:
+- **핵심 키워드나 중요한 수치**: 반드시 **굵은 글씨**로 강조 (예: **58,000원/10kg**, **전년 대비 81.4% 하락**)
+- *변화나 추세*: 반드시 *기울임체*로 표현 (예: *전년 대비 감소*, *집중호우로 인한 피해*)
+- 문단별로 **반드시 2-3개 이상의 강조** 포함할 것
+
+**구조화 (필수)**:
+- **중요한 인사이트나 결론**: 반드시 `> **핵심 요약**: 내용` 형태로 블록쿼트 사용
+- **비교 정보가 3개 이상**: 반드시 마크다운 테이블 사용
+- **목록 형태 정보**: 반드시 `-` 불릿 포인트 사용
+- **세부 카테고리가 있으면**: 반드시 `### 소제목` 사용
+
+**필수 예시 패턴**:
+```
+**배(Pear)**의 전체 재배면적은 **9,361ha**로 전년 대비 **0.6% 감소**했으며, *집중호우 피해 지역*으로 분류되는 강원 및 호남 지역에서의 변동이 두드러졌습니다. [SOURCE:2, 3]
+
+| 식재료 | 주요 생산지 | 재배면적 변화 | 주요 원인 |
+| :--- | :--- | :--- | :--- |
+| **배** | 전국 | **-0.6%** (전년 대비) | *전국적 재배면적 감소 추세* [SOURCE:2] |
+| **포도** | 전국 | **-2.3% ~ -6.7%** | *작형별 면적 감소* [SOURCE:4] |
+
+> **핵심 결론**: 집중호우 직접 피해는 *미미한 수준*이었으나, 고온 및 가뭄이 **과비대 지연** 등 품질에 미치는 영향이 더 컸습니다.
+```
+
+**⚠️ 강제 요구사항**: 모든 문단에서 **굵은 글씨** 2개 이상, *기울임체* 1개 이상 반드시 사용
+
+**표 작성 지침**:
+- 3개 이상의 항목을 비교하거나 분류할 때 테이블 사용
+- 테이블 형식: `| 항목 | 내용 | 비고 |` 및 `| :--- | :--- | :--- |` 구분선
+- 테이블 셀 안에서도 **굵은 글씨**, *기울임체*, [SOURCE:숫자] 출처 표기 가능
+- 예시:
+```
+| 주요 식재료 | 주요 생산지 | 현황 요약 |
+| :--- | :--- | :--- |
+| **토마토** | 호남 지역 | 집중호우로 **수해 발생** [SOURCE:2] |
+| **배** | 충남, 전남 | 피해는 **미미한 수준** [SOURCE:1] |
+```
+8. **⭐ 출처 표기 (데이터 인덱스 번호 사용)**: 특정 정보를 참고하여 작성한 문장 바로 뒤에 [SOURCE:숫자] 형식으로 출처를 표기하세요.
+
+**🔴 매우 중요 - SOURCE 번호 사용 규칙**:
+- **반드시 아래 "참고 데이터"에 명시된 "[데이터 인덱스 X]" 의 X 번호만 사용하세요**
+- 예: "데이터 0", "데이터 3", "데이터 7"이 주어졌다면 → [SOURCE:0], [SOURCE:3], [SOURCE:7]만 사용 가능
+- **존재하지 않는 번호는 절대 사용하지 마세요** (예: 데이터 0~7만 있는데 [SOURCE:15] 사용 금지)
+- 반드시 숫자만 사용하고 "데이터", "문서" 등의 단어는 사용하지 마세요
+- 여러 출처는 쉼표와 공백으로 구분: [SOURCE:1, 4, 8]
+- 단일 출처: [SOURCE:8]
+- SOURCE 태그는 완전한 문장이 끝난 후 바로 붙여서 작성하세요
+- SOURCE 태그 앞뒤로 줄바꿈하지 마세요 (스트리밍 청크 분할 방지)
+
+**올바른 예시** (데이터 0, 3, 8이 주어진 경우):
+- "**매출이 증가했습니다** [SOURCE:8]"
+- "시장 점유율이 상승했습니다 [SOURCE:3]"
+- "**매출이 5% 감소했습니다** [SOURCE:0, 3, 8]"
+
+**🚫 절대 금지되는 잘못된 예시**:
+- [SOURCE:데이터 1], [SOURCE:문서 1] (단어 포함 금지)
+- [SOURCE:1,\n4, 8] (줄바꿈 금지)
+- [SOURCE: 1 , 4 , 8] (불필요한 공백 금지)
+- [SOURCE:15] (참고 데이터에 없는 번호 사용 금지)
+
+**⚠️ 최종 체크리스트 (반드시 확인)**:
+□ **굵은 글씨**가 문단당 2개 이상 사용되었는가?
+□ *기울임체*가 적절히 사용되었는가?
+□ 3개 이상 비교 시 테이블을 사용했는가?
+□ 중요한 결론에 `> **핵심 요약**:` 블록쿼트를 사용했는가?
+□ [SOURCE:숫자] 형식으로 출처를 정확히 표기했는가?
+□ 단락 간 공백 라인이 있는가?
+
+**🚫 절대 금지 사항**:
+❌ "추가 정보 요청", "더 많은 데이터가 필요합니다", "구체적인 데이터 부족" 등의 표현 사용 금지
+❌ "...에 대한 추가 분석이 필요합니다" 같은 미완성 결론 제시 금지
+✅ **현재 확보된 데이터로 최대한 구체적이고 완전한 분석 및 결론 제시 필수**
+✅ 부족한 정보가 있어도 현재 데이터 기반으로 최선의 인사이트와 표 제공
+
+**⭐ 반드시 위 체크리스트를 모두 만족하는 마크다운 형식으로 섹션을 작성하세요.**
+"""
+
+SECTION_CHART_SYSTEM_TEMPLATE = """{persona_instruction}
+
+당신은 데이터 분석가이자 보고서 작성가입니다. 위의 페르소나 지침을 따라서, 주어진 데이터를 분석하여 텍스트 설명과 시각적 차트를 결합한 전문가 수준의 보고서 섹션을 작성합니다.
+섹션 정보와 참고 데이터는 사용자 메시지로 전달됩니다.
+
+**작성 지침 (매우 중요)**:
+1. **역할 준수**: 아래 '전체 보고서 구조'와 '핵심 목표'를 반드시 인지하고, '현재 작성할 섹션'에 해당하는 내용만 깊이 있게 작성하세요.
+2. **페르소나 역할 유지**: 당신의 역할과 말투, 분석 관점을 반드시 유지하며 작성하세요.
+3. **간결성 유지**: 반드시 1~2 문단 이내로, 데이터에서 가장 중요한 인사이트와 분석 내용만 간결하게 요약하여 작성하세요.
+4. **제목 반복 금지**: 주어진 섹션 제목을 절대 반복해서 출력하지 마세요. 바로 본문 내용으로 시작해야 합니다.
+5. **데이터 기반**: 설명에 구체적인 수치, 사실, 통계 자료를 적극적으로 인용하여 신뢰도를 높이세요.
+6. **차트 마커 삽입**: 텍스트 설명의 흐름 상, 시각적 데이터가 필요한 적절한 위치에 [GENERATE_CHART] 마커를 한 줄에 단독으로 삽입하세요.
+7. **서술 계속**: 마커를 삽입한 후, 이어서 나머지 텍스트 설명을 자연스럽게 계속 작성하세요.
+8. **노션 스타일 마크다운 적극 활용**: 굵은 글씨, 기울임체, 인용문, 목록, 테이블 등을 적절히 사용하세요.
+- **인용문(>) 사용 시점**:
+ - **핵심 인사이트나 결론**: 섹션의 가장 중요한 발견사항이나 결론
+ - **주요 통계나 수치**: 특별히 강조해야 할 중요한 데이터
+ - **전문가 의견이나 분석**: 페르소나 관점에서의 핵심 판단이나 견해
+ - **경고나 주의사항**: 독자가 반드시 알아야 할 중요한 정보
+ - **해당 섹션에 대한 요약** : 해당 섹션에 대한 요약이 필요할 때 사용
+ - **인용문 사용 예시**:
+  - > 2024년 4분기 시장 규모가 전년 동기 대비 15% 급감하여 즉각적인 대응이 필요합니다.
+  - > 데이터 분석 결과, A 전략이 B 전략 대비 ROI가 3배 높은 것으로 확인되었습니다.
+- **표 형태 데이터**: 비교나 분류가 필요한 정보는 마크다운 테이블로 구성
+- 3개 이상의 항목을 비교하거나 분류할 때 테이블 사용 권장
+- 테이블 셀 안에서도 **굵은 글씨**, *기울임체*, [SOURCE:숫자] 출처 표기 가능
+9. **출처 표기 (데이터 인덱스 번호 사용)**: 특정 정보를 참고하여 작성한 문장 바로 뒤에 [SOURCE:숫자1, 숫자2, 숫자3] 형식으로 출처를 표기하세요.
+
+
+**매우 중요 - SOURCE 번호 사용 규칙**:
+- **반드시 아래 "참고 데이터"에 명시된 "[데이터 인덱스 X]" 의 X 번호만 사용하세요**
+- 예: "데이터 0", "데이터 3", "데이터 7"이 주어졌다면 → [SOURCE:0], [SOURCE:3], [SOURCE:7]만 사용 가능
+- **존재하지 않는 번호는 절대 사용하지 마세요** (예: 데이터 0~7만 있는데 [SOURCE:15] 사용 금지)
+- 반드시 숫자만 사용하고 "데이터", "문서" 등의 단어는 사용하지 마세요
+
+**올바른 예시** (데이터 0, 3, 8이 주어진 경우):
+- "**시장 규모가 10% 증가**했습니다. [SOURCE:8]"
+- "**매출이 5% 감소**했습니다. [SOURCE:0, 3, 8]"
+
+**절대 금지되는 잘못된 예시**:
+- [SOURCE:데이터 8], [SOURCE:문서 8] (단어 포함 금지)
+- [SOURCE:15] (참고 데이터에 없는 번호 사용 금지)
+
+**절대 금지 사항**:
+"추가 정보 요청", "더 많은 데이터가 필요합니다", "구체적인 데이터 부족" 등의 표현 사용 금지
+"...에 대한 추가 분석이 필요합니다" 같은 미완성 결론 제시 금지
+"데이터가 제한적입니다", "정확한 목록 작성을 위해서는..." 등의 한계 언급 금지
+**현재 확보된 데이터로 최대한 구체적이고 완전한 분석 및 결론 제시 필수**
+부족한 정보가 있어도 현재 데이터 기반으로 최선의 인사이트와 표 제공
+표 요청이 있으면 현재 데이터로 가능한 한 완전한 표 작성
+"""
+
+# 보고서 내 모든 섹션에 공통인 전체 구조 블록 (system 프롬프트 끝에 붙여 prefix 캐시 범위에 포함)
+SECTION_AWARENESS_TEMPLATE = """
+---
+**[매우 중요] 전체 보고서 구조**:
+당신은 아래 구조로 구성된 전체 보고서에서 하나의 섹션만을 책임지고 있습니다.
+다른 전문가들이 나머지 섹션들을 동시에 작성하고 있으므로, **다른 섹션의 주제를 절대 침범하지 말고 당신의 역할에만 집중하세요.**
+
+{awareness_context}
+---
+"""
+
+SECTION_USER_TEMPLATE = """**사용자의 전체 질문**: "{original_query}"
+
+**[매우 중요] 당신의 역할**: 위 전체 보고서 구조 중 **오직 '{section_title}' 섹션만**을 작성하세요.
+
+**현재 작성할 섹션 제목**: "{section_title}"
+**이 섹션의 핵심 목표**: "{description}"
+
+**참고 데이터 (실제 인덱스 번호 포함)**:
+{section_data_content}
+
+**보고서 섹션 내용**:
+"""
+
+SECTION_SUMMARY_SYSTEM_PROMPT = """당신은 여러 데이터 소스를 종합하여 특정 주제에 대한 분석 보고서의 한 섹션을 저술하는 주제 전문가입니다.
+작성할 섹션의 주제와 참고 데이터는 사용자 메시지로 전달됩니다.
+
+**작성 지침**:
+1. **핵심 정보 추출**: 섹션 주제와 직접적으로 관련된 핵심 사실, 수치, 통계 위주로 정보를 추출하세요.
+2. **간결한 요약**: 정보를 단순히 나열하지 말고, 1~2 문단 이내의 간결하고 논리적인 핵심 요약문으로 재구성해주세요.
+3. **중복 제거**: 여러 문서에 걸쳐 반복되는 내용은 하나로 통합하여 제거하세요.
+4. **객관성 유지**: 데이터에 기반하여 객관적인 사실만을 전달해주세요.
+5. **⭐ 출처 정보 보존**: 중요한 정보나 수치를 언급할 때 해당 정보의 출처를 [SOURCE:숫자] 형식으로 표기하세요. 반드시 숫자만 사용하세요.
+- **문서 ID 번호를 사용**
+- 예시: "시장 규모가 증가했습니다 [SOURCE:1]", "매출이 상승했습니다 [SOURCE:2]"
+- 잘못된 예시: [SOURCE:데이터 1], [SOURCE:문서 1] (이런 형식 사용 금지)
+6. **⭐ 노션 스타일 마크다운 적극 활용**:
+- **중요한 키워드나 수치**: **굵은 글씨**로 강조
+- *일반적인 강조나 트렌드*: *기울임체*로 표현
+- **핵심 포인트나 결론**: > 인용문 형태로 강조
+- **항목이 여러 개**: - 첫 번째 항목, - 두 번째 항목 형태
+- **하위 분류**:   - 세부 항목 (들여쓰기)
+- **단락 구분**: 내용 변화 시 공백 라인으로 명확히 구분
+"""
+
+SECTION_SUMMARY_USER_TEMPLATE = """**작성할 섹션의 주제**: "{section_title}"
+
+**참고할 선택된 데이터** (섹션별로 엄선된 관련 데이터):
+{context}
+
+**결과물 (핵심 요약본)**:
+"""
+
+# 차트 생성 프롬프트 (호출마다 대형 f-string 리터럴을 새로 만들지 않도록 모듈 상수로 분리)
+CHART_GENERATION_PROMPT_TEMPLATE = """당신은 데이터의 **관련성**을 판단하고 **의미 있는 시각화**를 만드는 데이터 시각화 전문가입니다.
+
+---
+
+**[PART 1: 입력 정보]**
+당신이 분석해야 할 정보는 다음과 같습니다.
+
+1.  **생성 목표:** '{section_title}'에 대한 차트 생성
+1.1. **섹션 목표:** '{description}'
+2.  **현재 날짜:** {current_date_str}
+3.  **페르소나:** '{persona_name}' (시도: {attempt}회차)
+4.  **참고 컨텍스트:**
+    - 이전에 생성된 텍스트: {context_info}
+    - 이전에 생성된 차트: (중복 방지용)
+5.  **분석할 원본 데이터:**
+{data_summary}
+
+---
+
+**[PART 2: 수행할 명령]**
+이제, 다음 3단계 사고 프로세스에 따라 명령을 **반드시 순서대로** 수행하세요.
+
+**STEP 1: 상세 데이터 분석 및 차트 아이디어 구상**
+- `[PART 1]`의 정보를 바탕으로 시각화할 데이터(항목, 수치, 라벨)를 최대한 추출하고, 만들 수 있는 차트의 주제를 구체화합니다.
+- 이 과정은 아래 **`분석 템플릿`**을 채우는 방식으로 진행합니다.
+
+**STEP 2: 주제 일관성 검증**
+- **질문:** "STEP 1에서 구상한 차트 주제가 `[PART 1]`의 **생성 목표**인 '{section_title}'및 **섹션 목표**인 '{description}'과 직접적으로 관련이 있습니까?"
+- 이 질문에 대해 **"답변 (Yes/No)"**과 **"근거"**를 명확히 결정합니다.
+
+**STEP 3: 조건부 JSON 출력**
+- **만약 STEP 2의 답변이 'No'라면:** **`PLACEHOLDER_JSON`**을 출력합니다.
+- **만약 STEP 2의 답변이 'Yes'라면:** **`실제 차트 JSON`**을 생성하여 출력합니다.
+
+---
+
+**[PART 3: 출력 형식 및 가이드]**
+최종 결과물은 아래 가이드에 따라 **'분석'**과 **'JSON'** 두 부분으로 구성되어야 합니다.
+
+**1. 분석 (Analysis Block):**
+- STEP 1과 STEP 2에서 당신이 생각한 과정을 아래 `분석 템플릿`에 맞춰 작성합니다.
+- Vector DB 데이터가 불분명할 수 있으니, 섹션 제목과 데이터 내용을 종합적으로 추론해야 합니다.
+
+분석:
+1. 상세 분석 및 아이디어 (STEP 1):
+    (1) 컨텍스트 추론:
+        - 섹션 제목 "{section_title}"과 **섹션 목표 "{description}"**을 보고 이 데이터가 무엇에 관한 통계인지 추론
+        - 단위 정보 (원/20개, 원/50개 등)를 보고 어떤 상품/품목인지 추론
+        - 출처 URL이나 문서명에서 추가 힌트 찾기
+        - 추론된 품목/상품: [예: 계란, 배추, 쌀 등]
+
+    (2) 섹션 목적: [이 섹션이 보여주려는 핵심 내용, **섹션 목표**를 기반으로 작성]
+
+    (3) 추출 가능한 수치 데이터:
+        - 항목A: [정확한 수치] + [추론된 의미] (출처: 데이터 인덱스 X)
+        - 항목B: [정확한 수치] + [추론된 의미] (출처: 데이터 인덱스 Y)
+        - 항목C: [정확한 수치] + [추론된 의미] (출처: 데이터 인덱스 Z)
+
+    (4) 추출된 라벨/카테고리: [실제 연도, 월, 지역명 등]
+
+    (5) 최적 차트 타입: [아래 지원 차트 타입에서만 선택]
+
+    (6) 차트 구성:
+        - X축: [추론된 품목명의 시간/지역/카테고리]
+        - Y축: [추론된 품목명의 가격/수량 + 단위]
+        - 데이터셋: [의미있는 라벨들과 해당 수치들]
+        - **범례 전략**: 여러 카테고리 비교시 각각을 별도 데이터셋으로 구성!
+
+2. 주제 일관성 검증 (STEP 2):
+    - 답변: [Yes 또는 No]
+    - 근거: [예: '미생물 발효 R&D'와 '호주 기업 설립 연도'는 전혀 다른 주제이므로 No. 섹션 목표는 R&D 동향 분석인데, 기업 설립 연도는 관련성이 낮음.]
+
+    **중요**: 관련성이 낮아도 데이터에서 숫자나 항목을 추출할 수 있다면 "부분적 Yes"로 처리하여 차트 생성 시도!
+
+
+**2. JSON (JSON Block):**
+- 위 '분석' 블록 바로 다음에, STEP 3의 규칙에 따라 아래 두 JSON 중 하나를 출력합니다.
+
+**[PLACEHOLDER_JSON]**
+```json
+{{
+    "type": "placeholder",
+    "labels": ["'{section_title}' 관련 데이터 부족"],
+    "datasets": [{{"label": "데이터 분석 불가", "data": [0], "backgroundColor": ["#FFB1C1"]}}],
+    "title": "관련 데이터 부족",
+    "palette": "modern",
+    "options": {{"responsive": true, "plugins": {{"title": {{"display": true, "text": "현재 섹션 주제와 일치하는 데이터가 부족하여 차트를 생성할 수 없습니다."}}}}}}
+}}
+```
+
+**[실제 차트 JSON 생성 가이드]**
+
+**중요: 지원되는 차트 타입만 사용하세요!**
+**기본 지원 차트 타입**:
+- line, bar, pie, doughnut, radar, polararea, scatter, bubble
+
+**확장 지원 차트 타입**:
+- area (Line 컴포넌트 + fill 옵션)
+- column (Bar 컴포넌트)
+- donut (Doughnut 컴포넌트)
+- polar (PolarArea 컴포넌트)
+- horizontalbar (Bar 컴포넌트)
+- stacked (Bar 컴포넌트 + stack 옵션)
+- mixed (Line 컴포넌트)
+- funnel (Bar 컴포넌트)
+- waterfall (Bar 컴포넌트)
+- gauge (Doughnut 컴포넌트)
+- timeseries (Line 컴포넌트)
+- timeline (Line 컴포넌트)
+- gantt (Bar 컴포넌트)
+- multiline (Line 컴포넌트)
+- groupedbar (Bar 컴포넌트)
+- stackedarea (Line 컴포넌트)
+- combo (Line 컴포넌트)
+- heatmap (Bar 컴포넌트)
+- treemap (Bar 컴포넌트)
+- sankey (Bar 컴포넌트)
+- candlestick (Line 컴포넌트)
+- violin (Bar 컴포넌트)
+- boxplot (Bar 컴포넌트)
+
+**지원하지 않는 타입들 (절대 사용 금지)**:
+- groupedbarchart (올바른 타입: groupedbar)
+- 기타 존재하지 않는 타입명들
+
+**선택 기준**:
+- 카테고리별 비교 → **bar**, **column**, **horizontalbar**
+- 그룹화된 비교 → **groupedbar**, **stacked**
+- 시간 변화 → **line**, **timeseries**, **timeline**, **area**
+- 비율/구성 → **pie**, **doughnut**, **donut**
+- 다차원 비교 → **radar**, **polar**
+- 관계 분석 → **scatter**, **bubble**
+- 복합 차트 → **mixed**, **combo**
+- 특수 목적 → **funnel**, **waterfall**, **gauge**, **heatmap**
+
+**올바른 색상 및 라벨링 규칙 - 범례 문제 해결**:
+
+**중요: 카테고리별 비교 시 반드시 다중 데이터셋 사용!**
+
+**잘못된 방법 (범례 1개만 나옴)**:
+```json
+{{
+    "type": "bar",
+    "data": {{
+        "labels": ["미국", "일본"],
+        "datasets": [{{
+            "label": "2023년 스낵 시장 규모",
+            "data": [71000, 11330],
+            "backgroundColor": ["#4F46E5", "#7C3AED"]
+        }}]
+    }}
+}}
+```
+
+**올바른 방법 (각 카테고리별 범례 표시)**:
+```json
+{{
+    "type": "bar",
+    "data": {{
+        "labels": ["시장 규모"],
+        "datasets": [
+            {{
+                "label": "미국",
+                "data": [71000],
+                "backgroundColor": "#4F46E5"
+            }},
+            {{
+                "label": "일본",
+                "data": [11330],
+                "backgroundColor": "#7C3AED"
+            }}
+        ]
+    }}
+}}
+```
+
+**데이터 구조 변환 규칙**:
+
+**지역/국가별 비교 → 각각을 별도 데이터셋으로**
+**시계열 비교 → 각 시점을 별도 데이터셋으로**
+**제품/카테고리 비교 → 각각을 별도 데이터셋으로**
+
+**다양한 비교 케이스별 올바른 구조**:
+
+**1. 지역별 비교**:
+```json
+{{
+    "type": "bar",
+    "data": {{
+        "labels": ["시장 규모"],
+        "datasets": [
+            {{"label": "미국", "data": [값1], "backgroundColor": "#4F46E5"}},
+            {{"label": "중국", "data": [값2], "backgroundColor": "#7C3AED"}},
+            {{"label": "일본", "data": [값3], "backgroundColor": "#EC4899"}}
+        ]
+    }}
+}}
+```
+
+**2. 연도별 비교**:
+```json
+{{
+    "type": "bar",
+    "data": {{
+        "labels": ["성장률"],
+        "datasets": [
+            {{"label": "2022년", "data": [값1], "backgroundColor": "#4F46E5"}},
+            {{"label": "2023년", "data": [값2], "backgroundColor": "#7C3AED"}},
+            {{"label": "2024년", "data": [값3], "backgroundColor": "#EC4899"}}
+        ]
+    }}
+}}
+```
+
+**3. 제품별 비교**:
+```json
+{{
+    "type": "bar",
+    "data": {{
+        "labels": ["매출"],
+        "datasets": [
+            {{"label": "제품A", "data": [값1], "backgroundColor": "#4F46E5"}},
+            {{"label": "제품B", "data": [값2], "backgroundColor": "#7C3AED"}},
+            {{"label": "제품C", "data": [값3], "backgroundColor": "#EC4899"}}
+        ]
+    }}
+}}
+```
+
+**4. 단일 항목의 시간 변화 (이 경우만 단일 데이터셋)**:
+```json
+{{
+    "type": "line",
+    "data": {{
+        "labels": ["2021", "2022", "2023", "2024"],
+        "datasets": [{{
+            "label": "성장 추세",
+            "data": [100, 120, 150, 180],
+            "borderColor": "#4F46E5",
+            "backgroundColor": "#4F46E520"
+        }}]
+    }}
+}}
+```
+
+**차트 타입별 데이터 구조 가이드**:
+
+**stacked 차트**:
+```json
+{{
+    "type": "stacked",
+    "data": {{
+        "labels": ["Q1", "Q2", "Q3"],
+        "datasets": [
+            {{"label": "제품A", "data": [10, 20, 30], "backgroundColor": "#4F46E5"}},
+            {{"label": "제품B", "data": [15, 25, 35], "backgroundColor": "#EC4899"}}
+        ]
+    }}
+}}
+```
+
+**timeseries/timeline 차트**:
+```json
+{{
+    "type": "timeseries",
+    "data": {{
+        "labels": ["2023-01", "2023-02", "2023-03"],
+        "datasets": [{{
+            "label": "월별 데이터",
+            "data": [100, 150, 200],
+            "borderColor": "#4F46E5",
+            "backgroundColor": "#4F46E520"
+        }}]
+    }}
+}}
+```
+
+**추천 색상 팔레트**:
+- 메인: ["#4F46E5", "#7C3AED", "#EC4899", "#EF4444", "#F59E0B"]
+- 보조: ["#06B6D4", "#10B981", "#84CC16", "#F97316", "#8B5CF6"]
+
+**차트 생성 우선 원칙 - PLACEHOLDER 금지!**:
+
+**1단계: 직접 수치 데이터 활용**
+- 문서에서 금액, 개수, 비율, 점수 등 구체적 숫자가 있으면 즉시 차트화
+- 예: "2023년 113억 3,070만 달러" → bar 차트로 연도별 수치
+
+**2단계: 카테고리/항목 개수 차트화**
+- 여러 항목이 나열되어 있으면 항목별 개수/빈도로 차트 생성
+- 예: "일본 스낵, 저염 스낵, 세이버리 비스킷, 팝콘, 프레첼" → 5개 항목 bar 차트
+
+**3단계: 지역/시간 정보 활용**
+- 지역명 언급 → 지역별 분포 차트
+- 연도/날짜 언급 → 시계열 차트
+- 예: "미국, 중국, 동남아" 언급 → 3개 지역 pie 차트
+
+**4단계: 추론 가능한 데이터 생성**
+- 시장 규모 언급 → 상대적 크기 비교 차트
+- 성장률 언급 → 증가 추세 라인 차트
+- 점유율 언급 → 파이 차트
+
+**5단계: 메타 정보 차트화**
+- 문서 개수, 언급 횟수, 키워드 빈도
+- 예: "3개 문서에서 언급" → 문서별 언급 횟수 차트
+
+**창조적 차트 생성 예시**:
+```
+- "일본, 미국, 동남아시아 시장" → {{"labels": ["일본", "미국", "동남아"], "data": [1, 1, 1]}}
+- "2019년 이후 연평균 3.5% 감소" → {{"labels": ["2019", "2020", "2021", "2022"], "data": [100, 96.5, 93.2, 90.0]}}
+- "5가지 트렌드 언급" → {{"labels": ["트렌드1", "트렌드2", "트렌드3", "트렌드4", "트렌드5"], "data": [1, 1, 1, 1, 1]}}
+```
+
+**PLACEHOLDER는 다음 경우에만 (매우 예외적)**:
+- 섹션 제목과 데이터가 완전히 무관한 경우만 (예: "자동차 산업" 섹션인데 데이터가 "요리 레시피"인 경우)
+- 데이터가 완전히 비어있거나 의미없는 텍스트만 있는 경우
+
+**데이터 추출 체크리스트**:
+숫자가 하나라도 있는가? → 차트 생성!
+항목이 2개 이상 나열되어 있는가? → 차트 생성!
+지역/국가명이 언급되는가? → 차트 생성!
+연도/시기가 언급되는가? → 차트 생성!
+비교 표현이 있는가? (더 크다, 증가, 감소 등) → 차트 생성!
+
+**표준 JSON 형식**:
+{{
+    "type": "STEP1분석_기반_차트타입",
+    "data": {{
+        "labels": ["STEP1추출_실제라벨1", "실제라벨2", "실제라벨3"],
+        "datasets": [{{
+            "label": "STEP1정의_데이터셋명",
+            "data": [STEP1추출_실제수치1, 실제수치2, 실제수치3],
+            "backgroundColor": ["#4F46E5", "#7C3AED", "#EC4899", "#EF4444", "#F59E0B"],
+            "borderColor": ["#4F46E5", "#7C3AED", "#EC4899", "#EF4444", "#F59E0B"],
+            "borderWidth": 1
+        }}]
+    }},
+    "options": {{
+        "responsive": true,
+        "plugins": {{
+            "title": {{
+                "display": true,
+                "text": "{section_title}"
+            }},
+            "legend": {{
+                "display": true,
+                "position": "top"
+            }}
+        }},
+        "scales": {{
+            "y": {{
+                "beginAtZero": true,
+                "title": {{
+                    "display": true,
+                    "text": "값 (단위)"
+                }}
+            }},
+            "x": {{
+                "title": {{
+                    "display": true,
+                    "text": "카테고리"
+                }}
+            }}
+        }}
+    }}
+}}
+"""
+
+
 class DataGathererAgent:
     """데이터 수집 및 쿼리 최적화 전담 Agent"""
 
@@ -102,6 +1330,9 @@ class DataGathererAgent:
             "scrape_content": self._scrape_content,
         }
 
+        # 쿼리 최적화 프리워밍: 계획 수립 직후 이후 단계 질문들의 최적화를 앞 단계 수집과 겹쳐 미리 실행
+        self._prewarm_cache: "OrderedDict[Tuple[str, str], asyncio.Task]" = OrderedDict()
+
     # === [NEW] 그래프 리포트에서 '원산지 관계 정보' 파싱 ===
     def _parse_isfrom_from_graph_report(self, text: str):
         try:
@@ -725,6 +1956,37 @@ class DataGathererAgent:
         # 모든 처리가 실패하면 원본 응답 반환
         return raw_response.strip()
 
+    def prewarm(self, sub_questions: List[Tuple[str, str]]):
+        """계획의 (질문, 도구) 목록 중 실행 시 그대로 쓰일 질문의 쿼리 최적화를 미리 시작합니다.
+
+        앞 단계 결과 플레이스홀더가 없는 질문만 넘겨야 execute()의 조회 키와 일치합니다.
+        """
+        started = []
+        for query, tool_name in sub_questions:
+            key = (query, tool_name)
+            # vector_db_search는 그래프 증거가 있으면 별도 재작성 경로를 타므로 제외
+            if key in self._prewarm_cache or tool_name not in self.tool_mapping or tool_name == "vector_db_search":
+                continue
+            self._prewarm_cache[key] = asyncio.create_task(self._optimize_query_for_tool(query, tool_name))
+            started.append(tool_name)
+            while len(self._prewarm_cache) > PREWARM_CACHE_SIZE:
+                _, stale = self._prewarm_cache.popitem(last=False)
+                if not stale.done():
+                    stale.cancel()
+        if started:
+            logger.debug("쿼리 최적화 프리워밍 시작: %s", started)
+
+    async def _get_optimized_query(self, query: str, tool: str) -> str:
+        """프리워밍된 최적화 결과가 있으면 재사용하고, 없으면 새로 최적화합니다."""
+        task = self._prewarm_cache.pop((query, tool), None)
+        if task is not None and not task.cancelled():
+            try:
+                optimized_query = await task
+                logger.debug("%s 프리워밍된 쿼리 최적화 결과 사용", tool)
+                return optimized_query
+            except Exception as e:
+                logger.warning("%s 프리워밍 결과 사용 실패, 재시도: %s", tool, e)
+        return await self._optimize_query_for_tool(query, tool)
 
     async def execute(self, tool: str, inputs: Dict[str, Any], state: Dict[str, Any] = None) -> Tuple[List[SearchResult], str]:
         """단일 도구를 비동기적으로 실행하며, 실행 전 쿼리를 최적화합니다."""
@@ -756,7 +2018,7 @@ class DataGathererAgent:
             if disable_graph_to_vector:
                 print(f"  🔴 Graph-to-Vector DISABLED: DISABLE_GRAPH_TO_VECTOR={os.environ.get('DISABLE_GRAPH_TO_VECTOR')}")
                 print(f"  - Graph-to-Vector 비활성화: 기본 쿼리 최적화 수행")
-                optimized_query = await self._optimize_query_for_tool(original_query, tool)
+                optimized_query = await self._get_optimized_query(original_query, tool)
             elif evidence_exists:
                 print(f"  🟢 Graph-to-Vector ENABLED: DISABLE_GRAPH_TO_VECTOR={os.environ.get('DISABLE_GRAPH_TO_VECTOR')}")
                 print(f"  - Vector DB 검색: 실시간 Graph 조회 수행")
@@ -799,16 +2061,16 @@ class DataGathererAgent:
                         nutrients = selected["nutrients"]
                     else:
                         print("  - 실시간 Graph 조회: 증거 없음, 기본 쿼리 최적화 수행")
-                        optimized_query = await self._optimize_query_for_tool(original_query, tool)
+                        optimized_query = await self._get_optimized_query(original_query, tool)
                 except Exception as e:
                     print(f"  - 실시간 Graph 조회 실패: {e}, 기본 쿼리 최적화 수행")
-                    optimized_query = await self._optimize_query_for_tool(original_query, tool)
+                    optimized_query = await self._get_optimized_query(original_query, tool)
             else:
                 print(f"  - 그래프 증거 없음: 기본 쿼리 최적화 수행")
-                optimized_query = await self._optimize_query_for_tool(original_query, tool)
+                optimized_query = await self._get_optimized_query(original_query, tool)
         else:
             # [기존] 실제 도구 실행 전, 쿼리 최적화 단계 추가
-            optimized_query = await self._optimize_query_for_tool(original_query, tool)
+            optimized_query = await self._get_optimized_query(original_query, tool)
 
         # 최적화된 쿼리로 새로운 inputs 딕셔너리 생성
         optimized_inputs = inputs.copy()
@@ -1126,6 +2388,7 @@ class DataGathererAgent:
 
             # 결과가 문자열인 경우 파싱
             search_results = []
+            search_ts = datetime.now().isoformat()  # 같은 검색 결과는 동일 시각 공유
             if result_text and isinstance(result_text, str):
                 # 간단한 파싱으로 SearchResult 객체 생성
                 lines = result_text.split('\n')
@@ -1136,19 +2399,7 @@ class DataGathererAgent:
                     if line.startswith(('1.', '2.', '3.', '4.', '5.')):
                         # 이전 결과 저장
                         if current_result:
-                            search_result = SearchResult(
-                                source="web_search",
-                                content=current_result.get("snippet", ""),
-                                search_query=query,
-                                title=current_result.get("title", "웹 검색 결과"),
-                                url=current_result.get("link"),
-                                score=0.9,  # 웹검색 결과는 높은 점수
-                                timestamp=datetime.now().isoformat(),
-                                document_type="web",
-                                metadata={"optimized_query": query, **current_result},
-                                source_url=current_result.get("link", "웹 검색 결과")
-                            )
-                            search_results.append(search_result)
+                            search_results.append(_mk_web_result(current_result, query, search_ts))
 
                         # 새 결과 시작
                         current_result = {"title": line[3:].strip()}  # 번호 제거
@@ -1159,23 +2410,7 @@ class DataGathererAgent:
 
                 # 마지막 결과 저장
                 if current_result:
-                    search_result = SearchResult(
-                        source="web_search",
-                        content=current_result.get("snippet", ""),
-                        search_query=query,
-                        title=current_result.get("title", "웹 검색 결과"),
-                        url=current_result.get("link"),
-                        score=0.9,  # 웹검색 결과는 높은 점수
-                        timestamp=datetime.now().isoformat(),
-                        document_type="web",
-                        metadata={
-                            "optimized_query": query,
-                            "link": current_result.get("link"),  # 출처 링크 포함
-                            **current_result
-                        },
-                        source_url=current_result.get("link", "웹 검색 결과")
-                    )
-                    search_results.append(search_result)
+                    search_results.append(_mk_web_result(current_result, query, search_ts))
 
             print(f"  - 웹 검색 완료: {len(search_results)}개 결과")
             return search_results[:5]  # 상위 5개 결과만
@@ -1244,7 +2479,7 @@ class DataGathererAgent:
         try:
             # graph_db_search가 동기 함수라면
             loop = asyncio.get_running_loop()
-            raw_results = await loop.run_in_executor(None, graph_db_search, query)
+            raw_results = await loop.run_in_executor(_IO_EXECUTOR, graph_db_search, query)
             # 만약 langchain Tool일 경우:
             # with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
             #     raw_results = executor.submit(graph_db_search.invoke, {"query": query}).result(timeout=20)
@@ -1429,10 +2664,8 @@ class DataGathererAgent:
         try:
             print(f"  - arXiv 논문 검색 시작: {query}")
 
-            # arXiv 검색 함수를 직접 호출 (langchain tool 우회)
-            loop = asyncio.get_event_loop()
-
-            def _direct_arxiv_search(query_text, max_results=5):
+            # arXiv API를 공유 aiohttp 세션으로 직접 호출 (langchain tool 우회)
+            async def _direct_arxiv_search(query_text, max_results=5) -> List[Dict[str, str]]:
                 try:
                     # 검색 쿼리 URL 인코딩
                     base_url = "https://export.arxiv.org/api/query?"
@@ -1451,159 +2684,34 @@ class DataGathererAgent:
                     url = base_url + urllib.parse.urlencode(params)
                     print(f"  - API URL: {url}")
 
-                    # API 호출
-                    # response = urllib.request.urlopen(url, timeout=10)
-                    # data = response.read().decode('utf-8')
-                    req = urllib.request.Request(
-                        url,
-                        headers={"User-Agent": "MyArxivClient/1.0 (contact: youremail@example.com)"}
-                    )
-
-                    with urllib.request.urlopen(req, timeout=15) as resp:
-                        data = resp.read().decode("utf-8")
-                    # XML 파싱
-                    root = ET.fromstring(data)
-
-                    # 네임스페이스 정의
-                    ns = {
-                        'atom': 'http://www.w3.org/2005/Atom',
-                        'arxiv': 'http://arxiv.org/schemas/atom'
-                    }
-
-                    # 결과 파싱
-                    entries = root.findall('atom:entry', ns)
-
-                    if not entries:
-                        return f"'{query_text}'에 대한 arXiv 논문을 찾을 수 없습니다."
-
+                    # 수신하는 대로 <entry> 단위 스트리밍 파싱 (공유 세션으로 커넥션 재사용)
+                    session = await _get_arxiv_session()
                     results = []
-                    for i, entry in enumerate(entries[:max_results], 1):
-                        # 논문 정보 추출
-                        title = entry.find('atom:title', ns).text.strip().replace('\n', ' ')
-
-                        # 저자 정보
-                        authors = entry.findall('atom:author', ns)
-                        author_names = [author.find('atom:name', ns).text for author in authors]
-                        author_str = ', '.join(author_names[:3])
-                        if len(author_names) > 3:
-                            author_str += f' 외 {len(author_names)-3}명'
-
-                        # 초록
-                        summary = entry.find('atom:summary', ns).text.strip()
-                        if len(summary) > 300:
-                            summary = summary[:297] + "..."
-
-                        # 발행일
-                        published = entry.find('atom:published', ns).text
-                        pub_date = datetime.strptime(published[:10], '%Y-%m-%d').strftime('%Y년 %m월 %d일')
-
-                        # 카테고리
-                        categories = entry.findall('atom:category', ns)
-                        cat_list = [cat.get('term') for cat in categories]
-                        categories_str = ', '.join(cat_list[:3])
-
-                        # 논문 링크
-                        pdf_link = None
-                        for link in entry.findall('atom:link', ns):
-                            if link.get('type') == 'application/pdf':
-                                pdf_link = link.get('href')
-                                break
-
-                        if not pdf_link:
-                            pdf_link = entry.find('atom:id', ns).text.replace('abs', 'pdf')
-
-                        # 결과 포맷팅
-                        result_text = f"{i}. 📄 {title}\n"
-                        result_text += f"   저자: {author_str}\n"
-                        result_text += f"   발행일: {pub_date}\n"
-                        result_text += f"   분야: {categories_str}\n"
-                        result_text += f"   PDF: {pdf_link}\n"
-                        result_text += f"   초록: {summary}\n"
-
-                        results.append(result_text)
-
-                    # 최종 결과 반환
-                    final_result = f"arXiv 논문 검색 결과 (검색어: {query_text}):\n"
-                    final_result += f"총 {len(results)}개 논문 발견\n\n"
-                    final_result += "\n".join(results)
-
-                    return final_result
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                        parser = LET.XMLPullParser(events=('end',), tag=_ARXIV_ENTRY_TAG)
+                        async for chunk in resp.content.iter_chunked(ARXIV_STREAM_CHUNK_SIZE):
+                            parser.feed(chunk)
+                            for _, entry in parser.read_events():
+                                if len(results) < max_results:
+                                    results.append(_parse_arxiv_entry(entry))
+                                # 처리한 entry와 앞선 형제 노드를 해제해 메모리를 entry 1개 수준으로 유지
+                                entry.clear()
+                                while entry.getprevious() is not None:
+                                    del entry.getparent()[0]
+                        parser.close()
+
+                    if not results:
+                        print(f"  - '{query_text}'에 대한 arXiv 논문을 찾을 수 없습니다.")
+                    return results
 
                 except Exception as e:
-                    return f"arXiv 검색 중 오류 발생: {str(e)}"
+                    print(f"  - arXiv 검색 중 오류 발생: {str(e)}")
+                    return []
 
-            result_text = await loop.run_in_executor(
-                _global_executor,
-                _direct_arxiv_search,
-                query,
-                5
-            )
+            papers = await _ARXIV_CACHE.get_or_set((query, 5), lambda: _direct_arxiv_search(query, 5))
+            search_ts = datetime.now().isoformat()
 
-            # 결과 파싱
-            search_results = []
-            if result_text and isinstance(result_text, str):
-                lines = result_text.split('\n')
-                current_paper = {}
-
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith(('1.', '2.', '3.', '4.', '5.')):
-                        # 이전 논문 저장
-                        if current_paper:
-                            search_result = SearchResult(
-                                source="arxiv_search",
-                                content=current_paper.get("초록", ""),
-                                search_query=query,
-                                title=current_paper.get("title", "arXiv 논문"),
-                                url=current_paper.get("pdf", ""),
-                                score=0.95,  # 학술 논문은 높은 신뢰도
-                                timestamp=datetime.now().isoformat(),
-                                document_type="research_paper",
-                                metadata={
-                                    "authors": current_paper.get("저자", ""),
-                                    "date": current_paper.get("발행일", ""),
-                                    "categories": current_paper.get("분야", ""),
-                                    "optimized_query": query
-                                },
-                                source_url=current_paper.get("pdf", "")
-                            )
-                            search_results.append(search_result)
-                        # 새 논문 시작
-                        current_paper = {}
-                        title_part = line.split('📄', 1)
-                        if len(title_part) > 1:
-                            current_paper["title"] = title_part[1].strip()
-                    elif '저자:' in line:
-                        current_paper["저자"] = line.split('저자:', 1)[1].strip()
-                    elif '발행일:' in line:
-                        current_paper["발행일"] = line.split('발행일:', 1)[1].strip()
-                    elif '분야:' in line:
-                        current_paper["분야"] = line.split('분야:', 1)[1].strip()
-                    elif 'PDF:' in line:
-                        current_paper["pdf"] = line.split('PDF:', 1)[1].strip()
-                    elif '초록:' in line:
-                        current_paper["초록"] = line.split('초록:', 1)[1].strip()
-
-                # 마지막 논문 저장
-                if current_paper:
-                    search_result = SearchResult(
-                        source="arxiv_search",
-                        content=current_paper.get("초록", ""),
-                        search_query=query,
-                        title=current_paper.get("title", "arXiv 논문"),
-                        url=current_paper.get("pdf", ""),
-                        score=0.95,
-                        timestamp=datetime.now().isoformat(),
-                        document_type="research_paper",
-                        metadata={
-                            "authors": current_paper.get("저자", ""),
-                            "date": current_paper.get("발행일", ""),
-                            "categories": current_paper.get("분야", ""),
-                            "optimized_query": query
-                        },
-                        source_url=current_paper.get("pdf", "")
-                    )
-                    search_results.append(search_result)
+            search_results = [_mk_arxiv_result(paper, query, search_ts) for paper in papers]
 
             print(f"  - arXiv 검색 완료: {len(search_results)}개 논문")
             return search_results[:5]  # 최대 5개 논문만 반환
@@ -1724,6 +2832,7 @@ class DataGathererAgent:
                         return ""
 
                     results: List[SearchResult] = []
+                    search_ts = datetime.now().isoformat()
                     for art in root.findall(".//PubmedArticle"):
                         pmid = art.findtext(".//PMID") or ""
                         title = (art.findtext(".//ArticleTitle") or "").strip()
@@ -1774,7 +2883,7 @@ class DataGathererAgent:
                             title=title or f"PMID {pmid}",
                             url=link,
                             score=0.95,
-                            timestamp=datetime.now().isoformat(),
+                            timestamp=search_ts,
                             document_type="research_paper",
                             metadata={
                                 "authors": author_str,
@@ -1814,7 +2923,9 @@ class DataGathererAgent:
         """RDB 검색 실행 - 반환 표준화"""
         try:
             loop = asyncio.get_running_loop()
-            result_text = await loop.run_in_executor(None, rdb_search, query)
+            result_text = await _RDB_CACHE.get_or_set(
+                query, lambda: loop.run_in_executor(_IO_EXECUTOR, rdb_search, query)
+            )
 
             # rdb_search는 문자열을 반환하므로, 이를 단일 SearchResult로 변환
             if isinstance(result_text, str) and result_text.strip():
@@ -1853,8 +2964,11 @@ class DataGathererAgent:
             # scrape_and_extract_content는 JSON 문자열을 받아야 함
             action_input = json.dumps({"url": url, "query": query})
 
-            content = await asyncio.get_event_loop().run_in_executor(
-                _global_executor, scrape_and_extract_content, action_input
+            content = await _SCRAPE_CACHE.get_or_set(
+                (url, query),
+                lambda: asyncio.get_running_loop().run_in_executor(
+                    _IO_EXECUTOR, scrape_and_extract_content, action_input
+                )
             )
 
             if content:
@@ -1943,6 +3057,21 @@ class ProcessorAgent:
             print("ProcessorAgent: 경고: OPENAI_API_KEY가 설정되지 않음")
 
         self.personas = PERSONA_PROMPTS
+        # 페르소나 설명은 호출마다 .get().get() 하지 않도록 미리 평탄화
+        self._persona_desc = {
+            name: info.get("description", "일반적인 분석가")
+            for name, info in PERSONA_PROMPTS.items()
+        }
+
+        # 섹션 생성용 정적 system 프롬프트는 페르소나별로 한 번만 포맷
+        self._section_system_prompts = {
+            name: self._build_section_system_prompts(info.get("report_prompt", DEFAULT_REPORT_PROMPT))
+            for name, info in PERSONA_PROMPTS.items()
+        }
+        self._default_section_system_prompts = self._build_section_system_prompts(DEFAULT_REPORT_PROMPT)
+
+        # 차트 프롬프트 해시 → 파싱된 차트 JSON (LRU)
+        self._chart_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
         # Orchestrator가 호출할 수 있는 작업 목록 정의
         self.processor_mapping = {
@@ -1950,40 +3079,113 @@ class ProcessorAgent:
             "create_chart_data": self._create_charts,
         }
 
-    async def _invoke_with_fallback(self, prompt, primary_model, backup_model, fallback_model):
+    @staticmethod
+    def _build_section_system_prompts(persona_instruction: str) -> Dict[str, str]:
+        """content_type별 섹션 생성 system 프롬프트를 만듭니다."""
+        return {
+            "synthesis": SECTION_SYNTHESIS_SYSTEM_TEMPLATE.format(persona_instruction=persona_instruction),
+            "full_data_for_chart": SECTION_CHART_SYSTEM_TEMPLATE.format(persona_instruction=persona_instruction),
+        }
+
+    @staticmethod
+    def render_awareness_context(awareness_context: str) -> str:
+        """전체 보고서 구조 컨텍스트를 system 프롬프트에 붙일 블록으로 렌더링합니다."""
+        if not awareness_context:
+            return ""
+        return SECTION_AWARENESS_TEMPLATE.format(awareness_context=awareness_context)
+
+    def _get_section_system_prompt(self, persona_name: str, content_type: str) -> str:
+        """미리 포맷해 둔 페르소나별 섹션 system 프롬프트를 반환합니다."""
+        prompts = self._section_system_prompts.get(persona_name, self._default_section_system_prompts)
+        return prompts[content_type]
+
+    def _remember_chart(self, cache_key: str, chart: Dict[str, Any]):
+        """성공한 차트 JSON을 LRU 캐시에 저장합니다 (키를 intern한 복사본으로 보관)."""
+        self._chart_cache[cache_key] = _copy_chart_interned(chart)
+        self._chart_cache.move_to_end(cache_key)
+        while len(self._chart_cache) > CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+
+    def _resolve_persona(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 시작 시 한 번 호출하여 페르소나 프롬프트를 state에 고정합니다.
+
+        섹션용 system 프롬프트 전체는 state가 DB에 저장될 수 있어 넣지 않고,
+        __init__에서 만든 페르소나별 캐시를 persona_name으로 조회합니다.
+        """
+        persona_name = state.get("persona", "기본")
+        persona_info = self.personas.get(persona_name, {})
+        state["persona_name"] = persona_name
+        state["persona_report_prompt"] = persona_info.get("report_prompt", DEFAULT_REPORT_PROMPT)
+        state["persona_chart_prompt"] = persona_info.get("chart_prompt", DEFAULT_CHART_PROMPT)
+        return state
+
+    @staticmethod
+    def _prebuild_data_blocks(full_data_dict: Dict[int, Dict], include_url: bool = False) -> Dict[int, str]:
+        """full_data_dict의 각 항목을 섹션 프롬프트용 마크다운 블록으로 한 번만 포맷합니다."""
+        blocks = {}
+        for idx, data_info in full_data_dict.items():
+            block = (
+                f"**데이터 {idx}: {data_info['source']}**\n"
+                f"- **제목**: {data_info['title']}\n"
+                f"- **내용**: {data_info['content']}\n"
+            )
+            if include_url:
+                block += f"- **출처_링크**: {data_info.get('url') or data_info.get('source_url', '')}\n"
+            blocks[idx] = block + "\n"
+        return blocks
+
+    def _get_data_blocks(self, full_data_dict: Dict[int, Dict], content_type: str, state: Optional[Dict[str, Any]]) -> Dict[int, str]:
+        """state에 미리 만들어 둔 데이터 블록을 반환하고, 없으면 즉석에서 만듭니다."""
+        prebuilt = state.get("formatted_data_blocks") if state else None
+        if prebuilt and content_type in prebuilt:
+            return prebuilt[content_type]
+        return self._prebuild_data_blocks(full_data_dict, include_url=(content_type == "full_data_for_chart"))
+
+    @staticmethod
+    def _cache_kwargs(model, cache_key: Optional[str]) -> Dict[str, Any]:
+        """모델별 prompt prefix 캐시 힌트 호출 인자를 반환합니다.
+
+        Gemini 2.5/OpenAI는 system 메시지부터 시작하는 동일 prefix를 자동으로 캐시하므로,
+        OpenAI에는 같은 prefix끼리 같은 캐시로 라우팅되도록 prompt_cache_key만 추가로 전달합니다.
+        """
+        if cache_key and isinstance(model, ChatOpenAI):
+            return {"extra_body": {"prompt_cache_key": cache_key}}
+        return {}
+
+    async def _invoke_with_fallback(self, prompt, primary_model, backup_model, fallback_model, cache_key: Optional[str] = None):
         """
         Gemini key 1 → Gemini key 2 → OpenAI 순으로 fallback 처리
         """
         # Gemini key 1 시도
         try:
-            result = await primary_model.ainvoke(prompt)
+            result = await primary_model.ainvoke(prompt, **self._cache_kwargs(primary_model, cache_key))
             return result
         except Exception as e:
-            print(f"ProcessorAgent: Gemini key 1 실패: {e}")
+            logger.warning("ProcessorAgent: Gemini key 1 실패: %s", e)
 
         # Gemini key 2 시도
         if backup_model:
             try:
-                result = await backup_model.ainvoke(prompt)
-                print("ProcessorAgent: Gemini key 2 성공")
+                result = await backup_model.ainvoke(prompt, **self._cache_kwargs(backup_model, cache_key))
+                logger.debug("ProcessorAgent: Gemini key 2 성공")
                 return result
             except Exception as e:
-                print(f"ProcessorAgent: Gemini key 2 실패: {e}")
+                logger.warning("ProcessorAgent: Gemini key 2 실패: %s", e)
 
         # OpenAI 시도
         if fallback_model:
             try:
-                result = await fallback_model.ainvoke(prompt)
-                print("ProcessorAgent: OpenAI fallback 성공")
+                result = await fallback_model.ainvoke(prompt, **self._cache_kwargs(fallback_model, cache_key))
+                logger.debug("ProcessorAgent: OpenAI fallback 성공")
                 return result
             except Exception as fallback_error:
-                print(f"ProcessorAgent: OpenAI fallback도 실패: {fallback_error}")
+                logger.warning("ProcessorAgent: OpenAI fallback도 실패: %s", fallback_error)
                 raise fallback_error
         else:
-            print("ProcessorAgent: 모든 fallback 모델이 없음")
+            logger.warning("ProcessorAgent: 모든 fallback 모델이 없음")
             raise Exception("모든 API 키 시도 실패")
 
-    async def _astream_with_fallback(self, prompt, primary_model, backup_model, fallback_model):
+    async def _astream_with_fallback(self, prompt, primary_model, backup_model, fallback_model, cache_key: Optional[str] = None):
         """
         스트리밍을 위한 Gemini key 1 → Gemini key 2 → OpenAI 순 fallback 처리
         """
@@ -1992,51 +3194,51 @@ class ProcessorAgent:
         primary_content_length = 0
 
         try:
-            print(f"- Primary 모델로 스트리밍 시도 ({type(primary_model).__name__})")
-            async for chunk in primary_model.astream(prompt):
+            logger.debug("- Primary 모델로 스트리밍 시도 (%s)", type(primary_model).__name__)
+            async for chunk in primary_model.astream(prompt, **self._cache_kwargs(primary_model, cache_key)):
                 primary_chunks_received += 1
                 if hasattr(chunk, 'content') and chunk.content:
                     primary_content_length += len(chunk.content)
                 yield chunk
 
-            print(f"- Primary 스트리밍 완료: {primary_chunks_received}개 청크, {primary_content_length} 문자")
+            logger.debug("- Primary 스트리밍 완료: %s개 청크, %s 문자", primary_chunks_received, primary_content_length)
 
             # 청크를 받았지만 내용이 비어있는 경우도 실패로 간주
             if primary_chunks_received == 0 or primary_content_length == 0:
-                print(f"- Primary 모델에서 유효한 내용이 생성되지 않음, backup 시도")
+                logger.warning("- Primary 모델에서 유효한 내용이 생성되지 않음, backup 시도")
                 raise Exception("No valid content generated")
             return
 
         except Exception as e:
-            print(f"ProcessorAgent: Gemini key 1 실패: {e}")
+            logger.warning("ProcessorAgent: Gemini key 1 실패: %s", e)
 
         # Gemini key 2 시도
         if backup_model:
             try:
-                print("ProcessorAgent: Gemini key 2로 스트리밍 시작")
+                logger.debug("ProcessorAgent: Gemini key 2로 스트리밍 시작")
                 backup_chunks_received = 0
-                async for chunk in backup_model.astream(prompt):
+                async for chunk in backup_model.astream(prompt, **self._cache_kwargs(backup_model, cache_key)):
                     backup_chunks_received += 1
                     yield chunk
-                print(f"ProcessorAgent: Gemini key 2 완료: {backup_chunks_received}개 청크")
+                logger.debug("ProcessorAgent: Gemini key 2 완료: %s개 청크", backup_chunks_received)
                 return
             except Exception as e:
-                print(f"ProcessorAgent: Gemini key 2도 실패: {e}")
+                logger.warning("ProcessorAgent: Gemini key 2도 실패: %s", e)
 
         # OpenAI 시도
         if fallback_model:
             try:
-                print("ProcessorAgent: OpenAI fallback으로 스트리밍 시작")
+                logger.debug("ProcessorAgent: OpenAI fallback으로 스트리밍 시작")
                 fallback_chunks_received = 0
-                async for chunk in fallback_model.astream(prompt):
+                async for chunk in fallback_model.astream(prompt, **self._cache_kwargs(fallback_model, cache_key)):
                     fallback_chunks_received += 1
                     yield chunk
-                print(f"ProcessorAgent: OpenAI fallback 완료: {fallback_chunks_received}개 청크")
+                logger.debug("ProcessorAgent: OpenAI fallback 완료: %s개 청크", fallback_chunks_received)
             except Exception as fallback_error:
-                print(f"ProcessorAgent: OpenAI fallback도 실패: {fallback_error}")
+                logger.warning("ProcessorAgent: OpenAI fallback도 실패: %s", fallback_error)
                 raise fallback_error
         else:
-            print("ProcessorAgent: 모든 fallback 모델이 없음")
+            logger.warning("ProcessorAgent: 모든 fallback 모델이 없음")
             raise Exception("모든 API 키 시도 실패")
 
     async def process(self, processor_type: str, data: Any, param2: Any, param3: str, param4: str = "", yield_callback=None, state: Optional[Dict[str, Any]] = None):
@@ -2068,6 +3270,11 @@ class ProcessorAgent:
         print(f"   전체 데이터: {len(data)}개")
         print(f"   선택된 인덱스: {selected_indexes} ({len(selected_indexes)}개)")
 
+        # 검증 루프에서 반복 getattr 없이 쓰도록 content/title을 한 번만 추출
+        n_data = len(data)
+        contents = [getattr(d, 'content', '') or '' for d in data]
+        titles = [getattr(d, 'title', 'No Title') or '' for d in data]
+
         # 현재 날짜 정보 추가
         import pytz
         kst = pytz.timezone('Asia/Seoul')
@@ -2075,28 +3282,31 @@ class ProcessorAgent:
 
         # 페르소나 정보 추출
         persona_name = state.get("persona", "기본") if state else "기본"
-        persona_description = self.personas.get(persona_name, {}).get("description", "일반적인 분석가")
+        persona_description = self._persona_desc.get(persona_name, "일반적인 분석가")
         print(f"  - 보고서 구조 설계에 '{persona_name}' 페르소나 관점 적용")
 
         # 선택된 인덱스의 데이터를 인덱스와 함께 매핑하여 컨텍스트 생성
-        indexed_context = ""
+        # (selected_indexes는 Orchestrator에서 이미 범위 검증됨)
+        # 컨텍스트 길이 제한을 넘으면 이후 항목은 어차피 잘리므로 포맷팅하지 않고 중단
+        context_budget = 20000  # 더 많은 정보 포함
+        context_parts = []
+        context_len = 0
         for idx in selected_indexes:
-            if 0 <= idx < len(data):
-                res = data[idx]
-                source = getattr(res, 'source', 'Unknown')
-                title = getattr(res, 'title', 'No Title')
-                content = getattr(res, 'content', '')  # 전체 내용 (요약 없이)
-
-                indexed_context += f"""
+            chunk = f"""
     --- 데이터 인덱스 [{idx}] ---
-    출처: {source}
-    제목: {title}
-    내용: {content}
+    출처: {getattr(data[idx], 'source', 'Unknown')}
+    제목: {titles[idx]}
+    내용: {contents[idx]}
 
     """
+            context_parts.append(chunk)
+            context_len += len(chunk)
+            if context_len >= context_budget:
+                break
+        indexed_context = "".join(context_parts)
 
         # 컨텍스트 길이 제한 (너무 길면 잘라내기)
-        limited_indexed_context = indexed_context[:20000]  # 더 많은 정보 포함
+        limited_indexed_context = indexed_context[:context_budget]
 
         print(f"   생성된 컨텍스트 길이: {len(indexed_context)} 문자")
         print(f"   제한된 컨텍스트 길이: {len(limited_indexed_context)} 문자")
@@ -2284,11 +3494,14 @@ class ProcessorAgent:
             print(f"  - 보고서 구조 설계 응답 길이: {len(response.content)} 문자")
 
             # JSON 파싱
-            design_result = json.loads(re.search(r'\{.*\}', response.content, re.DOTALL).group())
+            design_json = find_json_object(response.content)
+            if design_json is None:
+                raise ValueError("Valid JSON not found in response")
+            design_result = orjson.loads(design_json)
 
-            # 보고서 구조 설계 결과 JSON dump로 출력
-            print(f"  - 보고서 구조 설계 결과 JSON:")
-            print(json.dumps(design_result, ensure_ascii=False, indent=2))
+            # 보고서 구조 설계 결과 JSON dump로 출력 (DEBUG 레벨에서만)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("보고서 구조 설계 결과 JSON:\n%s", orjson.dumps(design_result, option=orjson.OPT_INDENT_2).decode())
 
             # ⭐ 핵심 추가: 인덱스 유효성 검증 및 데이터 충분성 재검증
             print(f"  - 구조 설계 결과 검증 및 데이터 충분성 재확인:")
@@ -2318,57 +3531,27 @@ class ProcessorAgent:
                     numeric_count = 0
 
                     print(f"      📊 차트 섹션 데이터 내용 검증:")
-                    for idx in valid_use_contents:
-                        if 0 <= idx < len(data):
-                            data_item = data[idx]
-                            content = getattr(data_item, 'content', '')
-                            title = getattr(data_item, 'title', 'No Title')
-
-                            # 수치 데이터 패턴 검사 (더 포괄적)
-                            numeric_patterns = [
-                                r'\d+%',                    # 퍼센트
-                                r'\d+\.\d+%',               # 소수점 퍼센트
-                                r'\d+억원?',                 # 억원
-                                r'\d+조원?',                 # 조원
-                                r'\d+만원?',                 # 만원
-                                r'\d+천톤',                  # 천톤
-                                r'\d+톤',                   # 톤
-                                r'\d+,\d+',                 # 천의 자리 콤마
-                                r'\d+\s*원/\s*\d+\s*개?',     # 단가 (원/개, 원/20개 등)
-                                r'단위:\s*원/\d+개?',          # "단위: 원/20개" 형태
-                                r'\d+\s+\d+\s+\d+\s+\d+',     # 연속된 숫자들 (테이블 데이터)
-                                r'\d{4}년\s+\d+',           # "2025년 38660" 같은 연도+숫자
-                                r'\d+월\s+\d+',             # "7월 14324" 같은 월+숫자
-                                r'증가율.*?\d+',             # 증가율 + 숫자
-                                r'감소율.*?\d+',             # 감소율 + 숫자
-                                r'점유율.*?\d+',             # 점유율 + 숫자
-                                r'\d+\s+\d+\s+\d+',         # 표 형태의 연속 숫자
-                                r'평년\s+\d+',              # "평년 25686" 같은 기준값
-                            ]
-
-                            numeric_matches = 0
-                            for pattern in numeric_patterns:
-                                matches = re.findall(pattern, content)
-                                numeric_matches += len(matches)
-
-                            if numeric_matches > 0:
-                                has_numeric_data = True
-                                numeric_count += numeric_matches
-                                print(f"        [{idx}] ✅ 수치 데이터 {numeric_matches}개 발견: {title[:30]}...")
-                            else:
-                                print(f"        [{idx}] ❌ 수치 데이터 없음: {title[:30]}...")
+                    in_range = [idx for idx in valid_use_contents if 0 <= idx < n_data]
+                    for idx in in_range:
+                        # 수치 데이터 패턴 검사 (단일 컴파일 정규식으로 1회 스캔)
+                        numeric_matches = len(_NUMERIC_RE.findall(contents[idx]))
+
+                        if numeric_matches > 0:
+                            has_numeric_data = True
+                            numeric_count += numeric_matches
+                            print(f"        [{idx}] ✅ 수치 데이터 {numeric_matches}개 발견: {titles[idx][:30]}...")
+                        else:
+                            print(f"        [{idx}] ❌ 수치 데이터 없음: {titles[idx][:30]}...")
 
                     # 실제 데이터 기반 충분성 재판단 (더 관대한 기준)
                     # 테이블이나 시계열 데이터가 있으면 충분하다고 판단
-                    has_table_data = any('단위:' in getattr(data[idx], 'content', '') or
-                                       '구분' in getattr(data[idx], 'content', '') or
-                                       ('년' in getattr(data[idx], 'content', '') and '월' in getattr(data[idx], 'content', ''))
-                                       for idx in valid_use_contents if 0 <= idx < len(data))
+                    has_table_data = any(_TABLE_RE.search(contents[idx]) or
+                                       ('년' in contents[idx] and '월' in contents[idx])
+                                       for idx in in_range)
 
                     # 가격/단가 정보도 차트 생성 가능하다고 판단
-                    has_price_data = any(('원/' in getattr(data[idx], 'content', '') or
-                                        '가격' in getattr(data[idx], 'title', ''))
-                                       for idx in valid_use_contents if 0 <= idx < len(data))
+                    has_price_data = any(('원/' in contents[idx] or '가격' in titles[idx])
+                                       for idx in in_range)
 
                     actually_sufficient = (has_numeric_data and numeric_count >= 2) or has_table_data or has_price_data
 
@@ -2416,76 +3599,42 @@ class ProcessorAgent:
 
     # worker_agents.py - ProcessorAgent 클래스의 수정된 함수들
 
-    async def _synthesize_data_for_section(self, section_title: str, section_data: List[SearchResult]) -> str:
+    async def _synthesize_data_for_section(self, section_title: str, section_data: List[Union[SearchResult, NormalizedResult]]) -> str:
         """⭐ 수정: 섹션별 선택된 데이터만 사용하여 출처 번호 정확히 매핑"""
 
         # ⭐ 핵심 개선: 섹션별 선택된 데이터만 사용하여 출처 정보 생성
-        context_with_sources = ""
+        context_parts = []
+        context_tokens = 0
         for i, res in enumerate(section_data):  # section_data만 사용 (all_data 대신)
-            source_info = ""
-            source_link = ""
-
-            # Web search 결과인 경우
-            if hasattr(res, 'source') and 'web_search' in str(res.source).lower():
-                if hasattr(res, 'url') and res.url:
-                    source_link = res.url
-                    source_info = f"웹 출처: {res.url}"
-                elif hasattr(res, 'metadata') and res.metadata and 'link' in res.metadata:
-                    source_link = res.metadata['link']
-                    source_info = f"웹 출처: {res.metadata['link']}"
-                else:
-                    source_info = "웹 검색 결과"
-                    source_link = "웹 검색"
-
-            # Vector DB 결과인 경우
-            elif hasattr(res, 'source_url'):
-                source_info = f"문서 출처: {res.source_url}"
-                source_link = res.source_url
-            elif hasattr(res, 'title'):
-                source_info = f"문서: {res.title}"
-                source_link = res.title
-            else:
-                source_name = res.source if hasattr(res, 'source') else 'Vector DB'
-                source_info = f"출처: {source_name}"
-                source_link = source_name
-
+            if not isinstance(res, NormalizedResult):
+                res = _normalize_result(res)
             # 핵심: 섹션 데이터 내에서의 인덱스 사용 (0, 1, 2...)
-            context_with_sources += f"--- 문서 ID {i}: [{source_info}] ---\n제목: {res.title}\n내용: {res.content}\n출처_링크: {source_link}\n\n"
-
-        prompt = f"""
-    당신은 여러 데이터 소스를 종합하여 특정 주제에 대한 분석 보고서의 한 섹션을 저술하는 주제 전문가입니다.
-
-    **작성할 섹션의 주제**: "{section_title}"
-
-    **사용 데이터 인덱스**
-
-    **참고할 선택된 데이터** (섹션별로 엄선된 관련 데이터):
-    {context_with_sources[:8000]}
-
-    **작성 지침**:
-    1. **핵심 정보 추출**: '{section_title}' 주제와 직접적으로 관련된 핵심 사실, 수치, 통계 위주로 정보를 추출하세요.
-    2. **간결한 요약**: 정보를 단순히 나열하지 말고, 1~2 문단 이내의 간결하고 논리적인 핵심 요약문으로 재구성해주세요.
-    3. **중복 제거**: 여러 문서에 걸쳐 반복되는 내용은 하나로 통합하여 제거하세요.
-    4. **객관성 유지**: 데이터에 기반하여 객관적인 사실만을 전달해주세요.
-    5. **⭐ 출처 정보 보존**: 중요한 정보나 수치를 언급할 때 해당 정보의 출처를 [SOURCE:숫자] 형식으로 표기하세요. 반드시 숫자만 사용하세요.
-    - **문서 ID 번호를 사용**
-    - 예시: "시장 규모가 증가했습니다 [SOURCE:1]", "매출이 상승했습니다 [SOURCE:2]"
-    - 잘못된 예시: [SOURCE:데이터 1], [SOURCE:문서 1] (이런 형식 사용 금지)
-    6. **⭐ 노션 스타일 마크다운 적극 활용**:
-    - **중요한 키워드나 수치**: **굵은 글씨**로 강조
-    - *일반적인 강조나 트렌드*: *기울임체*로 표현
-    - **핵심 포인트나 결론**: > 인용문 형태로 강조
-    - **항목이 여러 개**: - 첫 번째 항목, - 두 번째 항목 형태
-    - **하위 분류**:   - 세부 항목 (들여쓰기)
-    - **단락 구분**: 내용 변화 시 공백 라인으로 명확히 구분
-
-    **결과물 (핵심 요약본)**:
-    """
+            part = f"--- 문서 ID {i}: [{res.source_info}] ---\n제목: {res.title}\n내용: {res.content}\n출처_링크: {res.source_link}\n\n"
+
+            # 토큰 예산 단위로 자르되, 문서 중간에서 끊지 않도록 문서 경계에서 중단
+            part_tokens = _estimate_tokens(part)
+            if context_tokens + part_tokens > SECTION_CONTEXT_TOKEN_BUDGET:
+                if not context_parts:
+                    context_parts.append(part[:int(SECTION_CONTEXT_TOKEN_BUDGET * _CHARS_PER_TOKEN)])
+                break
+            context_parts.append(part)
+            context_tokens += part_tokens
+
+        context_with_sources = "".join(context_parts)
+
+        prompt = [
+            ("system", SECTION_SUMMARY_SYSTEM_PROMPT),
+            ("human", SECTION_SUMMARY_USER_TEMPLATE.format(
+                section_title=section_title,
+                context=context_with_sources
+            )),
+        ]
         response = await self._invoke_with_fallback(
             prompt,
             self.llm_flash,
             self.llm_flash_backup,
-            self.llm_openai_mini
+            self.llm_openai_mini,
+            cache_key="section_summary"
         )
         return response.content
 
@@ -2504,11 +3653,9 @@ class ProcessorAgent:
         description = section.get("description", "이 섹션의 내용을 요약합니다.")
 
         # 페르소나 정보 추출
-        persona_name = state.get("persona", "기본") if state else "기본"
-        default_report_prompt = "당신은 전문적인 AI 분석가입니다."
-        persona_instruction = self.personas.get(persona_name, {}).get("report_prompt", default_report_prompt)
+        persona_name = (state.get("persona_name") or state.get("persona", "기본")) if state else "기본"
 
-        print(f"  - 섹션 '{section_title}' 생성에 '{persona_name}' 페르소나 스타일 적용 (전체 구조 인지)")
+        logger.debug("  - 섹션 '%s' 생성에 '%s' 페르소나 스타일 적용 (전체 구조 인지)", section_title, persona_name)
 
         # 보고서 제목과 중복되지 않도록 섹션 제목 확인
         report_title = state.get("report_title", "") if state else ""
@@ -2524,247 +3671,59 @@ class ProcessorAgent:
         if not is_duplicate_title:
             section_header = f"\n\n## {section_title}\n\n"
             yield section_header
-            print(f"  - 섹션 헤더 출력: {section_title}")
+            logger.debug("  - 섹션 헤더 출력: %s", section_title)
         else:
-            print(f"  - 섹션 헤더 생략 (보고서 제목과 중복): {section_title} ≈ {report_title}")
+            logger.debug("  - 섹션 헤더 생략 (보고서 제목과 중복): %s ≈ %s", section_title, report_title)
             # 중복인 경우 간격만 추가
             yield "\n\n"
 
-        prompt = "" # 최종 프롬프트를 담을 변수
-
         if content_type == "synthesis":
-            print(f"\n🔍 === SECTION STREAMING 디버깅 ({section_title}) ===")
-            print(f"use_indexes: {use_indexes}")
-            print(f"full_data_dict 키들: {list(full_data_dict.keys()) if full_data_dict else 'None'}")
-
-            # 전체 데이터 딕셔너리에서 해당 인덱스만 선별하여 프롬프트용으로 포맷팅
-            section_data_content = ""
-            valid_indexes = []
-            for actual_index in use_indexes:
-                if actual_index in full_data_dict:
-                    valid_indexes.append(actual_index)
-                    data_info = full_data_dict[actual_index]
-                    section_data_content += f"**데이터 {actual_index}: {data_info['source']}**\n"
-                    section_data_content += f"- **제목**: {data_info['title']}\n"
-                    section_data_content += f"- **내용**: {data_info['content']}\n\n"
-                    print(f"  ✅ [{actual_index}] 데이터 매핑 성공: '{data_info['title'][:30]}...'")
-                else:
-                    print(f"  ❌ [{actual_index}] full_data_dict에서 찾을 수 없음!")
-
-            print(f"유효한 인덱스들: {valid_indexes}")
-            print(f"프롬프트에서 사용할 SOURCE 번호들: {valid_indexes}")
-
-
-            prompt_template = """
-
-    {persona_instruction}
-
-    당신은 위의 페르소나 지침을 따르는 전문가 AI입니다. 전체 보고서의 일부인 한 섹션을 작성하는 임무를 받았습니다.
-
-    **사용자의 전체 질문**: "{original_query}"
-
-    ---
-    **[매우 중요] 전체 보고서 구조 및 당신의 역할**:
-    당신은 아래 구조로 구성된 전체 보고서에서 **오직 '{section_title}' 섹션만**을 책임지고 있습니다.
-    다른 전문가들이 나머지 섹션들을 동시에 작성하고 있으므로, **다른 섹션의 주제를 절대 침범하지 말고 당신의 역할에만 집중하세요.**
+            logger.debug("🔍 === SECTION STREAMING 디버깅 (%s) ===", section_title)
+            logger.debug("use_indexes: %s", use_indexes)
+            logger.debug("full_data_dict 키들: %s", list(full_data_dict.keys()) if full_data_dict else 'None')
 
-    {awareness_context}
-    ---
+            # 보고서 시작 시 미리 포맷해 둔 데이터 블록에서 해당 인덱스만 선별
+            data_blocks = self._get_data_blocks(full_data_dict, content_type, state)
+            valid_indexes = [idx for idx in use_indexes if idx in data_blocks]
+            section_data_content = "".join([data_blocks[idx] for idx in valid_indexes])
 
-    **현재 작성할 섹션 제목**: "{section_title}"
-    **이 섹션의 핵심 목표**: "{description}"
+            missing_indexes = [idx for idx in use_indexes if idx not in data_blocks]
+            if missing_indexes:
+                logger.warning("  ❌ full_data_dict에서 찾을 수 없는 인덱스: %s", missing_indexes)
+            logger.debug("유효한 인덱스들: %s", valid_indexes)
+            logger.debug("프롬프트에서 사용할 SOURCE 번호들: %s", valid_indexes)
 
-    **참고 데이터 (실제 인덱스 번호 포함)**:
-    {section_data_content}
-
-    **작성 지침 (매우 중요)**:
-    1. **역할 준수**: 위 '전체 보고서 구조'와 '핵심 목표'를 반드시 인지하고, '{section_title}'에 해당하는 내용만 깊이 있게 작성하세요.
-    2. **페르소나 역할 유지**: 당신의 역할과 말투, 분석 관점을 반드시 유지하며 작성하세요.
-    3. **간결성 유지**: 반드시 1~2 문단 이내로, 가장 핵심적인 내용만 간결하게 요약하여 작성하세요.
-    4. **제목 반복 금지**: 주어진 섹션 제목을 절대 반복해서 출력하지 마세요. 바로 본문 내용으로 시작해야 합니다.
-    5. **데이터 기반**: 참고 데이터에 있는 구체적인 수치, 사실, 인용구를 적극적으로 활용하여 내용을 구성하세요.
-    6. **전문가적 문체**: 명확하고 간결하며 논리적인 전문가의 톤으로 글을 작성하세요.
-    7. **⭐ 노션 스타일 마크다운 적극 활용 (매우 중요) - 반드시 지켜야 함**:
-
-    **기본 포맷팅 (필수)**:
-    - **핵심 키워드나 중요한 수치**: 반드시 **굵은 글씨**로 강조 (예: **58,000원/10kg**, **전년 대비 81.4% 하락**)
-    - *변화나 추세*: 반드시 *기울임체*로 표현 (예: *전년 대비 감소*, *집중호우로 인한 피해*)
-    - 문단별로 **반드시 2-3개 이상의 강조** 포함할 것
-
-    **구조화 (필수)**:
-    - **중요한 인사이트나 결론**: 반드시 `> **핵심 요약**: 내용` 형태로 블록쿼트 사용
-    - **비교 정보가 3개 이상**: 반드시 마크다운 테이블 사용
-    - **목록 형태 정보**: 반드시 `-` 불릿 포인트 사용
-    - **세부 카테고리가 있으면**: 반드시 `### 소제목` 사용
-
-    **필수 예시 패턴**:
-    ```
-    **배(Pear)**의 전체 재배면적은 **9,361ha**로 전년 대비 **0.6% 감소**했으며, *집중호우 피해 지역*으로 분류되는 강원 및 호남 지역에서의 변동이 두드러졌습니다. [SOURCE:2, 3]
-
-    | 식재료 | 주요 생산지 | 재배면적 변화 | 주요 원인 |
-    | :--- | :--- | :--- | :--- |
-    | **배** | 전국 | **-0.6%** (전년 대비) | *전국적 재배면적 감소 추세* [SOURCE:2] |
-    | **포도** | 전국 | **-2.3% ~ -6.7%** | *작형별 면적 감소* [SOURCE:4] |
-
-    > **핵심 결론**: 집중호우 직접 피해는 *미미한 수준*이었으나, 고온 및 가뭄이 **과비대 지연** 등 품질에 미치는 영향이 더 컸습니다.
-    ```
-
-    **⚠️ 강제 요구사항**: 모든 문단에서 **굵은 글씨** 2개 이상, *기울임체* 1개 이상 반드시 사용
-
-    **표 작성 지침**:
-    - 3개 이상의 항목을 비교하거나 분류할 때 테이블 사용
-    - 테이블 형식: `| 항목 | 내용 | 비고 |` 및 `| :--- | :--- | :--- |` 구분선
-    - 테이블 셀 안에서도 **굵은 글씨**, *기울임체*, [SOURCE:숫자] 출처 표기 가능
-    - 예시:
-    ```
-    | 주요 식재료 | 주요 생산지 | 현황 요약 |
-    | :--- | :--- | :--- |
-    | **토마토** | 호남 지역 | 집중호우로 **수해 발생** [SOURCE:2] |
-    | **배** | 충남, 전남 | 피해는 **미미한 수준** [SOURCE:1] |
-    ```
-    8. **⭐ 출처 표기 (데이터 인덱스 번호 사용)**: 특정 정보를 참고하여 작성한 문장 바로 뒤에 [SOURCE:숫자] 형식으로 출처를 표기하세요.
-
-    **🔴 매우 중요 - SOURCE 번호 사용 규칙**:
-    - **반드시 위 "참고 데이터"에 명시된 "[데이터 인덱스 X]" 의 X 번호만 사용하세요**
-    - 예: "데이터 0", "데이터 3", "데이터 7"이 주어졌다면 → [SOURCE:0], [SOURCE:3], [SOURCE:7]만 사용 가능
-    - **존재하지 않는 번호는 절대 사용하지 마세요** (예: 데이터 0~7만 있는데 [SOURCE:15] 사용 금지)
-    - 반드시 숫자만 사용하고 "데이터", "문서" 등의 단어는 사용하지 마세요
-    - 여러 출처는 쉼표와 공백으로 구분: [SOURCE:1, 4, 8]
-    - 단일 출처: [SOURCE:8]
-    - SOURCE 태그는 완전한 문장이 끝난 후 바로 붙여서 작성하세요
-    - SOURCE 태그 앞뒤로 줄바꿈하지 마세요 (스트리밍 청크 분할 방지)
-
-    **올바른 예시** (데이터 0, 3, 8이 주어진 경우):
-    - "**매출이 증가했습니다** [SOURCE:8]"
-    - "시장 점유율이 상승했습니다 [SOURCE:3]"
-    - "**매출이 5% 감소했습니다** [SOURCE:0, 3, 8]"
-
-    **🚫 절대 금지되는 잘못된 예시**:
-    - [SOURCE:데이터 1], [SOURCE:문서 1] (단어 포함 금지)
-    - [SOURCE:1,\n4, 8] (줄바꿈 금지)
-    - [SOURCE: 1 , 4 , 8] (불필요한 공백 금지)
-    - [SOURCE:15] (위 참고 데이터에 없는 번호 사용 금지)
-
-    **⚠️ 최종 체크리스트 (반드시 확인)**:
-    □ **굵은 글씨**가 문단당 2개 이상 사용되었는가?
-    □ *기울임체*가 적절히 사용되었는가?
-    □ 3개 이상 비교 시 테이블을 사용했는가?
-    □ 중요한 결론에 `> **핵심 요약**:` 블록쿼트를 사용했는가?
-    □ [SOURCE:숫자] 형식으로 출처를 정확히 표기했는가?
-    □ 단락 간 공백 라인이 있는가?
-
-    **🚫 절대 금지 사항**:
-    ❌ "추가 정보 요청", "더 많은 데이터가 필요합니다", "구체적인 데이터 부족" 등의 표현 사용 금지
-    ❌ "...에 대한 추가 분석이 필요합니다" 같은 미완성 결론 제시 금지
-    ✅ **현재 확보된 데이터로 최대한 구체적이고 완전한 분석 및 결론 제시 필수**
-    ✅ 부족한 정보가 있어도 현재 데이터 기반으로 최선의 인사이트와 표 제공
-
-    **⭐ 지금 바로 위 체크리스트를 모두 만족하는 마크다운 형식으로 섹션을 작성하세요:**
-
-    **보고서 섹션 내용**:
-    """
-
-            prompt = prompt_template.format(
-                persona_instruction=persona_instruction,
-                original_query=original_query,
-                section_title=section_title,
-                awareness_context=awareness_context,
-                description=description,
-                section_data_content=section_data_content
-            )
+            system_prompt = self._get_section_system_prompt(persona_name, "synthesis")
 
         else:  # "full_data_for_chart"
-            section_data_content = ""
-            for actual_index in use_indexes:
-                if actual_index in full_data_dict:
-                    data_info = full_data_dict[actual_index]
-                    section_data_content += f"**데이터 {actual_index}: {data_info['source']}**\n"
-                    section_data_content += f"- **제목**: {data_info['title']}\n"
-                    section_data_content += f"- **내용**: {data_info['content']}\n"
-                    section_data_content += f"- **출처_링크**: {data_info.get('url') or data_info.get('source_url', '')}\n\n"
-
-            prompt_template = """
-            {persona_instruction}
-
-    당신은 데이터 분석가이자 보고서 작성가입니다. 위의 페르소나 지침을 따라서, 주어진 데이터를 분석하여 텍스트 설명과 시각적 차트를 결합한 전문가 수준의 보고서 섹션을 작성합니다.
-
-    **사용자의 전체 질문**: "{original_query}"
-
-    ---
-    **[매우 중요] 전체 보고서 구조 및 당신의 역할**:
-    당신은 아래 구조로 구성된 전체 보고서에서 **오직 '{section_title}' 섹션만**을 책임지고 있습니다.
-    다른 전문가들이 나머지 섹션들을 동시에 작성하고 있으므로, **다른 섹션의 주제를 절대 침범하지 말고 당신의 역할에만 집중하세요.**
-
-    {awareness_context}
-    ---
-
-    **현재 작성할 섹션 제목**: "{section_title}"
-    **섹션 목표**: "{description}"
-
-    **참고 데이터 (실제 인덱스 번호 포함)**:
-    {section_data_content}
-
-    **작성 지침 (매우 중요)**:
-    1. **역할 준수**: 위 '전체 보고서 구조'와 '핵심 목표'를 반드시 인지하고, '{section_title}'에 해당하는 내용만 깊이 있게 작성하세요.
-    2. **페르소나 역할 유지**: 당신의 역할과 말투, 분석 관점을 반드시 유지하며 작성하세요.
-    3. **간결성 유지**: 반드시 1~2 문단 이내로, 데이터에서 가장 중요한 인사이트와 분석 내용만 간결하게 요약하여 작성하세요.
-    4. **제목 반복 금지**: 주어진 섹션 제목을 절대 반복해서 출력하지 마세요. 바로 본문 내용으로 시작해야 합니다.
-    5. **데이터 기반**: 설명에 구체적인 수치, 사실, 통계 자료를 적극적으로 인용하여 신뢰도를 높이세요.
-    6. **차트 마커 삽입**: 텍스트 설명의 흐름 상, 시각적 데이터가 필요한 적절한 위치에 [GENERATE_CHART] 마커를 한 줄에 단독으로 삽입하세요.
-    7. **서술 계속**: 마커를 삽입한 후, 이어서 나머지 텍스트 설명을 자연스럽게 계속 작성하세요.
-    8. **노션 스타일 마크다운 적극 활용**: 굵은 글씨, 기울임체, 인용문, 목록, 테이블 등을 적절히 사용하세요.
-    - **인용문(>) 사용 시점**:
-     - **핵심 인사이트나 결론**: 섹션의 가장 중요한 발견사항이나 결론
-     - **주요 통계나 수치**: 특별히 강조해야 할 중요한 데이터
-     - **전문가 의견이나 분석**: 페르소나 관점에서의 핵심 판단이나 견해
-     - **경고나 주의사항**: 독자가 반드시 알아야 할 중요한 정보
-     - **해당 섹션에 대한 요약** : 해당 섹션에 대한 요약이 필요할 때 사용
-     - **인용문 사용 예시**:
-      - > 2024년 4분기 시장 규모가 전년 동기 대비 15% 급감하여 즉각적인 대응이 필요합니다.
-      - > 데이터 분석 결과, A 전략이 B 전략 대비 ROI가 3배 높은 것으로 확인되었습니다.
-    - **표 형태 데이터**: 비교나 분류가 필요한 정보는 마크다운 테이블로 구성
-    - 3개 이상의 항목을 비교하거나 분류할 때 테이블 사용 권장
-    - 테이블 셀 안에서도 **굵은 글씨**, *기울임체*, [SOURCE:숫자] 출처 표기 가능
-    9. **출처 표기 (데이터 인덱스 번호 사용)**: 특정 정보를 참고하여 작성한 문장 바로 뒤에 [SOURCE:숫자1, 숫자2, 숫자3] 형식으로 출처를 표기하세요.
-
-
-    **매우 중요 - SOURCE 번호 사용 규칙**:
-    - **반드시 위 "참고 데이터"에 명시된 "[데이터 인덱스 X]" 의 X 번호만 사용하세요**
-    - 예: "데이터 0", "데이터 3", "데이터 7"이 주어졌다면 → [SOURCE:0], [SOURCE:3], [SOURCE:7]만 사용 가능
-    - **존재하지 않는 번호는 절대 사용하지 마세요** (예: 데이터 0~7만 있는데 [SOURCE:15] 사용 금지)
-    - 반드시 숫자만 사용하고 "데이터", "문서" 등의 단어는 사용하지 마세요
-
-    **올바른 예시** (데이터 0, 3, 8이 주어진 경우):
-    - "**시장 규모가 10% 증가**했습니다. [SOURCE:8]"
-    - "**매출이 5% 감소**했습니다. [SOURCE:0, 3, 8]"
-
-    **절대 금지되는 잘못된 예시**:
-    - [SOURCE:데이터 8], [SOURCE:문서 8] (단어 포함 금지)
-    - [SOURCE:15] (위 참고 데이터에 없는 번호 사용 금지)
-
-    **절대 금지 사항**:
-    "추가 정보 요청", "더 많은 데이터가 필요합니다", "구체적인 데이터 부족" 등의 표현 사용 금지
-    "...에 대한 추가 분석이 필요합니다" 같은 미완성 결론 제시 금지
-    "데이터가 제한적입니다", "정확한 목록 작성을 위해서는..." 등의 한계 언급 금지
-    **현재 확보된 데이터로 최대한 구체적이고 완전한 분석 및 결론 제시 필수**
-    부족한 정보가 있어도 현재 데이터 기반으로 최선의 인사이트와 표 제공
-    표 요청이 있으면 현재 데이터로 가능한 한 완전한 표 작성
-
-    **보고서 섹션 본문**:
-    """
-
-            prompt = prompt_template.format(
-                persona_instruction=persona_instruction,
-                original_query=original_query,
-                section_title=section_title,
-                awareness_context=awareness_context,
-                description=description,
-                section_data_content=section_data_content
-            )
+            data_blocks = self._get_data_blocks(full_data_dict, content_type, state)
+            section_data_content = "".join([data_blocks[idx] for idx in use_indexes if idx in data_blocks])
+
+            system_prompt = self._get_section_system_prompt(persona_name, "full_data_for_chart")
+
+        # 보고서 전체 구조는 모든 섹션에 공통이므로 system 끝에 붙여 prefix 캐시 범위에 포함
+        awareness_block = state.get("_awareness_context_rendered") if state else None
+        if awareness_block is None:
+            awareness_block = self.render_awareness_context(awareness_context)
+        if awareness_block:
+            system_prompt = system_prompt + "\n" + awareness_block
+
+        # 정적 지침은 system, 섹션마다 달라지는 값은 user 메시지 끝에 배치
+        user_prompt = SECTION_USER_TEMPLATE.format(
+            original_query=original_query,
+            section_title=section_title,
+            description=description,
+            section_data_content=section_data_content
+        )
+        prompt = [("system", system_prompt), ("human", user_prompt)]
+        # 같은 페르소나·섹션 유형은 system prefix가 동일하므로 같은 캐시 키 사용
+        cache_key = f"section:{persona_name}:{content_type}"
 
         try:
-            print(f"\n>> 섹션 스트리밍 시작: {section_title} (사용 인덱스: {use_indexes})")
-            total_content = ""
+            logger.info(">> 섹션 스트리밍 시작: %s (사용 인덱스: %s)", section_title, use_indexes)
+            # 청크 본문은 바로 흘려보내고 길이/공백 여부만 집계 (누적 문자열을 만들지 않음)
+            total_length = 0
+            has_text = False
             chunk_count = 0
             valid_content_count = 0
 
@@ -2772,54 +3731,56 @@ class ProcessorAgent:
                 prompt,
                 self.llm_pro,
                 self.llm_pro_backup,
-                self.llm_openai_4o
+                self.llm_openai_4o,
+                cache_key=cache_key
             ):
                 chunk_count += 1
-                if hasattr(chunk, 'content') and chunk.content:
-                    total_content += chunk.content
-                    chunk_text = chunk.content
+                chunk_text = getattr(chunk, 'content', None)
+                if chunk_text:
+                    total_length += len(chunk_text)
+                    has_text = has_text or not chunk_text.isspace()
                     valid_content_count += 1
 
-                    print(f"- 원본 청크 {chunk_count}: {len(chunk_text)} 문자")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("- 원본 청크 %s: %s 문자", chunk_count, len(chunk_text))
 
-                    # 5자 단위로 쪼개서 전송
-                    for i in range(0, len(chunk_text), 5):
-                        mini_chunk = chunk_text[i:i+5]
-                        yield mini_chunk
+                    # 청크를 그대로 전송 (flush 단위 조절은 Orchestrator의 버퍼가 담당)
+                    yield chunk_text
 
-            print(f"\n>> 섹션 완료: {section_title}, 총 {chunk_count}개 원본 청크, {valid_content_count}개 유효 청크, {len(total_content)} 문자")
+            logger.info(">> 섹션 완료: %s, 총 %s개 원본 청크, %s개 유효 청크, %s 문자", section_title, chunk_count, valid_content_count, total_length)
 
-            if not total_content.strip() or valid_content_count == 0:
-                print(f"- 섹션 스트리밍 오류 ({section_title}): No generation chunks were returned")
+            if not has_text:
+                logger.warning("- 섹션 스트리밍 오류 (%s): No generation chunks were returned", section_title)
                 raise Exception("No generation chunks were returned")
 
         except Exception as e:
-            print(f"- 섹션 스트리밍 오류 ({section_title}): {e}")
+            logger.warning("- 섹션 스트리밍 오류 (%s): %s", section_title, e)
             if "No generation chunks" in str(e) or "no valid content" in str(e).lower():
                 try:
-                    print(f"- OpenAI로 직접 재시도: {section_title}")
-                    total_content = ""
+                    logger.info("- OpenAI로 직접 재시도: %s", section_title)
+                    total_length = 0
+                    has_text = False
                     chunk_count = 0
 
-                    async for chunk in self.llm_openai_4o.astream(prompt):
+                    async for chunk in self.llm_openai_4o.astream(prompt, **self._cache_kwargs(self.llm_openai_4o, cache_key)):
                         chunk_count += 1
-                        if hasattr(chunk, 'content') and chunk.content:
-                            total_content += chunk.content
-                            chunk_text = chunk.content
-                            print(f"- OpenAI 재시도 청크 {chunk_count}: {len(chunk_text)} 문자")
+                        chunk_text = getattr(chunk, 'content', None)
+                        if chunk_text:
+                            total_length += len(chunk_text)
+                            has_text = has_text or not chunk_text.isspace()
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("- OpenAI 재시도 청크 %s: %s 문자", chunk_count, len(chunk_text))
 
-                            for i in range(0, len(chunk_text), 5):
-                                mini_chunk = chunk_text[i:i+5]
-                                yield mini_chunk
+                            yield chunk_text
 
-                    print(f"- OpenAI 재시도 완료: {section_title}, {chunk_count}개 청크, {len(total_content)} 문자")
+                    logger.info("- OpenAI 재시도 완료: %s, %s개 청크, %s 문자", section_title, chunk_count, total_length)
 
-                    if not total_content.strip():
-                        print(f"- OpenAI 재시도도 실패, fallback 내용 생성")
+                    if not has_text:
+                        logger.warning("- OpenAI 재시도도 실패, fallback 내용 생성")
                         raise Exception("OpenAI retry also failed")
 
                 except Exception as retry_error:
-                    print(f"- OpenAI 재시도 실패: {retry_error}")
+                    logger.warning("- OpenAI 재시도 실패: %s", retry_error)
                     fallback_content = f"*'{section_title}' 섹션에 대한 상세한 분석을 생성하는 중 문제가 발생했습니다.*\n\n"
                     yield fallback_content
             else:
@@ -2828,9 +3789,9 @@ class ProcessorAgent:
 
     async def _create_charts(self, section_data: List[SearchResult], section_title: str, generated_content: str = "", description: str = "", yield_callback=None, state: Dict[str, Any] = None):
         """⭐ 수정: 페르소나 관점을 반영하여 섹션별 선택된 데이터와 생성된 내용을 바탕으로 정확한 차트 생성"""
-        print(f"  - 차트 데이터 생성: '{section_title}' (데이터 {len(section_data)}개)")
+        logger.info("  - 차트 데이터 생성: '%s' (데이터 %s개)", section_title, len(section_data))
         if description:
-            print(f"  - 섹션 목표: '{description}'")
+            logger.debug("  - 섹션 목표: '%s'", description)
 
         # 현재 날짜 정보 추가
         import pytz
@@ -2840,11 +3801,12 @@ class ProcessorAgent:
         # 주어진 데이터로만 차트 생성 (추가 검색 없음)
 
         # 페르소나 정보 추출
-        persona_name = state.get("persona", "기본") if state else "기본"
-        default_chart_prompt = "주어진 데이터를 바탕으로 가장 명확하고 유용한 Chart.js 차트를 생성해주세요."
-        persona_chart_instruction = self.personas.get(persona_name, {}).get("chart_prompt", default_chart_prompt)
+        persona_name = (state.get("persona_name") or state.get("persona", "기본")) if state else "기본"
+        persona_chart_instruction = state.get("persona_chart_prompt") if state else None
+        if persona_chart_instruction is None:
+            persona_chart_instruction = self.personas.get(persona_name, {}).get("chart_prompt", DEFAULT_CHART_PROMPT)
 
-        print(f"  - 차트 생성에 '{persona_name}' 페르소나 관점 적용 (차트용 프롬프트 사용)")
+        logger.debug("  - 차트 생성에 '%s' 페르소나 관점 적용 (차트용 프롬프트 사용)", persona_name)
 
 
         # 차트 생성 context 추출
@@ -2856,396 +3818,48 @@ class ProcessorAgent:
             """실제 차트 생성 로직 (재시도 가능)"""
             try:
                 # 데이터 요약 생성
-                data_summary = ""
-                for i, item in enumerate(current_data):
-                    source = getattr(item, 'source', 'Unknown')
-                    title = getattr(item, 'title', 'No Title')
-                    content = getattr(item, 'content', '')[:]
-                    data_summary += f"[{i}] [{source}] {title}\n내용: {content}...\n\n"
+                data_summary = "".join([
+                    f"[{i}] [{getattr(item, 'source', 'Unknown')}] {getattr(item, 'title', 'No Title')}\n내용: {getattr(item, 'content', '')[:CHART_DATA_CONTENT_CHARS]}...\n\n"
+                    for i, item in enumerate(current_data)
+                ])
 
                 # 직전에 생성된 보고서 내용 추가
-                context_info = ""
+                context_parts = []
                 if generated_content:
-                    content_preview = generated_content[:] if generated_content else ""
-                    context_info = f"\n**직전에 생성된 보고서 내용 (차트와 일맥상통해야 함)**:\n{content_preview}\n"
+                    context_parts.append(f"\n**직전에 생성된 보고서 내용 (차트와 일맥상통해야 함)**:\n{generated_content[:CHART_GENERATED_PREVIEW_CHARS]}\n")
 
                 # 이전 차트 정보 추가
                 if previous_charts:
-                    context_info += "\n**이전 섹션에서 생성된 차트들 (중복 방지를 위해 참고)**:\n"
+                    context_parts.append("\n**이전 섹션에서 생성된 차트들 (중복 방지를 위해 참고)**:\n")
                     for prev_chart in previous_charts[-2:]:  # 최근 2개만
                         chart_section = prev_chart.get("section", "")
                         chart_type = prev_chart.get("chart", {}).get("type", "")
-                        chart_labels = prev_chart.get("chart", {}).get("data", {}).get("labels", [])[:]
-                        context_info += f"- {chart_section}: {chart_type} 차트 (항목: {', '.join(map(str, chart_labels))}...)\n"
-                    context_info += "\n"
-
-                chart_prompt = f"""
-        당신은 데이터의 **관련성**을 판단하고 **의미 있는 시각화**를 만드는 데이터 시각화 전문가입니다.
-
-        ---
-
-        **[PART 1: 입력 정보]**
-        당신이 분석해야 할 정보는 다음과 같습니다.
-
-        1.  **생성 목표:** '{section_title}'에 대한 차트 생성
-        1.1. **섹션 목표:** '{description}'
-        2.  **현재 날짜:** {current_date_str}
-        3.  **페르소나:** '{persona_name}' (시도: {attempt}회차)
-        4.  **참고 컨텍스트:**
-            - 이전에 생성된 텍스트: {context_info}
-            - 이전에 생성된 차트: (중복 방지용)
-        5.  **분석할 원본 데이터:**
-        {data_summary}
-
-        ---
-
-        **[PART 2: 수행할 명령]**
-        이제, 다음 3단계 사고 프로세스에 따라 명령을 **반드시 순서대로** 수행하세요.
-
-        **STEP 1: 상세 데이터 분석 및 차트 아이디어 구상**
-        - `[PART 1]`의 정보를 바탕으로 시각화할 데이터(항목, 수치, 라벨)를 최대한 추출하고, 만들 수 있는 차트의 주제를 구체화합니다.
-        - 이 과정은 아래 **`분석 템플릿`**을 채우는 방식으로 진행합니다.
-
-        **STEP 2: 주제 일관성 검증**
-        - **질문:** "STEP 1에서 구상한 차트 주제가 `[PART 1]`의 **생성 목표**인 '{section_title}'및 **섹션 목표**인 '{description}'과 직접적으로 관련이 있습니까?"
-        - 이 질문에 대해 **"답변 (Yes/No)"**과 **"근거"**를 명확히 결정합니다.
-
-        **STEP 3: 조건부 JSON 출력**
-        - **만약 STEP 2의 답변이 'No'라면:** **`PLACEHOLDER_JSON`**을 출력합니다.
-        - **만약 STEP 2의 답변이 'Yes'라면:** **`실제 차트 JSON`**을 생성하여 출력합니다.
-
-        ---
-
-        **[PART 3: 출력 형식 및 가이드]**
-        최종 결과물은 아래 가이드에 따라 **'분석'**과 **'JSON'** 두 부분으로 구성되어야 합니다.
-
-        **1. 분석 (Analysis Block):**
-        - STEP 1과 STEP 2에서 당신이 생각한 과정을 아래 `분석 템플릿`에 맞춰 작성합니다.
-        - Vector DB 데이터가 불분명할 수 있으니, 섹션 제목과 데이터 내용을 종합적으로 추론해야 합니다.
-
-        분석:
-        1. 상세 분석 및 아이디어 (STEP 1):
-            (1) 컨텍스트 추론:
-                - 섹션 제목 "{section_title}"과 **섹션 목표 "{description}"**을 보고 이 데이터가 무엇에 관한 통계인지 추론
-                - 단위 정보 (원/20개, 원/50개 등)를 보고 어떤 상품/품목인지 추론
-                - 출처 URL이나 문서명에서 추가 힌트 찾기
-                - 추론된 품목/상품: [예: 계란, 배추, 쌀 등]
-
-            (2) 섹션 목적: [이 섹션이 보여주려는 핵심 내용, **섹션 목표**를 기반으로 작성]
-
-            (3) 추출 가능한 수치 데이터:
-                - 항목A: [정확한 수치] + [추론된 의미] (출처: 데이터 인덱스 X)
-                - 항목B: [정확한 수치] + [추론된 의미] (출처: 데이터 인덱스 Y)
-                - 항목C: [정확한 수치] + [추론된 의미] (출처: 데이터 인덱스 Z)
-
-            (4) 추출된 라벨/카테고리: [실제 연도, 월, 지역명 등]
-
-            (5) 최적 차트 타입: [아래 지원 차트 타입에서만 선택]
-
-            (6) 차트 구성:
-                - X축: [추론된 품목명의 시간/지역/카테고리]
-                - Y축: [추론된 품목명의 가격/수량 + 단위]
-                - 데이터셋: [의미있는 라벨들과 해당 수치들]
-                - **범례 전략**: 여러 카테고리 비교시 각각을 별도 데이터셋으로 구성!
-
-        2. 주제 일관성 검증 (STEP 2):
-            - 답변: [Yes 또는 No]
-            - 근거: [예: '미생물 발효 R&D'와 '호주 기업 설립 연도'는 전혀 다른 주제이므로 No. 섹션 목표는 R&D 동향 분석인데, 기업 설립 연도는 관련성이 낮음.]
-
-            **중요**: 관련성이 낮아도 데이터에서 숫자나 항목을 추출할 수 있다면 "부분적 Yes"로 처리하여 차트 생성 시도!
-
+                        chart_labels = prev_chart.get("chart", {}).get("data", {}).get("labels", [])[:CHART_PREV_LABELS]
+                        context_parts.append(f"- {chart_section}: {chart_type} 차트 (항목: {', '.join(map(str, chart_labels))}...)\n")
+                    context_parts.append("\n")
+                context_info = "".join(context_parts)
+
+                chart_prompt = CHART_GENERATION_PROMPT_TEMPLATE.format(
+                    section_title=section_title,
+                    description=description,
+                    current_date_str=current_date_str,
+                    persona_name=persona_name,
+                    attempt=attempt,
+                    context_info=context_info,
+                    data_summary=data_summary
+                )
 
-        **2. JSON (JSON Block):**
-        - 위 '분석' 블록 바로 다음에, STEP 3의 규칙에 따라 아래 두 JSON 중 하나를 출력합니다.
-
-        **[PLACEHOLDER_JSON]**
-        ```json
-        {{
-            "type": "placeholder",
-            "labels": ["'{section_title}' 관련 데이터 부족"],
-            "datasets": [{{"label": "데이터 분석 불가", "data": [0], "backgroundColor": ["#FFB1C1"]}}],
-            "title": "관련 데이터 부족",
-            "palette": "modern",
-            "options": {{"responsive": true, "plugins": {{"title": {{"display": true, "text": "현재 섹션 주제와 일치하는 데이터가 부족하여 차트를 생성할 수 없습니다."}}}}}}
-        }}
-        ```
-
-        **[실제 차트 JSON 생성 가이드]**
-
-        **중요: 지원되는 차트 타입만 사용하세요!**
-        **기본 지원 차트 타입**:
-        - line, bar, pie, doughnut, radar, polararea, scatter, bubble
-
-        **확장 지원 차트 타입**:
-        - area (Line 컴포넌트 + fill 옵션)
-        - column (Bar 컴포넌트)
-        - donut (Doughnut 컴포넌트)
-        - polar (PolarArea 컴포넌트)
-        - horizontalbar (Bar 컴포넌트)
-        - stacked (Bar 컴포넌트 + stack 옵션)
-        - mixed (Line 컴포넌트)
-        - funnel (Bar 컴포넌트)
-        - waterfall (Bar 컴포넌트)
-        - gauge (Doughnut 컴포넌트)
-        - timeseries (Line 컴포넌트)
-        - timeline (Line 컴포넌트)
-        - gantt (Bar 컴포넌트)
-        - multiline (Line 컴포넌트)
-        - groupedbar (Bar 컴포넌트)
-        - stackedarea (Line 컴포넌트)
-        - combo (Line 컴포넌트)
-        - heatmap (Bar 컴포넌트)
-        - treemap (Bar 컴포넌트)
-        - sankey (Bar 컴포넌트)
-        - candlestick (Line 컴포넌트)
-        - violin (Bar 컴포넌트)
-        - boxplot (Bar 컴포넌트)
-
-        **지원하지 않는 타입들 (절대 사용 금지)**:
-        - groupedbarchart (올바른 타입: groupedbar)
-        - 기타 존재하지 않는 타입명들
-
-        **선택 기준**:
-        - 카테고리별 비교 → **bar**, **column**, **horizontalbar**
-        - 그룹화된 비교 → **groupedbar**, **stacked**
-        - 시간 변화 → **line**, **timeseries**, **timeline**, **area**
-        - 비율/구성 → **pie**, **doughnut**, **donut**
-        - 다차원 비교 → **radar**, **polar**
-        - 관계 분석 → **scatter**, **bubble**
-        - 복합 차트 → **mixed**, **combo**
-        - 특수 목적 → **funnel**, **waterfall**, **gauge**, **heatmap**
-
-        **올바른 색상 및 라벨링 규칙 - 범례 문제 해결**:
-
-        **중요: 카테고리별 비교 시 반드시 다중 데이터셋 사용!**
-
-        **잘못된 방법 (범례 1개만 나옴)**:
-        ```json
-        {{
-            "type": "bar",
-            "data": {{
-                "labels": ["미국", "일본"],
-                "datasets": [{{
-                    "label": "2023년 스낵 시장 규모",
-                    "data": [71000, 11330],
-                    "backgroundColor": ["#4F46E5", "#7C3AED"]
-                }}]
-            }}
-        }}
-        ```
-
-        **올바른 방법 (각 카테고리별 범례 표시)**:
-        ```json
-        {{
-            "type": "bar",
-            "data": {{
-                "labels": ["시장 규모"],
-                "datasets": [
-                    {{
-                        "label": "미국",
-                        "data": [71000],
-                        "backgroundColor": "#4F46E5"
-                    }},
-                    {{
-                        "label": "일본",
-                        "data": [11330],
-                        "backgroundColor": "#7C3AED"
-                    }}
-                ]
-            }}
-        }}
-        ```
-
-        **데이터 구조 변환 규칙**:
-
-        **지역/국가별 비교 → 각각을 별도 데이터셋으로**
-        **시계열 비교 → 각 시점을 별도 데이터셋으로**
-        **제품/카테고리 비교 → 각각을 별도 데이터셋으로**
-
-        **다양한 비교 케이스별 올바른 구조**:
-
-        **1. 지역별 비교**:
-        ```json
-        {{
-            "type": "bar",
-            "data": {{
-                "labels": ["시장 규모"],
-                "datasets": [
-                    {{"label": "미국", "data": [값1], "backgroundColor": "#4F46E5"}},
-                    {{"label": "중국", "data": [값2], "backgroundColor": "#7C3AED"}},
-                    {{"label": "일본", "data": [값3], "backgroundColor": "#EC4899"}}
-                ]
-            }}
-        }}
-        ```
-
-        **2. 연도별 비교**:
-        ```json
-        {{
-            "type": "bar",
-            "data": {{
-                "labels": ["성장률"],
-                "datasets": [
-                    {{"label": "2022년", "data": [값1], "backgroundColor": "#4F46E5"}},
-                    {{"label": "2023년", "data": [값2], "backgroundColor": "#7C3AED"}},
-                    {{"label": "2024년", "data": [값3], "backgroundColor": "#EC4899"}}
-                ]
-            }}
-        }}
-        ```
-
-        **3. 제품별 비교**:
-        ```json
-        {{
-            "type": "bar",
-            "data": {{
-                "labels": ["매출"],
-                "datasets": [
-                    {{"label": "제품A", "data": [값1], "backgroundColor": "#4F46E5"}},
-                    {{"label": "제품B", "data": [값2], "backgroundColor": "#7C3AED"}},
-                    {{"label": "제품C", "data": [값3], "backgroundColor": "#EC4899"}}
-                ]
-            }}
-        }}
-        ```
-
-        **4. 단일 항목의 시간 변화 (이 경우만 단일 데이터셋)**:
-        ```json
-        {{
-            "type": "line",
-            "data": {{
-                "labels": ["2021", "2022", "2023", "2024"],
-                "datasets": [{{
-                    "label": "성장 추세",
-                    "data": [100, 120, 150, 180],
-                    "borderColor": "#4F46E5",
-                    "backgroundColor": "#4F46E520"
-                }}]
-            }}
-        }}
-        ```
-
-        **차트 타입별 데이터 구조 가이드**:
-
-        **stacked 차트**:
-        ```json
-        {{
-            "type": "stacked",
-            "data": {{
-                "labels": ["Q1", "Q2", "Q3"],
-                "datasets": [
-                    {{"label": "제품A", "data": [10, 20, 30], "backgroundColor": "#4F46E5"}},
-                    {{"label": "제품B", "data": [15, 25, 35], "backgroundColor": "#EC4899"}}
-                ]
-            }}
-        }}
-        ```
-
-        **timeseries/timeline 차트**:
-        ```json
-        {{
-            "type": "timeseries",
-            "data": {{
-                "labels": ["2023-01", "2023-02", "2023-03"],
-                "datasets": [{{
-                    "label": "월별 데이터",
-                    "data": [100, 150, 200],
-                    "borderColor": "#4F46E5",
-                    "backgroundColor": "#4F46E520"
-                }}]
-            }}
-        }}
-        ```
-
-        **추천 색상 팔레트**:
-        - 메인: ["#4F46E5", "#7C3AED", "#EC4899", "#EF4444", "#F59E0B"]
-        - 보조: ["#06B6D4", "#10B981", "#84CC16", "#F97316", "#8B5CF6"]
-
-        **차트 생성 우선 원칙 - PLACEHOLDER 금지!**:
-
-        **1단계: 직접 수치 데이터 활용**
-        - 문서에서 금액, 개수, 비율, 점수 등 구체적 숫자가 있으면 즉시 차트화
-        - 예: "2023년 113억 3,070만 달러" → bar 차트로 연도별 수치
-
-        **2단계: 카테고리/항목 개수 차트화**
-        - 여러 항목이 나열되어 있으면 항목별 개수/빈도로 차트 생성
-        - 예: "일본 스낵, 저염 스낵, 세이버리 비스킷, 팝콘, 프레첼" → 5개 항목 bar 차트
-
-        **3단계: 지역/시간 정보 활용**
-        - 지역명 언급 → 지역별 분포 차트
-        - 연도/날짜 언급 → 시계열 차트
-        - 예: "미국, 중국, 동남아" 언급 → 3개 지역 pie 차트
-
-        **4단계: 추론 가능한 데이터 생성**
-        - 시장 규모 언급 → 상대적 크기 비교 차트
-        - 성장률 언급 → 증가 추세 라인 차트
-        - 점유율 언급 → 파이 차트
-
-        **5단계: 메타 정보 차트화**
-        - 문서 개수, 언급 횟수, 키워드 빈도
-        - 예: "3개 문서에서 언급" → 문서별 언급 횟수 차트
-
-        **창조적 차트 생성 예시**:
-        ```
-        - "일본, 미국, 동남아시아 시장" → {{"labels": ["일본", "미국", "동남아"], "data": [1, 1, 1]}}
-        - "2019년 이후 연평균 3.5% 감소" → {{"labels": ["2019", "2020", "2021", "2022"], "data": [100, 96.5, 93.2, 90.0]}}
-        - "5가지 트렌드 언급" → {{"labels": ["트렌드1", "트렌드2", "트렌드3", "트렌드4", "트렌드5"], "data": [1, 1, 1, 1, 1]}}
-        ```
-
-        **PLACEHOLDER는 다음 경우에만 (매우 예외적)**:
-        - 섹션 제목과 데이터가 완전히 무관한 경우만 (예: "자동차 산업" 섹션인데 데이터가 "요리 레시피"인 경우)
-        - 데이터가 완전히 비어있거나 의미없는 텍스트만 있는 경우
-
-        **데이터 추출 체크리스트**:
-        숫자가 하나라도 있는가? → 차트 생성!
-        항목이 2개 이상 나열되어 있는가? → 차트 생성!
-        지역/국가명이 언급되는가? → 차트 생성!
-        연도/시기가 언급되는가? → 차트 생성!
-        비교 표현이 있는가? (더 크다, 증가, 감소 등) → 차트 생성!
-
-        **표준 JSON 형식**:
-        {{
-            "type": "STEP1분석_기반_차트타입",
-            "data": {{
-                "labels": ["STEP1추출_실제라벨1", "실제라벨2", "실제라벨3"],
-                "datasets": [{{
-                    "label": "STEP1정의_데이터셋명",
-                    "data": [STEP1추출_실제수치1, 실제수치2, 실제수치3],
-                    "backgroundColor": ["#4F46E5", "#7C3AED", "#EC4899", "#EF4444", "#F59E0B"],
-                    "borderColor": ["#4F46E5", "#7C3AED", "#EC4899", "#EF4444", "#F59E0B"],
-                    "borderWidth": 1
-                }}]
-            }},
-            "options": {{
-                "responsive": true,
-                "plugins": {{
-                    "title": {{
-                        "display": true,
-                        "text": "{section_title}"
-                    }},
-                    "legend": {{
-                        "display": true,
-                        "position": "top"
-                    }}
-                }},
-                "scales": {{
-                    "y": {{
-                        "beginAtZero": true,
-                        "title": {{
-                            "display": true,
-                            "text": "값 (단위)"
-                        }}
-                    }},
-                    "x": {{
-                        "title": {{
-                            "display": true,
-                            "text": "카테고리"
-                        }}
-                    }}
-                }}
-            }}
-        }}
-        """
+                # 같은 프롬프트로 이미 만든 차트가 있으면 LLM 호출 없이 재사용
+                cache_key = hashlib.blake2b(chart_prompt.encode("utf-8"), digest_size=16).hexdigest()
+                # 프롬프트 재료 문자열은 더 이상 쓰지 않으므로 바로 해제
+                del data_summary, context_parts, context_info
+                cached_chart = self._chart_cache.get(cache_key)
+                if cached_chart is not None:
+                    self._chart_cache.move_to_end(cache_key)
+                    logger.info("  - 차트 캐시 적중: '%s'", section_title)
+                    del chart_prompt
+                    yield _wrap_chart(copy.deepcopy(cached_chart))
+                    return
 
                 response = await self._invoke_with_fallback(
                     chart_prompt,
@@ -3254,347 +3868,61 @@ class ProcessorAgent:
                     self.llm_openai_mini
                 )
                 response_text = response.content.strip()
-
-                # JavaScript 함수 제거 헬퍼 함수 정의
-                def clean_js_functions(json_str):
-                    """JSON에서 JavaScript 함수 코드를 더 견고하게 제거"""
-                    import re
-
-                    # 1. 가장 안전한 방법: callbacks 객체 전체를 빈 객체로 교체
-                    # 중첩된 중괄호까지 모두 포함하여 제거
-                    def find_and_replace_callbacks(text):
-                        """callbacks 객체를 찾아서 빈 객체로 교체"""
-                        pattern = r'"callbacks"\s*:\s*\{'
-                        match = re.search(pattern, text)
-                        if not match:
-                            return text
-
-                        start_pos = match.start()
-                        brace_pos = text.find('{', match.end() - 1)
-
-                        if brace_pos == -1:
-                            return text
-
-                        # 중괄호 균형 맞추기
-                        brace_count = 1
-                        i = brace_pos + 1
-
-                        while i < len(text) and brace_count > 0:
-                            if text[i] == '{':
-                                brace_count += 1
-                            elif text[i] == '}':
-                                brace_count -= 1
-                            i += 1
-
-                        if brace_count == 0:
-                            # callbacks 객체 전체를 빈 객체로 교체
-                            before = text[:start_pos]
-                            after = text[i:]
-                            return before + '"callbacks": {}' + after
-
-                        return text
-
-                    # 2. callbacks 객체 교체
-                    json_str = find_and_replace_callbacks(json_str)
-
-                    # 3. 남은 function 패턴들 제거
-                    # function(...) { ... } 패턴을 null로 교체
-                    json_str = re.sub(r'function\s*\([^)]*\)\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', 'null', json_str, flags=re.DOTALL)
-
-                    # 4. 키-값에서 function으로 시작하는 값들 제거
-                    json_str = re.sub(r':\s*function\s*\([^)]*\)\s*\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', ': null', json_str, flags=re.DOTALL)
-
-                    # 5. 잘못된 JSON 구조 정리
-                    # null 뒤에 오는 잘못된 코드 패턴 제거
-                    json_str = re.sub(r'null\s+[^,}\]]*(?:if|let|var|return|context)[^,}\]]*', 'null', json_str, flags=re.DOTALL)
-
-                    # 6. 여러 줄에 걸친 함수 본문 정리
-                    json_str = re.sub(r'null\s*\n\s*if\s*\([^)]*\)\s*\{[^}]*\}\s*return[^;}]*;?\s*\}?', 'null', json_str, flags=re.DOTALL)
-
-                    # 7. 남은 JavaScript 코드 조각들 제거
-                    json_str = re.sub(r'if\s*\([^)]*\)\s*\{[^}]*\}', '', json_str, flags=re.DOTALL)
-                    json_str = re.sub(r'return\s+[^;}]*;?', '', json_str, flags=re.DOTALL)
-                    json_str = re.sub(r'let\s+\w+\s*=\s*[^;]*;', '', json_str, flags=re.DOTALL)
-                    json_str = re.sub(r'var\s+\w+\s*=\s*[^;]*;', '', json_str, flags=re.DOTALL)
-
-                    # 8. 빈 문자열이나 null 값들 정리
-                    json_str = re.sub(r',\s*null\s*,', ',', json_str)
-                    json_str = re.sub(r',\s*null\s*}', '}', json_str)
-                    json_str = re.sub(r'{\s*null\s*,', '{', json_str)
-
-                    # 9. 불완전한 구조 정리
-                    json_str = re.sub(r'\s*\n\s*\n\s*', '\n', json_str)  # 빈 줄 정리
-                    json_str = re.sub(r',\s*}', '}', json_str)  # trailing comma 제거
-                    json_str = re.sub(r',\s*]', ']', json_str)  # trailing comma 제거
-
-                    return json_str
-
-                # 간단하고 정확한 JSON 추출 함수
-                def extract_json_simple(text):
-                    """간단하고 정확한 JSON 추출"""
-                    # 1. ```json 블록에서 추출
-                    if "```json" in text:
-                        start = text.find("```json") + 7
-                        end = text.find("```", start)
-                        if end != -1:
-                            return text[start:end].strip()
-
-                    # 2. JSON: 다음에서 추출
-                    if "JSON:" in text:
-                        start = text.find("JSON:") + 5
-                        # 첫 번째 { 찾기
-                        json_start = text.find("{", start)
-                        if json_start == -1:
-                            return None
-
-                        # 균형잡힌 } 찾기
-                        brace_count = 0
-                        for i in range(json_start, len(text)):
-                            if text[i] == '{':
-                                brace_count += 1
-                            elif text[i] == '}':
-                                brace_count -= 1
-                                if brace_count == 0:
-                                    return text[json_start:i+1]
-
-                    # 3. 첫 번째 { }블록 추출
-                    json_start = text.find("{")
-                    if json_start == -1:
-                        return None
-
-                    brace_count = 0
-                    for i in range(json_start, len(text)):
-                        if text[i] == '{':
-                            brace_count += 1
-                        elif text[i] == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                return text[json_start:i+1]
-
-                    return None
+                # yield에서 소비자가 멈춰 있는 동안 프롬프트/응답 객체를 붙잡고 있지 않도록 해제
+                del chart_prompt, response
 
                 # COT 응답에서 JSON 추출
-                try:
-                    print(f"  - 원본 LLM 응답 (처음 500자): {response_text[:500]}...")
-                    print(f"  - 원본 응답 길이: {len(response_text)}자")
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    logger.debug("  - 원본 LLM 응답 (처음 500자): %s...", response_text[:500])
+                    logger.debug("  - 원본 응답 길이: %s자", len(response_text))
 
-                    # 간단한 JSON 추출 적용
-                    json_part = extract_json_simple(response_text)
+                json_part = None
+                try:
+                    # 간단한 JSON 추출 적용 (유효한 JSON이면 추출과 동시에 파싱까지 완료)
+                    json_part, chart_response = _extract_chart_json(response_text)
                     if not json_part:
-                        print(f"  - JSON 추출 실패: JSON 블록을 찾을 수 없음")
+                        logger.warning("  - JSON 추출 실패: JSON 블록을 찾을 수 없음")
                         raise ValueError("JSON 블록을 찾을 수 없음")
 
-                    print(f"  - JSON 추출 성공: {len(json_part)}자")
-
-                    print(f"  - 추출된 JSON 파트: {json_part[:300]}...")
-
-                    # JavaScript 함수 제거 (JSON 파싱 전에 실행)
-                    cleaned_json = clean_js_functions(json_part)
-                    print(f"  - JavaScript 함수 제거 후: {cleaned_json[:300]}...")
-
-                    # JSON 파싱
-                    chart_response = json.loads(cleaned_json)
-
-                    # 리스트 형태의 JSON 응답 처리
-                    if isinstance(chart_response, list) and len(chart_response) > 0:
-                        print(f"  - JSON 파싱 성공: 리스트 형태 ({len(chart_response)}개 항목), 첫 번째 항목 사용")
-                        chart_response = chart_response[0]  # 첫 번째 항목 사용
-                    elif isinstance(chart_response, dict):
-                        print(f"  - JSON 파싱 성공: 딕셔너리 형태")
-                    else:
-                        raise ValueError(f"올바르지 않은 JSON 형식: {type(chart_response)}")
-
-                    print(f"  - 차트 타입: {chart_response.get('type', 'unknown')}")
-                    print(f"  - insufficient_data 여부: {chart_response.get('insufficient_data', False)}")
-
-                    if chart_response.get('insufficient_data', False):
-                        print(f"  - 부족한 데이터 정보: {chart_response.get('missing_info', 'N/A')}")
-                        print(f"  - 제안된 검색어: {chart_response.get('suggested_search_query', 'N/A')}")
-
-                    # 이제 추가 검색은 보고서 구조 단계에서 처리됨
-
-                    # >> 정상적인 차트 데이터인 경우
-                    elif "type" in chart_response and "data" in chart_response:
-                        # 필수 필드 검증
-                        datasets = chart_response.get("data", {}).get("datasets", [])
-                        if datasets and len(datasets) > 0:
-                            data_points = datasets[0].get("data", [])
-                            if len(data_points) < 2:
-                                print(f"  - 경고: 차트 데이터 포인트가 부족함 ({len(data_points)}개)")
-
-                        # 콜백 함수 제거 (프론트엔드 오류 방지)
-                        def remove_callbacks(obj):
-                            if isinstance(obj, dict):
-                                # 콜백 함수 관련 키들 제거
-                                callback_keys = ['callback', 'callbacks', 'generateLabels']
-                                for key in list(obj.keys()):
-                                    if key in callback_keys:
-                                        del obj[key]
-                                    elif isinstance(obj[key], str) and 'function' in obj[key]:
-                                        del obj[key]
-                                    else:
-                                        remove_callbacks(obj[key])
-                            elif isinstance(obj, list):
-                                for item in obj:
-                                    remove_callbacks(item)
-
-                        remove_callbacks(chart_response)
-
-                        print(f"  - 차트 생성 성공: {chart_response['type']} 타입, {len(datasets)}개 데이터셋 (시도 {attempt})")
-                        yield {
-                            "type": "chart",
-                            "data": chart_response
-                        }
+                    if debug_enabled:
+                        logger.debug("  - JSON 추출 성공: %s자", len(json_part))
+                        logger.debug("  - 추출된 JSON 파트: %s...", json_part[:300])
+
+                    chart_response = _parse_chart_part(json_part, chart_response)
+                    tag = f"시도 {attempt}"
+
+                except ValueError as e:
+                    logger.warning("  - 차트 JSON 파싱 실패 (시도 %s): %s", attempt, e)
+                    if debug_enabled and json_part:
+                        logger.debug("  - 추출된 JSON 길이: %s자", len(json_part))
+                        logger.debug("  - JSON 시작: %s...", json_part[:200])
+                        logger.debug("  - JSON 끝: ...%s", json_part[-200:])
+
+                    # 간단한 재시도: 1차 추출 위치부터 다시 JSON 추출 시도
+                    chart_response = _retry_chart_parse(response_text, json_part)
+                    if chart_response is None:
+                        logger.warning("  - JSON 파싱 재시도도 실패, fallback 차트로 진행")
+                        del response_text, json_part
+                        yield _wrap_chart(_fallback_chart(section_title))
                         return
-                    else:
-                        raise ValueError("올바르지 않은 JSON 형식")
+                    tag = "재시도 성공"
 
-                except (json.JSONDecodeError, ValueError) as e:
-                    print(f"  - 차트 JSON 파싱 실패 (시도 {attempt}): {e}")
-                    print(f"  - 추출된 JSON 길이: {len(json_part)}자")
-                    print(f"  - JSON 시작: {json_part[:200]}...")
-                    print(f"  - JSON 끝: ...{json_part[-200:]}")
+                if chart_response.get('insufficient_data', False):
+                    # 이제 추가 검색은 보고서 구조 단계에서 처리됨
+                    logger.debug("  - 부족한 데이터 정보: %s", chart_response.get('missing_info', 'N/A'))
+                    logger.debug("  - 제안된 검색어: %s", chart_response.get('suggested_search_query', 'N/A'))
+                    return
 
-                    # 간단한 재시도: 전체 응답에서 다시 JSON 추출 시도
-                    retry_success = False
-                    try:
-                        print(f"  - JSON 파싱 재시도 중...")
-                        # 전체 응답에서 완전한 JSON 블록 찾기
-                        json_start = response_text.find("{")
-                        if json_start != -1:
-                            brace_count = 0
-                            for i in range(json_start, len(response_text)):
-                                if response_text[i] == '{':
-                                    brace_count += 1
-                                elif response_text[i] == '}':
-                                    brace_count -= 1
-                                    if brace_count == 0:
-                                        retry_json = response_text[json_start:i+1]
-                                        cleaned_retry = clean_js_functions(retry_json)
-                                        chart_response = json.loads(cleaned_retry)
-
-                                        # 리스트 형태의 JSON 응답 처리
-                                        if isinstance(chart_response, list) and len(chart_response) > 0:
-                                            print(f"  - 재시도: 리스트 형태 ({len(chart_response)}개 항목), 첫 번째 항목 사용")
-                                            chart_response = chart_response[0]
-
-                                        print(f"  - 재시도 JSON 파싱 성공! ({len(retry_json)}자)")
-                                        retry_success = True
-                                        break
-                    except Exception as retry_e:
-                        print(f"  - JSON 파싱 재시도도 실패: {retry_e}")
-
-                    # 재시도 성공한 경우 처리
-                    if retry_success:
-                        print(f"  - JSON 파싱 재시도 성공! 차트 생성 진행")
-
-                        # insufficient_data 체크
-                        if chart_response.get('insufficient_data', False):
-                            print(f"  - 부족한 데이터 정보: {chart_response.get('missing_info', 'N/A')}")
-                            print(f"  - 제안된 검색어: {chart_response.get('suggested_search_query', 'N/A')}")
-                            # 이제 추가 검색은 보고서 구조 단계에서 처리됨
-
-                        # 정상적인 차트 데이터인 경우
-                        elif "type" in chart_response and "data" in chart_response:
-                            # 필수 필드 검증
-                            datasets = chart_response.get("data", {}).get("datasets", [])
-                            if datasets and len(datasets) > 0:
-                                data_points = datasets[0].get("data", [])
-                                if len(data_points) < 2:
-                                    print(f"  - 경고: 차트 데이터 포인트가 부족함 ({len(data_points)}개)")
-
-                            # 콜백 함수 제거 (프론트엔드 오류 방지)
-                            def remove_callbacks(obj):
-                                if isinstance(obj, dict):
-                                    # 콜백 함수 관련 키들 제거
-                                    callback_keys = ['callback', 'callbacks', 'generateLabels']
-                                    for key in list(obj.keys()):
-                                        if key in callback_keys:
-                                            del obj[key]
-                                        elif isinstance(obj[key], str) and 'function' in obj[key]:
-                                            del obj[key]
-                                        else:
-                                            remove_callbacks(obj[key])
-                                elif isinstance(obj, list):
-                                    for item in obj:
-                                        remove_callbacks(item)
-
-                            remove_callbacks(chart_response)
-
-                            print(f"  - 차트 생성 성공: {chart_response['type']} 타입, {len(datasets)}개 데이터셋 (재시도 성공)")
-                            yield {
-                                "type": "chart",
-                                "data": chart_response
-                            }
-                            return
-                        else:
-                            print(f"  - 재시도 성공했지만 올바르지 않은 JSON 형식")
-
-                    print(f"  - JSON 파싱 재시도도 실패, fallback 차트로 진행")
-
-                    # 최종 fallback 차트
-                    yield {
-                        "type": "chart",
-                        "data": {
-                            "type": "bar",
-                            "data": {
-                                "labels": [f"{section_title} 관련 데이터"],
-                                "datasets": [{
-                                    "label": "정보 수집 상태",
-                                    "data": [1],
-                                    "backgroundColor": "rgba(255, 193, 7, 0.6)",
-                                    "borderColor": "rgba(255, 193, 7, 1)",
-                                    "borderWidth": 1
-                                }]
-                            },
-                            "options": {
-                                "responsive": True,
-                                "plugins": {
-                                    "title": {
-                                        "display": True,
-                                        "text": f"{section_title} - 데이터 분석 중"
-                                    }
-                                },
-                                "scales": {
-                                    "y": {
-                                        "beginAtZero": True,
-                                        "max": 2,
-                                        "ticks": {
-                                            "stepSize": 1
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+                # >> 정상적인 차트 데이터인 경우
+                chart_response = _finalize_chart_response(chart_response, tag)
+                del response_text, json_part
+                self._remember_chart(cache_key, chart_response)
+                yield _wrap_chart(chart_response)
 
             except Exception as e:
-                print(f"  - 차트 생성 전체 오류 (시도 {attempt}): {e}")
-                yield {
-                    "type": "chart",
-                    "data": {
-                        "type": "bar",
-                        "data": {
-                            "labels": ["시스템 오류"],
-                            "datasets": [{
-                                "label": "처리 상태",
-                                "data": [0],
-                                "backgroundColor": "rgba(220, 53, 69, 0.6)",
-                                "borderColor": "rgba(220, 53, 69, 1)",
-                                "borderWidth": 1
-                            }]
-                        },
-                        "options": {
-                            "responsive": True,
-                            "plugins": {
-                                "title": {
-                                    "display": True,
-                                    "text": "차트 생성 중 오류 발생"
-                                }
-                            }
-                        }
-                    }
-                }
+                logger.warning("  - 차트 생성 전체 오류 (시도 %s): %s", attempt, e)
+                yield _wrap_chart(copy.deepcopy(_ERROR_CHART_TEMPLATE))
 
         # >> 메인 로직 실행
         async for result in _generate_chart_with_data(section_data, attempt=1):
@@ -3,6 +3,7 @@ import json
 from datetime import datetime
 from typing import Dict, Optional, List, Any
 from ..database import ChatDatabase
+from ..utils.background_tasks import spawn_background_task
 from .models.models import StreamingAgentState
 
 
@@ -164,11 +165,10 @@ class RunManager:
 
         # WebSocket으로 중단 알림 전송
         if self.websocket_manager:
-            import asyncio
             try:
-                loop = asyncio.get_event_loop()
-                loop.create_task(
-                    self.websocket_manager.broadcast_abort_notification(run_id, reason)
+                spawn_background_task(
+                    self.websocket_manager.broadcast_abort_notification(run_id, reason),
+                    name=f"abort_notify:{run_id}"
                 )
             except Exception as e:
                 print(f"⚠️ WebSocket 중단 알림 전송 실패: {e}")
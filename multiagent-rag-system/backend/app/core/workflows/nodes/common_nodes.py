@@ -7,7 +7,6 @@ Shared nodes used across both chat and task flows:
 """
 
 import json
-import re
 from datetime import datetime
 from typing import Literal
 
@@ -15,6 +14,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.runnables import RunnableConfig
 
 from ..state import RAGState, log_state_transition
+from ....utils.json_utils import find_json_object
 
 
 # ============================================================================
@@ -89,9 +89,9 @@ JSON으로 응답:
             classification = json.loads(response_content)
         except json.JSONDecodeError:
             # Fallback: Extract JSON from markdown code block
-            json_match = re.search(r'\{.*\}', response_content, re.DOTALL)
-            if json_match:
-                classification = json.loads(json_match.group())
+            json_str = find_json_object(response_content)
+            if json_str:
+                classification = json.loads(json_str)
             else:
                 raise ValueError("Valid JSON not found in response")
 
@@ -806,3 +806,17 @@ class ChatDatabase:
             """, (message_id, status_message, step_number, total_steps))
 
             return cursor.lastrowid
+
+    def add_status_history_batch(self, entries: List[tuple]) -> int:
+        """(message_id, status_message, step_number, total_steps) 목록을 한 트랜잭션으로 저장"""
+        if not entries:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO status_history (
+                    message_id, status_message, step_number, total_steps
+                ) VALUES (?, ?, ?, ?)
+            """, entries)
+
+            return cursor.rowcount
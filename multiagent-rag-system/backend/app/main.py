@@ -1,10 +1,15 @@
 import sys
-import uuid
+import secrets
 import json
+import time
+import orjson
 import asyncio
 import os
 import logging
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import AsyncGenerator, Dict, Any, List, Optional
 
@@ -16,6 +21,9 @@ logging.getLogger("grpc").setLevel(logging.CRITICAL)
 logging.getLogger("grpc._cython").setLevel(logging.CRITICAL)
 logging.getLogger("grpc._cython.cygrpc").setLevel(logging.CRITICAL)
 
+# API 핸들러 오류 로그 (출력 설정은 lifespan에서 utils.logging_setup으로 한 번만 적용)
+logger = logging.getLogger(__name__)
+
 # asyncio 관련 BlockingIOError 완전 무시
 import asyncio
 asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
@@ -47,7 +55,7 @@ from utils.model_fallback import ModelFallbackManager
 # Pydantic과 FastAPI는 웹 서버 구성을 위해 필요합니다.
 from pydantic import BaseModel, Field
 from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
 
@@ -75,30 +83,31 @@ class SuppressGRPCErrors:
 check_api_keys()
 
 # 비동기 모델 사전 로드 (백그라운드에서 실행)
-async def preload_models_async():
-    """백그라운드에서 비동기적으로 모델을 미리 로드"""
+async def preload_models_async(executor: Optional[ThreadPoolExecutor] = None):
+    """백그라운드에서 비동기적으로 모델을 미리 로드 (executor가 없으면 기본 executor 사용)"""
     try:
         print("\n" + "="*50)
         print("🚀 백그라운드 모델 로딩 시작...")
         from .services.database.elasticsearch.elastic_search_rag_tool import get_hf_model, get_bge_reranker, get_qwen3_model
 
-        # 백그라운드에서 모델들을 순차적으로 로드
-        loop = asyncio.get_event_loop()
-
-        # 임베딩 모델 로드
-        print("📥 임베딩 모델 로드 중...")
-        await loop.run_in_executor(None, get_hf_model)
-        print("✅ 임베딩 모델 로드 완료!")
+        # 서로 독립적인 세 모델을 executor 스레드에서 동시에 로드
+        loop = asyncio.get_running_loop()
 
-        # 리랭킹 모델 로드
-        print("📥 리랭킹 모델 로드 중...")
-        await loop.run_in_executor(None, get_bge_reranker)
-        print("✅ 리랭킹 모델 로드 완료!")
+        async def _load(label, loader):
+            # 한 모델의 실패가 나머지 모델 로드를 중단시키지 않도록 개별 처리
+            print(f"📥 {label} 로드 중...")
+            try:
+                await loop.run_in_executor(executor, loader)
+                print(f"✅ {label} 로드 완료!")
+            except Exception as e:
+                print(f"⚠️ {label} 로드 실패 (서버는 계속 작동): {e}")
 
-        # Qwen3 모델도 백그라운드에서 로드 (선택사항)
-        print("📥 Qwen3 모델 로드 중...")
-        await loop.run_in_executor(None, get_qwen3_model)
-        print("✅ Qwen3 모델 로드 완료!")
+        await asyncio.gather(
+            _load("임베딩 모델", get_hf_model),
+            _load("리랭킹 모델", get_bge_reranker),
+            _load("Qwen3 모델", get_qwen3_model),  # 선택사항
+            _load("에이전트 모듈", _import_agent_modules),  # 첫 요청에서 임포트 비용을 치르지 않도록
+        )
 
         print("🎉 모든 모델 백그라운드 로딩 완료!")
         print("="*50 + "\n")
@@ -112,9 +121,7 @@ async def preload_models_async():
 
 # --- 모델 및 에이전트 클래스 임포트 ---
 # 기존 에이전트들을 그래프 형태로 개선하되 스트리밍 유지
-from .core.agents.orchestrator import TriageAgent, OrchestratorAgent
-from .core.agents.conversational_agent import SimpleAnswererAgent
-from .core.models.models import StreamingAgentState
+# (LLM/검색 스택을 끌어오는 에이전트 모듈은 첫 사용 시점에 임포트 - 아래 get_*_agent 참고)
 
 # LangGraph integration (Feature Flag controlled)
 USE_LANGGRAPH = os.getenv("USE_LANGGRAPH", "false").lower() == "true"
@@ -128,7 +135,21 @@ if USE_LANGGRAPH:
         print("   → 기존 시스템으로 Fallback")
 else:
     print("ℹ️  LangGraph 비활성화 (USE_LANGGRAPH=false or not set)")
-from .utils.session_logger import get_session_logger, session_logger, set_current_session
+from .utils.session_logger import get_session_logger, session_logger, set_current_session, get_current_session
+from .utils.async_cache import AsyncTTLCache
+from .utils.background_tasks import spawn_background_task
+from .utils.logging_setup import setup_logging
+
+# 초 단위로 캐시한 현재 시각 ISO 문자열 (요청마다 datetime.now() 포맷팅 반복 방지, 초 미만 정밀도 불필요)
+_iso_cache: tuple = (0, "")
+
+
+def _cached_iso_now() -> str:
+    global _iso_cache
+    sec = int(time.time())
+    if _iso_cache[0] != sec:
+        _iso_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _iso_cache[1]
 
 # StreamingAgentState를 Pydantic 모델로 재정의
 class StreamingAgentStateModel(BaseModel):
@@ -144,7 +165,7 @@ class StreamingAgentStateModel(BaseModel):
     # 필수 필드들 추가 (TypedDict와 호환성을 위해)
     conversation_id: str = ""
     user_id: str = ""
-    start_time: str = Field(default_factory=lambda: datetime.now().isoformat())
+    start_time: str = Field(default_factory=_cached_iso_now)
     current_step_index: int = 0
     step_results: list = Field(default_factory=list)
     execution_log: list = Field(default_factory=list)
@@ -155,58 +176,170 @@ class StreamingAgentStateModel(BaseModel):
 # --- Pydantic 모델 정의 ---
 class QueryRequest(BaseModel):
     query: str
-    session_id: str | None = Field(default_factory=lambda: str(uuid.uuid4()))
-    message_id: str | None = Field(default_factory=lambda: str(uuid.uuid4()))
+    # 고유성만 필요한 내부 ID이므로 UUID 객체 생성 없이 난수 hex 사용
+    session_id: str | None = Field(default_factory=lambda: secrets.token_hex(16))
+    message_id: str | None = Field(default_factory=lambda: secrets.token_hex(16))
     team_id: str | None = None  # 사용자가 선택한 팀 ID
     project_id: str | None = None  # 프로젝트 ID 추가
     conversation_history: List[Dict] | None = None  # 대화 히스토리 추가
 
 # --- FastAPI 애플리케이션 설정 ---
-app = FastAPI(
-    title="Intelligent RAG Agent System",
-    description="A sophisticated, multi-agent system for handling complex queries.",
-    version="3.0"
-)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# 서버 시작 이벤트에서 백그라운드 모델 로딩 시작
-@app.on_event("startup")
-async def startup_event():
+# 서버 수명주기: 시작 시 백그라운드 모델 로딩, 종료 시 태스크/스레드 풀 정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     """FastAPI 서버 시작 시 백그라운드에서 모델 로딩 시작"""
     print("🚀 FastAPI 서버 시작!")
+    # 모듈 로거들이 전파하는 로그를 큐 리스너 스레드 하나로 출력
+    setup_logging()
 
     # gRPC 오류 억제 설정 재적용
     try:
         loop = asyncio.get_running_loop()
         loop.set_exception_handler(ignore_asyncio_errors)
         print("✅ asyncio 오류 핸들러 설정 완료")
+        # CRUD 엔드포인트의 DB 호출(asyncio.to_thread)이 쓰는 기본 executor 크기 지정
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 5)))
     except Exception as e:
         print(f"⚠️ asyncio 오류 핸들러 설정 실패: {e}")
 
+    # 모델 로드는 전용 스레드 풀에서 실행해 요청 처리용 기본 executor를 점유하지 않음
+    model_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="model-preload")
+
     print("📦 백그라운드에서 모델 로딩을 시작합니다...")
     # 백그라운드 태스크로 모델 로딩 시작 (서버 시작을 차단하지 않음)
-    asyncio.create_task(preload_models_async())
+    preload_task = spawn_background_task(preload_models_async(model_pool), name="preload_models")
+
+    # 상태 히스토리 일괄 저장 태스크 시작
+    flusher_task = spawn_background_task(_status_flusher(), name="status_flusher")
+
+    yield
+
+    preload_task.cancel()
+    flusher_task.cancel()
+    # 큐에 남은 상태 히스토리는 종료 전에 저장
+    pending = []
+    while not _status_queue.empty():
+        pending.append(_status_queue.get_nowait())
+    if pending:
+        await asyncio.to_thread(_write_status_batch, pending)
+    model_pool.shutdown(wait=False)
+
+    # 그래프 검색 공유 드라이버 종료 (검색 모듈이 로드된 경우에만)
+    neo4j_module = sys.modules.get(f"{__package__}.services.database.neo4j_rag_tool")
+    if neo4j_module is not None:
+        await neo4j_module.close_shared_service()
+
+    # arXiv 검색 공유 HTTP 세션 종료 (에이전트 모듈이 로드된 경우에만)
+    worker_agents_module = sys.modules.get(f"{__package__}.core.agents.worker_agents")
+    if worker_agents_module is not None:
+        await worker_agents_module.close_arxiv_session()
+
+
+app = FastAPI(
+    title="Intelligent RAG Agent System",
+    description="A sophisticated, multi-agent system for handling complex queries.",
+    version="3.0",
+    lifespan=lifespan
+)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # --- 데이터베이스 인스턴스 초기화 ---
 # 호스트와 공유되는 경로에 DB 저장
 db = ChatDatabase(db_path="/app/db_storage/chat_history.db")
 
+# 스트리밍 중 자주 들어오는 상태 히스토리 기록은 큐에 모아 한 트랜잭션으로 저장
+_status_queue: asyncio.Queue = asyncio.Queue()
+
+
+def _write_status_batch(batch):
+    """상태 히스토리를 한 트랜잭션으로 저장하고, 실패하면 한 건씩 다시 저장 (문제 행 하나로 나머지를 잃지 않도록)"""
+    try:
+        db.add_status_history_batch(batch)
+        return
+    except Exception:
+        logger.exception("⚠️ 상태 히스토리 일괄 저장 실패 (%d건), 개별 저장으로 재시도", len(batch))
+    for entry in batch:
+        try:
+            db.add_status_history(*entry)
+        except Exception:
+            logger.exception("⚠️ 상태 히스토리 저장 실패 (message_id=%s)", entry[0])
+
+
+async def _status_flusher():
+    """상태 히스토리 큐를 비우며 쌓인 항목을 묶어서 DB에 기록하는 백그라운드 태스크"""
+    while True:
+        batch = [await _status_queue.get()]
+        try:
+            while True:
+                batch.append(_status_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            pass
+        await asyncio.to_thread(_write_status_batch, batch)
+
+# 스트리밍 요청마다 반복되는 프로젝트 조회 캐시 (수정/삭제 시 무효화)
+_PROJECT_CACHE = AsyncTTLCache(capacity=128, ttl=30)
+
+
+async def _get_project_cached(project_id: str) -> Optional[Dict[str, Any]]:
+    """프로젝트 정보를 캐시에서 가져오고, 없으면 이벤트 루프를 막지 않도록 스레드에서 조회합니다."""
+    return await _PROJECT_CACHE.get_or_set(project_id, lambda: asyncio.to_thread(db.get_project, project_id))
+
 # --- RunManager 인스턴스 초기화 ---
 run_manager = get_run_manager(db)
 # WebSocket Manager 주입
 run_manager.websocket_manager = websocket_manager
 
-# --- 에이전트 인스턴스 초기화 ---
-triage_agent = TriageAgent()
-orchestrator_agent = OrchestratorAgent()
-simple_answerer_agent = SimpleAnswererAgent()
+# --- 에이전트 인스턴스 초기화 (첫 사용 시 생성) ---
+# CRUD/헬스체크만 처리하는 워커가 LangChain·Elasticsearch 스택을 임포트하지 않도록 지연 생성
+_triage_agent = None
+_orchestrator_agent = None
+_simple_answerer_agent = None
+# 동기 핸들러(/teams)는 스레드풀에서 실행되므로 루프와 워커 스레드가 동시에 생성하지 않도록 잠금
+_agent_init_lock = threading.Lock()
+
+
+def get_triage_agent():
+    global _triage_agent
+    if _triage_agent is None:
+        with _agent_init_lock:
+            if _triage_agent is None:
+                from .core.agents.orchestrator import TriageAgent
+                _triage_agent = TriageAgent()
+    return _triage_agent
+
+
+def get_orchestrator_agent():
+    global _orchestrator_agent
+    if _orchestrator_agent is None:
+        with _agent_init_lock:
+            if _orchestrator_agent is None:
+                from .core.agents.orchestrator import OrchestratorAgent
+                _orchestrator_agent = OrchestratorAgent()
+    return _orchestrator_agent
+
+
+def get_simple_answerer_agent():
+    global _simple_answerer_agent
+    if _simple_answerer_agent is None:
+        with _agent_init_lock:
+            if _simple_answerer_agent is None:
+                from .core.agents.conversational_agent import SimpleAnswererAgent
+                _simple_answerer_agent = SimpleAnswererAgent()
+    return _simple_answerer_agent
+
+
+def _import_agent_modules():
+    """에이전트 모듈 임포트만 미리 수행 (인스턴스는 이벤트 루프에서 첫 요청 시 생성)"""
+    import importlib
+    importlib.import_module(f"{__package__}.core.agents.orchestrator")
+    importlib.import_module(f"{__package__}.core.agents.conversational_agent")
 
 # --- 데이터베이스 관련 Pydantic 모델 ---
 # 프로젝트 관련 모델
@@ -242,6 +375,20 @@ class ConversationResponse(BaseModel):
     updated_at: str
     messages: Optional[List[Dict]] = None
 
+# 목록 응답에 실을 컬럼과 기본값 (DB 행의 user_id, is_deleted 등은 응답에서 제외)
+_PROJECT_LIST_FIELDS = (("id", None), ("title", None), ("description", None),
+                        ("created_at", None), ("updated_at", None), ("conversation_count", 0))
+_CONVERSATION_LIST_FIELDS = (("id", None), ("title", None), ("project_id", None),
+                             ("created_at", None), ("updated_at", None), ("messages", None))
+
+
+def _list_response(rows: List[Dict], fields: tuple) -> ORJSONResponse:
+    """DB 행 목록을 모델 검증/jsonable_encoder 없이 응답 필드만 골라 orjson으로 직렬화합니다.
+
+    response_model을 쓰지 않으므로 라우트에서 responses=로 OpenAPI 스키마를 명시합니다.
+    """
+    return ORJSONResponse([{key: row.get(key, default) for key, default in fields} for row in rows])
+
 class MessageCreate(BaseModel):
     conversation_id: str
     type: str  # "user" or "assistant"
@@ -290,11 +437,11 @@ async def stream_query(request: QueryRequest):
     """
     # 세션별 로거 생성
     logger = get_session_logger(request.session_id, "MainServer")
-    logger.info(f"새 쿼리 요청 수신")
-    logger.info(f"Query: {request.query}")
-    logger.info(f"Team ID: {request.team_id}")
+    logger.info("새 쿼리 요청 수신")
+    logger.info("Query: %s", request.query)
+    logger.info("Team ID: %s", request.team_id)
 
-    async def event_stream_generator() -> AsyncGenerator[str, None]:
+    async def event_stream_generator() -> AsyncGenerator[bytes, None]:
         """쿼리 처리 및 결과 스트리밍을 위한 비동기 생성기"""
 
         # 세션 컨텍스트 설정
@@ -325,7 +472,7 @@ async def stream_query(request: QueryRequest):
                     persona=request.team_id or "기본",
                     conversation_history=request.conversation_history,
                     project_id=request.project_id,
-                    project_name=db.get_project(request.project_id).get("title") if request.project_id else None,
+                    project_name=(await _get_project_cached(request.project_id) or {}).get("title") if request.project_id else None,
                     run_id=run_id,
                     run_manager=run_manager
                 ):
@@ -342,7 +489,7 @@ async def stream_query(request: QueryRequest):
                 logger.info("✅ LangGraph 워크플로우 완료")
 
             except Exception as e:
-                logger.error(f"❌ LangGraph 오류: {e}")
+                logger.error("❌ LangGraph 오류: %s", e)
                 run_manager.mark_error(run_id, str(e))
                 yield server_sent_event("error", {"message": f"처리 중 오류 발생: {str(e)}"})
 
@@ -353,61 +500,62 @@ async def stream_query(request: QueryRequest):
         # ============================================================================
         logger.info("🔀 기존 워크플로우 사용 (LangGraph 비활성화)")
 
-        state = StreamingAgentStateModel(
+        # 이미 검증된 QueryRequest 값으로만 채우는 내부 상태라 생성 시 재검증은 생략 (기본값은 그대로 채워짐)
+        state = StreamingAgentStateModel.model_construct(
             original_query=request.query,
             session_id=request.session_id,
             message_id=request.message_id,
             conversation_id=request.session_id,
             user_id="default_user"
         )
+        # 스트리밍 중 반복 참조하는 세션 ID는 로컬 변수로 고정
+        sid = state.session_id
 
         # 대화 히스토리를 state에 추가
         if request.conversation_history:
             state.metadata["conversation_history"] = request.conversation_history
-            print(f">> 대화 히스토리 포함: {len(request.conversation_history)}개 메시지")
+            logger.debug(">> 대화 히스토리 포함: %d개 메시지", len(request.conversation_history))
         else:
-            print(">> 대화 히스토리 없음 - 새 대화")
+            logger.debug(">> 대화 히스토리 없음 - 새 대화")
 
         # 프로젝트 정보를 state에 추가
         if request.project_id:
             try:
-                print(f">> 프로젝트 ID로 조회 시도: {request.project_id}")
-                project = db.get_project(request.project_id)
+                logger.debug(">> 프로젝트 ID로 조회 시도: %s", request.project_id)
+                project = await _get_project_cached(request.project_id)
                 if project:
                     project_title = project.get("title", "Unknown_Project")
                     state.metadata["project_name"] = project_title
                     state.metadata["project_id"] = request.project_id
-                    print(f">> 프로젝트 정보 포함: {project_title} (ID: {request.project_id})")
-                    print(f">> state.metadata 설정 완료: {state.metadata}")
+                    logger.debug(">> 프로젝트 정보 포함: %s (ID: %s)", project_title, request.project_id)
+                    logger.debug(">> state.metadata 설정 완료: %s", state.metadata)
                 else:
-                    print(f">> 프로젝트 조회 실패: {request.project_id} - DB에서 찾을 수 없음")
+                    logger.debug(">> 프로젝트 조회 실패: %s - DB에서 찾을 수 없음", request.project_id)
             except Exception as e:
-                print(f">> 프로젝트 조회 중 오류: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(">> 프로젝트 조회 중 오류: %s", e)
         else:
-            print(">> 프로젝트 정보 없음 - request.project_id가 None")
+            logger.debug(">> 프로젝트 정보 없음 - request.project_id가 None")
 
         # 팀 정보를 state에 추가
         if request.team_id:
             state.metadata["team_id"] = request.team_id
-            print(f">> 선택된 팀: {request.team_id}")
+            logger.debug(">> 선택된 팀: %s", request.team_id)
         else:
-            print(">> 팀 선택 없음 - LLM이 자동 판단하거나 general 사용")
+            logger.debug(">> 팀 선택 없음 - LLM이 자동 판단하거나 general 사용")
 
         try:
             # 1. RunManager로 새 실행 생성
             run_id = run_manager.create_run(
-                conversation_id=state.session_id,
+                conversation_id=sid,
                 query=request.query,
                 flow_type="chat"  # 기본값으로 chat 설정, triage 후 업데이트
             )
 
             # 2. 초기 상태 이벤트 전송
-            yield server_sent_event("init", {"run_id": run_id, "session_id": state.session_id})
+            yield server_sent_event("init", {"run_id": run_id, "session_id": sid})
 
             # 3. Triage Agent 실행
-            yield server_sent_event("status", {"message": "요청 유형 분석 중...", "session_id": state.session_id, "run_id": run_id})
+            yield server_sent_event("status", {"message": "요청 유형 분석 중...", "session_id": sid, "run_id": run_id})
             state_dict = state.model_dump()
 
             # runId를 state에 추가
@@ -416,88 +564,76 @@ async def stream_query(request: QueryRequest):
             # 🔑 핵심: 딕셔너리로 변환된 후에 persona 추가
             if request.team_id:
                 state_dict["persona"] = request.team_id
-                print(f"✅ state_dict에 persona '{request.team_id}' 추가됨")
-                print(f"🔍 state_dict 내용 확인: {list(state_dict.keys())}")
-                print(f"🎭 저장된 persona 값: {state_dict.get('persona')}")
+                logger.debug("✅ state_dict에 persona '%s' 추가됨", request.team_id)
+                logger.debug("🔍 state_dict 내용 확인: %s", list(state_dict))
+                logger.debug("🎭 저장된 persona 값: %s", state_dict.get('persona'))
             else:
                 state_dict["persona"] = "기본"
-                print("⚠️ team_id가 없어서 state_dict에 '기본' persona 추가됨")
-                print(f"🔍 전달받은 team_id: {request.team_id} (falsy 값인지 확인)")
+                logger.debug("⚠️ team_id가 없어서 state_dict에 '기본' persona 추가됨")
+                logger.debug("🔍 전달받은 team_id: %s (falsy 값인지 확인)", request.team_id)
 
-            updated_state_dict = await triage_agent.classify_request(request.query, state_dict)
-            state = StreamingAgentStateModel(**updated_state_dict)
-            flow_type = state.flow_type or "task"
+            # classify_request는 같은 dict를 갱신해 반환하므로 모델 재검증 없이 그대로 이어서 사용
+            state_dict = await get_triage_agent().classify_request(request.query, state_dict)
+            flow_type = state_dict.get("flow_type") or "task"
 
             # 4. 분류 결과로 실행 업데이트
             run_manager.update_run_state(run_id, {"flow_type": flow_type})
 
             # 2. 분류된 유형에 따라 다른 워크플로우 실행
             if flow_type == "chat":
-                print(">> Flow type: 'chat'. Starting SimpleAnswererAgent.")
-                yield server_sent_event("status", {"message": "간단한 답변 생성 중...", "session_id": state.session_id})
+                logger.debug(">> Flow type: 'chat'. Starting SimpleAnswererAgent.")
+                yield server_sent_event("status", {"message": "간단한 답변 생성 중...", "session_id": sid})
 
                 content_generated = False
-                state_dict = state.model_dump()  # 딕셔너리로 변환
 
-                async for chunk in simple_answerer_agent.answer_streaming(state_dict, run_manager):
+                async for chunk in get_simple_answerer_agent().answer_streaming(state_dict, run_manager):
                     # Abort 체크
                     if run_manager.is_abort_requested(run_id):
-                        print(f"🛑 Chat 워크플로우 중단됨: {run_id}")
-                        yield server_sent_event("abort", {"run_id": run_id, "message": "사용자가 요청을 중단했습니다", "session_id": state.session_id})
+                        logger.info("🛑 Chat 워크플로우 중단됨: %s", run_id)
+                        yield server_sent_event("abort", {"run_id": run_id, "message": "사용자가 요청을 중단했습니다", "session_id": sid})
                         break
 
                     content_generated = True
 
-                    # SimpleAnswerer에서 검색 결과 이벤트가 올 수 있는지 확인
-                    if chunk.startswith('{"type": "search_results"'):
-                        try:
-                            # JSON 이벤트 파싱
-                            search_event = json.loads(chunk.strip())
-
+                    # SimpleAnswerer는 검색 결과 등 구조화된 이벤트를 dict로, 답변 텍스트를 str로 보냄
+                    if isinstance(chunk, dict):
+                        event_type = chunk.get("type")
+                        if event_type == "search_results":
                             # 검색 결과 체크포인트 저장
                             run_manager.save_checkpoint(run_id, "sources", {
-                                "tool_name": search_event["tool_name"],
-                                "query": search_event["query"],
-                                "results": search_event["results"]
+                                "tool_name": chunk["tool_name"],
+                                "query": chunk["query"],
+                                "results": chunk["results"]
                             })
 
                             # 검색 결과 이벤트를 프론트엔드로 전달
                             yield server_sent_event("search_results", {
-                                "step": search_event["step"],
-                                "tool_name": search_event["tool_name"],
-                                "query": search_event["query"],
-                                "results": search_event["results"],
-                                "session_id": state.session_id,
+                                "step": chunk["step"],
+                                "tool_name": chunk["tool_name"],
+                                "query": chunk["query"],
+                                "results": chunk["results"],
+                                "session_id": sid,
                                 "run_id": run_id
                             })
-                        except json.JSONDecodeError:
-                            # JSON 파싱 실패 시 일반 텍스트로 처리
-                            yield server_sent_event("content", {"chunk": chunk, "session_id": state.session_id, "run_id": run_id})
-                    elif chunk.startswith('{"type": "full_data_dict"'):
-                        try:
-                            # full_data_dict 이벤트 파싱
-                            full_data_event = json.loads(chunk.strip())
+                        elif event_type == "full_data_dict":
                             # full_data_dict 이벤트를 프론트엔드로 전달
                             yield server_sent_event("full_data_dict", {
-                                "data_dict": full_data_event["data_dict"],
-                                "session_id": state.session_id,
+                                "data_dict": chunk["data_dict"],
+                                "session_id": sid,
                                 "run_id": run_id
                             })
-                        except json.JSONDecodeError:
-                            # JSON 파싱 실패 시 일반 텍스트로 처리
-                            yield server_sent_event("content", {"chunk": chunk, "session_id": state.session_id, "run_id": run_id})
                     else:
                         # 일반 텍스트 청크 - 체크포인트 저장
                         if chunk.strip():
                             run_manager.save_checkpoint(run_id, "content", {"chunk": chunk})
 
                         # 일반 텍스트 청크
-                        yield server_sent_event("content", {"chunk": chunk, "session_id": state.session_id, "run_id": run_id})
+                        yield server_sent_event("content", {"chunk": chunk, "session_id": sid, "run_id": run_id})
 
                 # 내용이 전혀 생성되지 않은 경우 처리
                 if not content_generated:
-                    print(">> 경고: SimpleAnswererAgent에서 내용이 전혀 생성되지 않음")
-                    yield server_sent_event("error", {"message": "답변 생성 중 문제가 발생했습니다.", "session_id": state.session_id})
+                    logger.warning(">> 경고: SimpleAnswererAgent에서 내용이 전혀 생성되지 않음")
+                    yield server_sent_event("error", {"message": "답변 생성 중 문제가 발생했습니다.", "session_id": sid})
 
                 # SimpleAnswerer 완료 처리
                 run_manager.mark_completed(run_id, state_dict.get("final_answer", "답변 완료"))
@@ -505,40 +641,40 @@ async def stream_query(request: QueryRequest):
                 # SimpleAnswerer 완료 후 출처 정보 전송 (업데이트된 state_dict에서 추출)
                 # answer_streaming에서 state_dict가 업데이트되므로 다시 확인
                 sources = state_dict.get("metadata", {}).get("sources")
-                print(f">> SimpleAnswerer 출처 정보 확인: {sources}")  # 디버깅용
+                logger.debug(">> SimpleAnswerer 출처 정보 확인: %s", sources)  # 디버깅용
                 if sources:
                     sources_data = {
                         "total_count": len(sources),
                         "sources": sources
                     }
-                    print(f">> SimpleAnswerer 출처 정보 전송: {sources_data}")  # 디버깅용
+                    logger.debug(">> SimpleAnswerer 출처 정보 전송: %s", sources_data)  # 디버깅용
                     yield server_sent_event("complete", {
                         "message": "답변 생성 완료",
                         "sources": sources_data,
-                        "session_id": state.session_id,
+                        "session_id": sid,
                         "run_id": run_id
                     })
                 else:
-                    print(">> SimpleAnswerer 출처 정보 없음")  # 디버깅용
+                    logger.debug(">> SimpleAnswerer 출처 정보 없음")  # 디버깅용
                     yield server_sent_event("complete", {
                         "message": "답변 생성 완료",
-                        "session_id": state.session_id,
+                        "session_id": sid,
                         "run_id": run_id
                     })
 
             else: # flow_type == "task"
-                print(">> Flow type: 'task'. Starting OrchestratorAgent workflow.")
+                logger.debug(">> Flow type: 'task'. Starting OrchestratorAgent workflow.")
 
                 # OrchestratorAgent의 워크플로우를 스트리밍하면서 상세한 상태 메시지 처리
                 chart_index = 1
                 content_generated = False
                 # execute_report_workflow는 이제 텍스트/차트 외에 상태 정보도 함께 yield 합니다.
 
-                async for event in orchestrator_agent.execute_report_workflow(state.model_dump(), run_manager):
+                async for event in get_orchestrator_agent().execute_report_workflow(state_dict, run_manager):
                     # Abort 체크
                     if run_manager.is_abort_requested(run_id):
-                        print(f"🛑 Task 워크플로우 중단됨: {run_id}")
-                        yield server_sent_event("abort", {"run_id": run_id, "message": "사용자가 요청을 중단했습니다", "session_id": state.session_id})
+                        logger.info("🛑 Task 워크플로우 중단됨: %s", run_id)
+                        yield server_sent_event("abort", {"run_id": run_id, "message": "사용자가 요청을 중단했습니다", "session_id": sid})
                         break
 
                     content_generated = True
@@ -546,13 +682,12 @@ async def stream_query(request: QueryRequest):
                     event_type = event.get("type")
                     data = event.get("data")
 
-                    # session_id와 run_id를 모든 이벤트에 추가
+                    # run_id를 모든 이벤트에 추가 (session_id는 server_sent_event에서 채움)
                     if isinstance(data, dict):
-                        data["session_id"] = state.session_id
                         data["run_id"] = run_id
 
                     if event_type == "chart":
-                        print(f"Chart event received: {data}")
+                        logger.debug("Chart event received: %s", data)
 
                         # 차트 체크포인트 저장
                         run_manager.save_checkpoint(run_id, "chart", data)
@@ -560,13 +695,13 @@ async def stream_query(request: QueryRequest):
                         # 프론트엔드가 인식할 수 있는 최종 차트 객체로 변환하여 전송
                         chart_payload = {
                             "chart_data": data,
-                            "session_id": state.session_id,
+                            "session_id": sid,
                             "run_id": run_id
                         }
                         yield server_sent_event("chart", chart_payload)
                         chart_index += 1
                     elif event_type == "complete":
-                        print(f">> OrchestratorAgent complete 이벤트 수신: {data}")
+                        logger.debug(">> OrchestratorAgent complete 이벤트 수신: %s", data)
 
                         # 완료 상태 업데이트
                         run_manager.mark_completed(run_id, data.get("message", "작업 완료"))
@@ -575,7 +710,7 @@ async def stream_query(request: QueryRequest):
                         yield server_sent_event("complete", data)
                     else:
                         # status, plan, content_chunk 등 다른 모든 이벤트를 그대로 전달
-                        yield server_sent_event(event_type, data if isinstance(data, dict) else {"data": data, "session_id": state.session_id, "run_id": run_id})
+                        yield server_sent_event(event_type, data if isinstance(data, dict) else {"data": data, "session_id": sid, "run_id": run_id})
 
                 # OrchestratorAgent 완료 후 출처 정보 전송 (이제 불필요 - complete 이벤트에서 처리됨)
                 # updated_state_dict = state.model_dump()
@@ -590,18 +725,18 @@ async def stream_query(request: QueryRequest):
                 #     yield server_sent_event("complete", {
                 #         "message": "보고서 생성 완료",
                 #         "sources": sources_data,
-                #         "session_id": state.session_id
+                #         "session_id": sid
                 #     })
                 # else:
                 #     print(">> OrchestratorAgent 출처 정보 없음")  # 디버깅용
 
                 # 내용이 전혀 생성되지 않은 경우 처리
                 if not content_generated:
-                    print(">> 경고: OrchestratorAgent에서 내용이 전혀 생성되지 않음")
-                    yield server_sent_event("error", {"message": "보고서 생성 중 문제가 발생했습니다.", "session_id": state.session_id})
+                    logger.warning(">> 경고: OrchestratorAgent에서 내용이 전혀 생성되지 않음")
+                    yield server_sent_event("error", {"message": "보고서 생성 중 문제가 발생했습니다.", "session_id": sid})
 
         except Exception as e:
-            print(f"!! 스트리밍 중 심각한 오류 발생: {e}", file=sys.stderr)
+            logger.error("!! 스트리밍 중 심각한 오류 발생: %s", e)
 
             # RunManager에 에러 상태 기록
             if 'run_id' in locals():
@@ -609,13 +744,13 @@ async def stream_query(request: QueryRequest):
 
             error_payload = {
                 "message": f"오류가 발생했습니다: {str(e)}",
-                "session_id": state.session_id,
+                "session_id": sid,
                 "run_id": locals().get('run_id')
             }
             yield server_sent_event("error", error_payload)
 
         finally:
-            print(f"Query processing finished for session: {request.session_id}\n{'='*57}")
+            logger.info("Query processing finished for session: %s\n%s", request.session_id, "=" * 57)
 
             # RunManager 완료 처리 및 정리
             if 'run_id' in locals():
@@ -623,45 +758,58 @@ async def stream_query(request: QueryRequest):
                 current_state = run_manager.get_run_state(run_id)
                 if current_state and current_state.get("metadata", {}).get("status") == "running":
                     run_manager.mark_completed(run_id, "스트리밍 완료")
-                    print(f"✅ 실행 완료 처리: {run_id}")
+                    logger.info("✅ 실행 완료 처리: %s", run_id)
 
                 # 정리
                 run_manager.cleanup_run(run_id)
 
             yield server_sent_event("final_complete", {
                 "message": "모든 작업이 완료되었습니다.",
-                "session_id": state.session_id,
+                "session_id": sid,
                 "run_id": locals().get('run_id')
             })
 
     return StreamingResponse(event_stream_generator(), media_type="text/event-stream")
 
-def server_sent_event(event_type: str, data: Dict[str, Any]) -> str:
-    """Server-Sent Events (SSE) 형식에 맞는 문자열을 생성합니다."""
+# SSE 프레임 앞뒤 고정 바이트 (이벤트마다 문자열 포맷/인코딩을 다시 하지 않음)
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+
+def server_sent_event(event_type: str, data: Dict[str, Any]) -> bytes:
+    """Server-Sent Events (SSE) 형식에 맞는 UTF-8 바이트 프레임을 생성합니다."""
     # 프론트엔드가 기대하는 형식에 맞춰 type을 data에 포함
-    data_with_type = {"type": event_type, "session_id": data.get("session_id"), **data}
-    payload = json.dumps(data_with_type, ensure_ascii=False)
-    return f"data: {payload}\n\n"
+    # (호출 측 dict는 체크포인트 등에 그대로 쓰이므로 변경하지 않고 새 dict로 합침)
+    # session_id가 없는 이벤트는 요청 시작 시 set_current_session으로 지정한 값을 사용
+    data_with_type = {"type": event_type, "session_id": get_current_session(None), **data}
+    # full_data_dict처럼 정수 키를 가진 dict가 있으므로 OPT_NON_STR_KEYS 사용
+    payload = orjson.dumps(data_with_type, option=orjson.OPT_NON_STR_KEYS)
+    return _SSE_PREFIX + payload + _SSE_SUFFIX
+
+
+# /teams 응답 본문 캐시 (페르소나는 OrchestratorAgent 생성 시 한 번 로드되고 실행 중 바뀌지 않음)
+_teams_cache: Optional[bytes] = None
 
 
 @app.get("/teams")
 def get_teams():
     """사용 가능한 팀 목록을 반환합니다."""
+    global _teams_cache
+    if _teams_cache is not None:
+        return Response(content=_teams_cache, media_type="application/json")
     try:
         # orchestrator_agent에서 팀 정보 가져오기
-        persona_names = orchestrator_agent.get_available_personas()
+        persona_names = get_orchestrator_agent().get_available_personas()
         # 문자열 배열을 객체 배열로 변환
-        teams = []
-        for persona_name in persona_names:
-            teams.append({
-                "id": persona_name,
-                "name": persona_name,
-                "description": f"{persona_name} 전용 응답"
-            })
-        return {"teams": teams}
+        teams = [
+            {"id": persona_name, "name": persona_name, "description": f"{persona_name} 전용 응답"}
+            for persona_name in persona_names
+        ]
+        _teams_cache = orjson.dumps({"teams": teams})
+        return Response(content=_teams_cache, media_type="application/json")
     except Exception as e:
         print(f"팀 목록 조회 오류: {e}")
-        # 기본 팀 목록 반환
+        # 기본 팀 목록 반환 (다음 요청에서 다시 시도하도록 캐시하지 않음)
         return {
             "teams": [
                 {"id": "기본", "name": "기본", "description": "기본 응답"}
@@ -677,7 +825,7 @@ async def suggest_team(request: dict):
             return {"error": "쿼리가 필요합니다"}
 
         # orchestrator_agent를 통해 팀 추천
-        suggested_team = await orchestrator_agent.suggest_team_for_query(query)
+        suggested_team = await get_orchestrator_agent().suggest_team_for_query(query)
         return {"suggested_team": suggested_team}
     except Exception as e:
         print(f"팀 추천 오류: {e}")
@@ -690,6 +838,50 @@ async def get_memory_stats(user_id: str = None):
     return {"error": "메모리 시스템이 아직 구현되지 않았습니다"}
 
 
+# 제목 생성용 LLM 클라이언트 캐시 (요청마다 클라이언트/커넥션 풀을 새로 만들지 않음)
+_TITLE_LLM_KWARGS = {"temperature": 0.3, "max_tokens": 50}
+_TITLE_LLMS: Optional[List[tuple]] = None
+# 제목 후처리 시 제거할 문자 (따옴표, 줄바꿈)를 한 번의 translate로 처리
+_TITLE_STRIP = str.maketrans('', '', '"\'\n\r')
+
+
+def _get_title_llms() -> List[tuple]:
+    """Gemini 키 2개 -> OpenAI 순서의 (이름, 모델) 목록을 최초 호출 시 한 번만 생성합니다."""
+    global _TITLE_LLMS
+    if _TITLE_LLMS is None:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from langchain_openai import ChatOpenAI
+
+        candidates = [
+            ("Gemini 키 1", lambda: ChatGoogleGenerativeAI(
+                model="gemini-2.5-flash-lite",
+                google_api_key=ModelFallbackManager.GEMINI_KEY_1,
+                **_TITLE_LLM_KWARGS
+            )),
+            ("Gemini 키 2", lambda: ChatGoogleGenerativeAI(
+                model="gemini-2.5-flash-lite",
+                google_api_key=ModelFallbackManager.GEMINI_KEY_2,
+                **_TITLE_LLM_KWARGS
+            )),
+        ]
+        openai_api_key = os.getenv("OPENAI_API_KEY")
+        if openai_api_key:
+            candidates.append(("OpenAI fallback", lambda: ChatOpenAI(
+                model="gpt-4o-mini",
+                openai_api_key=openai_api_key,
+                **_TITLE_LLM_KWARGS
+            )))
+
+        llms = []
+        for label, factory in candidates:
+            try:
+                llms.append((label, factory()))
+            except Exception as e:
+                print(f"{label} 제목 모델 생성 실패: {e}")
+        _TITLE_LLMS = llms
+    return _TITLE_LLMS
+
+
 @app.post("/chat/generate-title")
 async def generate_chat_title(request: dict):
     """사용자 쿼리를 바탕으로 LLM이 채팅방 제목을 생성합니다."""
@@ -698,9 +890,6 @@ async def generate_chat_title(request: dict):
         if not query:
             return {"error": "쿼리가 필요합니다"}
 
-        # Gemini -> OpenAI fallback으로 제목 생성
-        # ModelFallbackManager는 이미 상단에서 import됨
-
         # 제목 생성 프롬프트
         title_prompt = f"""사용자의 질문을 바탕으로 간결하고 명확한 채팅방 제목을 생성해주세요.
 
@@ -714,21 +903,22 @@ async def generate_chat_title(request: dict):
 
 제목만 답변해주세요:"""
 
-        # LLM 호출 (Gemini 2개 키 -> OpenAI 순으로 시도)
-        try:
-            title = ModelFallbackManager.try_invoke_with_fallback(
-                prompt=title_prompt,
-                gemini_model="gemini-2.5-flash-lite",
-                openai_model="gpt-4o-mini",
-                temperature=0.3,
-                max_tokens=50
-            )
-        except Exception as e:
-            print(f"제목 생성 실패: {e}")
+        # LLM 호출 (Gemini 2개 키 -> OpenAI 순으로 시도, 이벤트 루프를 막지 않도록 ainvoke)
+        title = None
+        for label, llm in _get_title_llms():
+            try:
+                result = await llm.ainvoke(title_prompt)
+                print(f"{label} 성공: 제목 생성")
+                title = result.content
+                break
+            except Exception as e:
+                print(f"{label} 실패: {e}")
+        if title is None:
+            print("제목 생성 실패: 모든 모델 시도 실패")
             title = "새 채팅"  # 기본 제목
 
         # 제목 후처리 (특수문자 제거, 길이 제한)
-        title = title.replace('"', '').replace("'", '').replace('\n', '').strip()
+        title = title.translate(_TITLE_STRIP).strip()
         if len(title) > 15:
             title = title[:15]
 
@@ -747,11 +937,11 @@ async def create_project(project: ProjectCreate):
     """새 프로젝트 생성"""
     try:
         # 프론트엔드에서 ID를 지정했으면 사용, 아니면 새로 생성
-        project_id = project.id or f"project_{int(datetime.now().timestamp() * 1000)}_{uuid.uuid4().hex[:8]}"
+        project_id = project.id or f"project_{int(datetime.now().timestamp() * 1000)}_{secrets.token_hex(4)}"
 
         print(f"🔄 프로젝트 생성 요청: ID={project_id}, Title={project.title}")
 
-        result = db.create_project(
+        result = await asyncio.to_thread(db.create_project,
             project_id=project_id,
             title=project.title,
             description=project.description,
@@ -761,15 +951,15 @@ async def create_project(project: ProjectCreate):
         print(f"✅ 프로젝트 생성 성공: {project_id}")
         return ProjectResponse(**result, conversation_count=0)
     except Exception as e:
-        print(f"❌ 프로젝트 생성 실패: {project_id}, Error: {str(e)}")
+        logger.exception("❌ 프로젝트 생성 실패: %s, Error: %s", project_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/projects", response_model=List[ProjectResponse])
+@app.get("/api/projects", responses={200: {"model": List[ProjectResponse]}})
 async def get_projects(user_id: Optional[str] = None):
     """모든 프로젝트 조회"""
     try:
-        projects = db.get_all_projects(user_id=user_id)
-        return [ProjectResponse(**proj) for proj in projects]
+        projects = await asyncio.to_thread(db.get_all_projects, user_id=user_id)
+        return _list_response(projects, _PROJECT_LIST_FIELDS)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -777,12 +967,12 @@ async def get_projects(user_id: Optional[str] = None):
 async def get_project(project_id: str):
     """특정 프로젝트 조회"""
     try:
-        project = db.get_project(project_id)
+        project = await asyncio.to_thread(db.get_project, project_id)
         if not project:
             raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
 
         # 대화 개수 조회
-        conversations = db.get_conversations_by_project(project_id)
+        conversations = await asyncio.to_thread(db.get_conversations_by_project, project_id)
         project["conversation_count"] = len(conversations)
 
         return ProjectResponse(**project)
@@ -797,18 +987,19 @@ async def update_project(project_id: str, project_update: ProjectUpdate):
     try:
         print(f"🔄 프로젝트 수정 요청: ID={project_id}, Data={project_update.model_dump()}")
 
-        success = db.update_project_title(
+        success = await asyncio.to_thread(db.update_project_title,
             project_id=project_id,
             title=project_update.title,
             description=project_update.description
         )
+        _PROJECT_CACHE.invalidate(project_id)
 
         if not success:
             raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
 
         # 업데이트된 프로젝트 조회
-        updated_project = db.get_project(project_id)
-        conversations = db.get_conversations_by_project(project_id)
+        updated_project = await asyncio.to_thread(db.get_project, project_id)
+        conversations = await asyncio.to_thread(db.get_conversations_by_project, project_id)
         updated_project["conversation_count"] = len(conversations)
 
         print(f"✅ 프로젝트 수정 성공: {project_id}")
@@ -816,7 +1007,7 @@ async def update_project(project_id: str, project_update: ProjectUpdate):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ 프로젝트 수정 실패: {project_id}, Error: {str(e)}")
+        logger.exception("❌ 프로젝트 수정 실패: %s, Error: %s", project_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/api/projects/{project_id}")
@@ -825,7 +1016,8 @@ async def delete_project(project_id: str, hard_delete: bool = False):
     try:
         print(f"🔄 프로젝트 삭제 요청: ID={project_id}, Hard={hard_delete}")
 
-        success = db.delete_project(project_id, soft_delete=not hard_delete)
+        success = await asyncio.to_thread(db.delete_project, project_id, soft_delete=not hard_delete)
+        _PROJECT_CACHE.invalidate(project_id)
 
         if not success:
             raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다")
@@ -835,15 +1027,15 @@ async def delete_project(project_id: str, hard_delete: bool = False):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ 프로젝트 삭제 실패: {project_id}, Error: {str(e)}")
+        logger.exception("❌ 프로젝트 삭제 실패: %s, Error: %s", project_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/projects/{project_id}/conversations", response_model=List[ConversationResponse])
+@app.get("/api/projects/{project_id}/conversations", responses={200: {"model": List[ConversationResponse]}})
 async def get_project_conversations(project_id: str, user_id: Optional[str] = None):
     """특정 프로젝트의 대화 목록 조회"""
     try:
-        conversations = db.get_conversations_by_project(project_id, user_id)
-        return [ConversationResponse(**conv) for conv in conversations]
+        conversations = await asyncio.to_thread(db.get_conversations_by_project, project_id, user_id)
+        return _list_response(conversations, _CONVERSATION_LIST_FIELDS)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -853,11 +1045,11 @@ async def create_conversation(conversation: ConversationCreate):
     """새 대화 생성"""
     try:
         # 프론트엔드에서 ID를 지정했으면 사용, 아니면 새로 생성
-        conversation_id = conversation.id or str(uuid.uuid4())
+        conversation_id = conversation.id or secrets.token_hex(16)
 
         print(f"🔄 대화 생성 요청: ID={conversation_id}, Title={conversation.title}")
 
-        result = db.create_conversation(
+        result = await asyncio.to_thread(db.create_conversation,
             conversation_id=conversation_id,
             title=conversation.title,
             user_id=conversation.user_id,
@@ -867,15 +1059,15 @@ async def create_conversation(conversation: ConversationCreate):
         print(f"✅ 대화 생성 성공: {conversation_id}")
         return ConversationResponse(**result)
     except Exception as e:
-        print(f"❌ 대화 생성 실패: {conversation_id}, Error: {str(e)}")
+        logger.exception("❌ 대화 생성 실패: %s, Error: %s", conversation_id, e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/conversations", response_model=List[ConversationResponse])
+@app.get("/api/conversations", responses={200: {"model": List[ConversationResponse]}})
 async def get_conversations(user_id: Optional[str] = None, project_id: Optional[str] = None):
     """모든 대화 조회 (프로젝트별 필터링 지원)"""
     try:
-        conversations = db.get_all_conversations(user_id=user_id, project_id=project_id)
-        return [ConversationResponse(**conv) for conv in conversations]
+        conversations = await asyncio.to_thread(db.get_all_conversations, user_id=user_id, project_id=project_id)
+        return _list_response(conversations, _CONVERSATION_LIST_FIELDS)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -883,12 +1075,12 @@ async def get_conversations(user_id: Optional[str] = None, project_id: Optional[
 async def get_conversation(conversation_id: str):
     """특정 대화 조회 (메시지 포함)"""
     try:
-        conversation = db.get_conversation(conversation_id)
+        conversation = await asyncio.to_thread(db.get_conversation, conversation_id)
         if not conversation:
             raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다")
 
         # 메시지 조회
-        messages = db.get_messages(conversation_id)
+        messages = await asyncio.to_thread(db.get_messages, conversation_id)
         conversation["messages"] = messages
 
         return ConversationResponse(**conversation)
@@ -905,7 +1097,7 @@ async def update_conversation_title(conversation_id: str, request: dict):
         if not title:
             raise HTTPException(status_code=400, detail="제목이 필요합니다")
 
-        success = db.update_conversation_title(conversation_id, title)
+        success = await asyncio.to_thread(db.update_conversation_title, conversation_id, title)
         if not success:
             raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다")
 
@@ -919,7 +1111,7 @@ async def update_conversation_title(conversation_id: str, request: dict):
 async def delete_conversation(conversation_id: str, hard_delete: bool = False):
     """대화 삭제"""
     try:
-        success = db.delete_conversation(conversation_id, soft_delete=not hard_delete)
+        success = await asyncio.to_thread(db.delete_conversation, conversation_id, soft_delete=not hard_delete)
         if not success:
             raise HTTPException(status_code=404, detail="대화를 찾을 수 없습니다")
 
@@ -933,14 +1125,14 @@ async def delete_conversation(conversation_id: str, hard_delete: bool = False):
 async def create_message(message: MessageCreate):
     """새 메시지 생성"""
     try:
-        message_id = db.create_message(
+        message_id = await asyncio.to_thread(db.create_message,
             conversation_id=message.conversation_id,
             message_data=message.model_dump()
         )
         print(f"✅ 메시지 생성 완료: ID={message_id}")
         return {"message_id": message_id, "message": "메시지가 생성되었습니다"}
     except Exception as e:
-        print(f"❌ 메시지 생성 오류: {str(e)}")
+        logger.exception("❌ 메시지 생성 오류: %s", e)
         print(f"💾 요청 데이터: {message.model_dump()}")
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -948,7 +1140,7 @@ async def create_message(message: MessageCreate):
 async def get_messages(conversation_id: str):
     """대화의 모든 메시지 조회"""
     try:
-        messages = db.get_messages(conversation_id)
+        messages = await asyncio.to_thread(db.get_messages, conversation_id)
         return {"messages": messages}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -957,7 +1149,7 @@ async def get_messages(conversation_id: str):
 async def update_message(message_id: int, updates: MessageUpdate):
     """메시지 업데이트"""
     try:
-        success = db.update_message(message_id, updates.model_dump(exclude_unset=True))
+        success = await asyncio.to_thread(db.update_message, message_id, updates.model_dump(exclude_unset=True))
         if not success:
             raise HTTPException(status_code=404, detail="메시지를 찾을 수 없습니다")
 
@@ -975,14 +1167,15 @@ async def add_status_history(message_id: int, request: dict):
         if not status_message:
             raise HTTPException(status_code=400, detail="상태 메시지가 필요합니다")
 
-        status_id = db.add_status_history(
-            message_id=message_id,
-            status_message=status_message,
-            step_number=request.get("step_number"),
-            total_steps=request.get("total_steps")
-        )
+        # DB 기록은 _status_flusher가 묶어서 처리하므로 개별 status_id는 반환하지 않음
+        await _status_queue.put((
+            message_id,
+            status_message,
+            request.get("step_number"),
+            request.get("total_steps")
+        ))
 
-        return {"status_id": status_id, "message": "상태가 추가되었습니다"}
+        return {"status_id": None, "message": "상태가 추가되었습니다"}
     except HTTPException:
         raise
     except Exception as e:
@@ -992,7 +1185,7 @@ async def add_status_history(message_id: int, request: dict):
 async def save_streaming_session(conversation_id: str, session_data: StreamingSessionData):
     """스트리밍 세션 저장"""
     try:
-        success = db.save_streaming_session(conversation_id, session_data.model_dump())
+        success = await asyncio.to_thread(db.save_streaming_session, conversation_id, session_data.model_dump())
         if not success:
             raise HTTPException(status_code=500, detail="스트리밍 세션 저장 실패")
 
@@ -1006,7 +1199,7 @@ async def save_streaming_session(conversation_id: str, session_data: StreamingSe
 async def get_streaming_session(conversation_id: str):
     """스트리밍 세션 조회"""
     try:
-        session = db.get_streaming_session(conversation_id)
+        session = await asyncio.to_thread(db.get_streaming_session, conversation_id)
         if not session:
             raise HTTPException(status_code=404, detail="스트리밍 세션을 찾을 수 없습니다")
 
@@ -1020,7 +1213,7 @@ async def get_streaming_session(conversation_id: str):
 async def delete_streaming_session(conversation_id: str):
     """스트리밍 세션 삭제"""
     try:
-        success = db.delete_streaming_session(conversation_id)
+        success = await asyncio.to_thread(db.delete_streaming_session, conversation_id)
         # 스트리밍 세션이 없어도 성공으로 처리 (이미 삭제됨)
         if success:
             return {"message": "스트리밍 세션이 삭제되었습니다"}
@@ -1165,6 +1358,16 @@ async def cleanup_stale_runs():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/cache/flush")
+async def flush_search_caches():
+    """그래프 검색 키워드/조회 결과 캐시 비우기 (그래프 데이터 갱신 후 사용)"""
+    try:
+        from .services.database.neo4j_rag_tool import invalidate_graph_search_cache
+        invalidate_graph_search_cache()
+        return {"success": True, "message": "검색 캐시를 비웠습니다"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/chat/checkpoints/{run_id}")
 async def get_run_checkpoints(run_id: str, checkpoint_type: Optional[str] = None):
     """특정 실행의 체크포인트 조회"""
@@ -1237,7 +1440,7 @@ async def health_check():
     """헬스 체크 엔드포인트"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _cached_iso_now(),
         "version": "2.0"
     }
 
@@ -1342,7 +1545,7 @@ async def websocket_endpoint(websocket: WebSocket, conversation_id: str):
 
             elif message_type == "ping":
                 # 하트비트 응답
-                await websocket.send_text(json.dumps({"type": "pong", "timestamp": datetime.now().isoformat()}))
+                await websocket.send_text(json.dumps({"type": "pong", "timestamp": _cached_iso_now()}))
 
     except WebSocketDisconnect:
         websocket_manager.disconnect(websocket, conversation_id)
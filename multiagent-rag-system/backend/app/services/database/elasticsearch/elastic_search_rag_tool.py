@@ -33,13 +33,16 @@ print(f">> 현재 디바이스: {DEVICE}")
 # 전역 변수로 모델 초기화를 지연
 _hf_model = None
 _bge_reranker = None
-_model_lock = threading.Lock()  # 모델 로드 동기화를 위한 락
+# 모델별 로드 동기화 락 (서로 다른 모델은 병렬로 로드 가능)
+_hf_model_lock = threading.Lock()
+_bge_reranker_lock = threading.Lock()
+_qwen3_model_lock = threading.Lock()
 
 def get_hf_model():
     """임베딩 모델을 lazy loading으로 가져오기 (thread-safe)"""
     global _hf_model
     if _hf_model is None:
-        with _model_lock:  # 한 번에 하나의 스레드만 모델 로드
+        with _hf_model_lock:  # 한 번에 하나의 스레드만 모델 로드
             if _hf_model is None:  # double-check locking pattern
                 print(">> 임베딩 모델 로드 시작...")
                 import time
@@ -57,7 +60,7 @@ def get_bge_reranker():
     """리랭킹 모델을 lazy loading으로 가져오기 (thread-safe)"""
     global _bge_reranker
     if _bge_reranker is None:
-        with _model_lock:  # 한 번에 하나의 스레드만 모델 로드
+        with _bge_reranker_lock:  # 한 번에 하나의 스레드만 모델 로드
             if _bge_reranker is None:  # double-check locking pattern
                 print(">> 리랭킹 모델 로드 시작...")
                 import time
@@ -94,7 +97,7 @@ def get_qwen3_model():
     """Qwen3 모델을 lazy loading으로 가져오기 (thread-safe)"""
     global _qwen3_tokenizer, _qwen3_model, _qwen3_yes_token, _qwen3_no_token
     if _qwen3_model is None:
-        with _model_lock:  # 한 번에 하나의 스레드만 모델 로드
+        with _qwen3_model_lock:  # 한 번에 하나의 스레드만 모델 로드
             if _qwen3_model is None:  # double-check locking pattern
                 print(">> Qwen3 모델 로드 시작...")
                 import time
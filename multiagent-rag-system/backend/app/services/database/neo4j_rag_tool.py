@@ -2,16 +2,21 @@
 import os
 import re
 import json
+import time
 import asyncio
+import threading
 import concurrent.futures
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
-from neo4j import AsyncGraphDatabase, basic_auth
+from neo4j import AsyncGraphDatabase, Query, RoutingControl, basic_auth
 from neo4j.exceptions import ClientError
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from ...utils.async_cache import AsyncTTLCache
+from ...utils.background_tasks import spawn_background_task
+
 
 # =========================
 # Config & Constants
@@ -26,6 +31,57 @@ NUTRIENT_INDEX = "nutrient_idx"  # (Food)-[hasNutrient]->(Nutrient) 축 대상
 DOC_INDEX      = "doc_idx"       # (:Entity)-[relation]-(:Document) 축 대상
 REL_INDEX      = "rel_idx"
 
+# 노드 풀텍스트 검색: 점수 상위 노드 수와 노드별로 함께 가져올 최대 이웃(관계) 수
+GRAPH_TOP_NODES = 50
+GRAPH_NEIGHBORS_PER_NODE = 20
+
+# 동시 검색 요청 묶음 처리: 대기 시간 창(초)과 한 번에 묶을 최대 쿼리 수
+GRAPH_BATCH_WINDOW = 0.005
+GRAPH_BATCH_MAX = 32
+
+# 마지막 조회 후 이 시간(초)이 지나면 풀의 연결이 만료됐을 수 있으므로 (max_connection_lifetime=30)
+# 키워드 추출(LLM) 동안 병렬로 연결을 미리 준비
+GRAPH_WARMUP_IDLE = 20.0
+
+# 노드/관계에서 서버 측에서 투영해 가져올 필드 (전체 속성 dict 대신 보고서에 쓰는 값만 전송)
+# 노드 표시 이름: 우선순위 키 순서로 첫 번째 값, 없으면 elementId
+_NODE_DISPLAY_KEYS = ("name", "product", "food", "ingredient", "title", "city", "region", "koName", "enName", "id", "uuid")
+_NODE_PROPS_PROJECTION = "{.product, .name, .title, .city, .region, .id}"
+_REL_PROPS_PROJECTION = "{.count, .farm, .category, .fishState, .value, .unit, .type, .doc, .document}"
+# 보고서에서 분류하는 관계 타입만 조회 (그 외 타입은 스토리지 단계에서 건너뜀)
+GRAPH_REL_TYPES = ("isFrom", "hasNutrient", "relation")
+_REL_TYPE_PATTERN = "|".join(GRAPH_REL_TYPES)
+_REL_TYPE_LIST = "[" + ", ".join(f"'{t}'" for t in GRAPH_REL_TYPES) + "]"
+
+
+def _cypher_display(var: str) -> str:
+    """노드 변수의 표시 이름을 계산하는 Cypher 식"""
+    keys = ", ".join(f"{var}.{k}" for k in _NODE_DISPLAY_KEYS)
+    return f"toString(coalesce({keys}, elementId({var})))"
+
+# Lucene 구문 이스케이프 변환 테이블 (역슬래시, 큰따옴표)
+_LUCENE_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+# 키워드 폴백용 농업/식품 관련 불용어 확장
+_KEYWORD_STOPWORDS = (
+    "의","을","를","이","가","에","에서","로","으로","와","과","도","만","부터","까지",
+    "알려줘","검색","찾아","정보","어디","무엇","언제","어떤","어느","얼마","몇",
+    "있는","있나","있어","보여줘","말해줘","대해","관한","관련","대한","중에서",
+    "뭐야","뭔가","그거","그것","이거","저거","하나","좀","잠깐","그냥","한번",
+)
+# 단어 경계에서 시작하고 단어 전체가 불용어가 아닌 2글자 이상 토큰
+_KEYWORD_TOKEN_RE = re.compile(
+    r"(?<![가-힣a-zA-Z0-9])(?!(?:"
+    + "|".join(map(re.escape, sorted(_KEYWORD_STOPWORDS, key=len, reverse=True)))
+    + r")(?![가-힣a-zA-Z0-9]))[가-힣a-zA-Z0-9]{2,}"
+)
+
+# 재시도/반복 질문 시 LLM 키워드 추출과 Neo4j 조회를 건너뛰기 위한 캐시
+# - 키워드: 정규화한 사용자 질문 -> LLM 추출 결과 (폴백 결과는 저장하지 않음)
+# - 조회 결과: Lucene 쿼리 문자열 -> 네 인덱스 조회 원본 행 (리포트 포맷 변경과 무관하게 재사용)
+_KEYWORD_CACHE = AsyncTTLCache(capacity=256, ttl=60)
+_ROWS_CACHE = AsyncTTLCache(capacity=256, ttl=60)
+
 
 # =========================
 # Utilities
@@ -63,6 +119,8 @@ class GraphDBClient:
             max_transaction_retry_time=5  # 트랜잭션 재시도 시간 5초
         )
         _debug(f"Connected Neo4j (uri={uri})")
+        # 마지막으로 연결을 사용한 시각 (time.monotonic)
+        self._last_used = 0.0
 
     async def close(self):
         try:
@@ -72,24 +130,47 @@ class GraphDBClient:
             pass
 
     async def run(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        async with self._driver.session(
-            database="neo4j",  # 명시적 데이터베이스 지정
-            default_access_mode="READ"  # 읽기 전용 모드
-        ) as session:
-            try:
-                res = await session.run(query, params or {}, timeout=20)  # 20초 타임아웃
-                return [r.data() async for r in res]
-            except Exception as e:
-                _debug(f"Neo4j query error: {e}")
-                raise
+        # 호출마다 세션을 열고 닫는 대신 드라이버의 execute_query 사용
+        # (드라이버가 세션/연결을 내부 풀에서 재사용하고, 일시적 오류는 관리 트랜잭션으로 재시도)
+        try:
+            res = await self._driver.execute_query(
+                Query(query, timeout=20),  # 20초 타임아웃
+                params or {},
+                database_="neo4j",  # 명시적 데이터베이스 지정
+                routing_=RoutingControl.READ,  # 읽기 전용 모드
+            )
+            self._last_used = time.monotonic()
+            return [r.data() for r in res.records]
+        except Exception as e:
+            _debug(f"Neo4j query error: {e}")
+            raise
+
+    def idle_for(self) -> float:
+        """마지막 조회 이후 경과 시간(초)"""
+        return time.monotonic() - self._last_used
+
+    async def warm_up(self):
+        """가벼운 쿼리로 풀에 사용 가능한 연결을 미리 만들어 둡니다 (실패해도 무시)."""
+        # 동시 검색들이 중복으로 워밍업하지 않도록 먼저 사용 시각 갱신
+        self._last_used = time.monotonic()
+        try:
+            await self.run("RETURN 1")
+        except Exception as e:
+            _debug(f"Neo4j warm-up failed: {e}")
 
 
 # =========================
 # LLM Wrapper
 # =========================
 class LLM:
-    def __init__(self, model: str = "gemini-2.5-flash-lite", temperature: float = 0.0):
-        self.client = ChatGoogleGenerativeAI(model=model, temperature=temperature)
+    def __init__(self, model: str = "gemini-2.5-flash-lite", temperature: float = 0.0, json_mode: bool = False):
+        if json_mode:
+            # JSON 모드: 응답이 항상 순수 JSON 문자열로 오므로 정규식으로 잘라낼 필요 없음
+            self.client = ChatGoogleGenerativeAI(
+                model=model, temperature=temperature, response_mime_type="application/json"
+            )
+        else:
+            self.client = ChatGoogleGenerativeAI(model=model, temperature=temperature)
 
     async def ainvoke(self, prompt: str) -> str:
         resp = await self.client.ainvoke(prompt)
@@ -100,6 +181,68 @@ class LLM:
         return (resp.content or "").strip()
 
 
+# =========================
+# Fulltext Micro-batcher
+# =========================
+class _FulltextBatcher:
+    """
+    짧은 시간 창 안에 들어온 Lucene 쿼리들을 모아 하나의 UNWIND 쿼리로 실행하고,
+    결과 행을 i(요청 순서)로 나눠 각 호출자에게 돌려줌.
+    """
+
+    def __init__(self, run, query: str, window: float = GRAPH_BATCH_WINDOW, max_batch: int = GRAPH_BATCH_MAX):
+        self._run = run
+        self._query = query
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, lucene_query: str) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((lucene_query, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending[:self._max_batch], self._pending[self._max_batch:]
+        if self._pending:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._window, self._flush)
+        if batch:
+            spawn_background_task(self._execute(batch), name="neo4j_fulltext_batch")
+
+    async def _execute(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            rows = await self._run(self._query, {"kws": [kw for kw, _ in batch]})
+        except Exception as e:
+            if len(batch) == 1:
+                self._set_exception(batch[0][1], e)
+                return
+            # 잘못된 Lucene 쿼리 하나가 같은 묶음의 다른 요청까지 실패시키지 않도록 개별 재실행
+            _debug(f"Fulltext batch failed ({len(batch)} queries), retrying individually: {e}")
+            await asyncio.gather(*(self._execute([item]) for item in batch))
+            return
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in batch]
+        for row in rows:
+            results[row.pop("i")].append(row)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, exc: Exception):
+        if not future.done():
+            future.set_exception(exc)
+
+
 # =========================
 # Search Service (single-query)
 # =========================
@@ -108,10 +251,11 @@ class GraphDBSearchService:
     - 키워드 추출(LLM + 폴백) : 구분 없이 단일 리스트
     - DB 호출은 단 하나의 쿼리 형태만 사용:
         CALL db.index.fulltext.queryNodes('search_idx', $kw)
-        YIELD node AS n, score
-        MATCH (n)-[r0]-(m)
-        RETURN n, r, m, score
+        YIELD node AS n, score  (점수 상위 노드만)
+        OPTIONAL MATCH (n)-[r:isFrom|hasNutrient|relation]-()
+        RETURN n, score, collect({r, ...}) AS neighbors
         ORDER BY score DESC
+      (동시 요청의 $kw들은 UNWIND $kws로 묶어 한 번에 실행)
     - 관계 가공:
         * isFrom      -> 원산지 정보 (r.count => 농장수)
         * hasNutrient -> 영양성분 정보 (r.value[+unit] => 양)
@@ -119,41 +263,74 @@ class GraphDBSearchService:
     """
 
     def _build_indexed_query(self, index_name: str) -> str:
+        # (n, r, m) 단위 행 대신 상위 노드마다 이웃을 리스트로 모아 한 행으로 반환
+        # (관계가 많은 노드 하나가 LIMIT을 독차지하거나 같은 n이 행마다 반복 전송되는 것을 방지)
+        # $kws의 Lucene 쿼리 여러 개를 UNWIND로 한 번에 실행하고 i로 요청별 결과를 구분
+        # 노드/관계 전체 대신 id, 라벨, 표시 이름, 필요한 속성만 서버에서 계산해 반환
+        # 같은 노드에 대해 표시 내용이 같은 관계는 DISTINCT로 서버에서 한 번만 전송
         return f"""
-        CALL db.index.fulltext.queryNodes('{index_name}', $kw)
-        YIELD node AS n, score
-        MATCH (n)-[r]-(m)
-        RETURN n, r, m, score,
-               type(r) AS rel_type,
-               startNode(r) AS s,
-               endNode(r)   AS e
-        ORDER BY score DESC
-        LIMIT 50
+        UNWIND range(0, size($kws) - 1) AS i
+        CALL {{
+            WITH i
+            CALL db.index.fulltext.queryNodes('{index_name}', $kws[i])
+            YIELD node AS n, score
+            WITH n, score
+            ORDER BY score DESC
+            LIMIT {GRAPH_TOP_NODES}
+            OPTIONAL MATCH (n)-[r:{_REL_TYPE_PATTERN}]-()
+            WITH n, score, r, startNode(r) AS s, endNode(r) AS e
+            WITH n, score, collect(DISTINCT CASE WHEN r IS NULL THEN null ELSE {{
+                     rel_type: type(r),
+                     s: {_cypher_display("s")},
+                     e: {_cypher_display("e")},
+                     props: r {_REL_PROPS_PROJECTION}
+                 }} END)[..{GRAPH_NEIGHBORS_PER_NODE}] AS neighbors
+            ORDER BY score DESC
+            RETURN elementId(n) AS nid, labels(n) AS nlabels,
+                   n {_NODE_PROPS_PROJECTION} AS nprops, score, neighbors
+        }}
+        RETURN i, nid, nlabels, nprops, score, neighbors
         """
     
     def _build_rel_indexed_query(self, index_name: str) -> str:
         return f"""
-        CALL db.index.fulltext.queryRelationships('{index_name}', $kw)
-        YIELD relationship AS r, score
-        MATCH (s)-[r]-(e)
-        RETURN s AS n, r, e AS m, score,
-               type(r) AS rel_type,
-               startNode(r) AS s,
-               endNode(r) AS e
-        ORDER BY score DESC
-        LIMIT 50
+        UNWIND range(0, size($kws) - 1) AS i
+        CALL {{
+            WITH i
+            CALL db.index.fulltext.queryRelationships('{index_name}', $kws[i])
+            YIELD relationship AS r, score
+            WHERE type(r) IN {_REL_TYPE_LIST}
+            MATCH (s)-[r]-(e)
+            WITH s, r, e, score
+            ORDER BY score DESC
+            LIMIT 50
+            WITH s AS n, r, score, startNode(r) AS rs, endNode(r) AS re
+            RETURN elementId(n) AS nid, labels(n) AS nlabels,
+                   n {_NODE_PROPS_PROJECTION} AS nprops, score,
+                   type(r) AS rel_type,
+                   {_cypher_display("rs")} AS s,
+                   {_cypher_display("re")} AS e,
+                   r {_REL_PROPS_PROJECTION} AS props
+        }}
+        RETURN i, nid, nlabels, nprops, score, rel_type, s, e, props
         """
 
     def __init__(self, client: Optional[GraphDBClient] = None, llm: Optional[LLM] = None):
         self.client = client or GraphDBClient()
-        self.llm = llm or LLM()
+        # 키워드 추출 전용이므로 JSON 모드 클라이언트 사용 (서비스는 요청 간 공유되므로 클라이언트도 재사용)
+        self.llm = llm or LLM(json_mode=True)
+        # 인덱스별 마이크로 배처 (동시 검색 요청의 Lucene 쿼리를 한 번의 UNWIND 쿼리로 묶음)
+        self._batchers: Dict[str, _FulltextBatcher] = {}
 
     # ---------- Public ----------
     async def search(self, user_query: str) -> str:
         _debug(f"Graph search started: '{user_query}'")
         
-        # 1. 키워드 추출
-        kw = await self._extract_keywords(user_query)
+        # 1. 키워드 추출 (연결이 한동안 쉬었으면 LLM 호출과 병렬로 Neo4j 연결 워밍업)
+        if self.client.idle_for() > GRAPH_WARMUP_IDLE:
+            kw, _ = await asyncio.gather(self._extract_keywords(user_query), self.client.warm_up())
+        else:
+            kw = await self._extract_keywords(user_query)
         keywords = kw.get("keywords", [])
         if not keywords:
             return f"'{user_query}'에 사용할 키워드를 찾지 못했습니다. \n더 구체적인 품목명이나 지역명을 입력해주세요."
@@ -167,15 +344,7 @@ class GraphDBSearchService:
         if not lucene:
             return f"'{user_query}' 검색에 사용할 수 있는 유효한 키워드가 없습니다."
             
-        tasks = [
-            self._run_indexed_query(ORIGIN_INDEX,   lucene),
-            self._run_indexed_query(NUTRIENT_INDEX, lucene),
-            self._run_indexed_query(DOC_INDEX,      lucene),
-            self._run_rel_indexed_query(REL_INDEX,    lucene),
-        ]
-        res_origin, res_nutrient, res_doc, res_rel = await asyncio.gather(*tasks, return_exceptions=False)
-        rows = (res_origin or []) + (res_nutrient or []) + (res_doc or []) + (res_rel or [])
-        _debug(f"Retrieved raw results - origin:{len(res_origin)} / nutrient:{len(res_nutrient)} / doc:{len(res_doc)}/ rel:{len(res_rel)} / total:{len(rows)}")
+        rows = await _ROWS_CACHE.get_or_set(lucene, lambda: self._fetch_rows(lucene))
 
         # 3. 결과 처리를 위한 컨테이너 초기화
         node_bucket: Dict[str, Dict[str, Any]] = {}  # elementId -> node dict (최대 score로 유지)
@@ -191,20 +360,7 @@ class GraphDBSearchService:
         # 5. 노드 점수별 정렬
         nodes_sorted = sorted(node_bucket.values(), key=lambda x: x.get("score", 0.0), reverse=True)
 
-        # 6. 관계 데이터 중복 제거 및 정렬
-        def uniq(items, keyfunc):
-            seen = set(); out = []
-            for it in items:
-                k = keyfunc(it)
-                if k not in seen:
-                    seen.add(k); out.append(it)
-            return out
-
-        # 중복 제거 및 정렬
-        isfrom_list    = uniq(isfrom_list,    lambda r: (r.get("item"), r.get("origin")))
-        nutrients_list = uniq(nutrients_list, lambda r: (r.get("item"), r.get("nutrient")))
-        docrels_list   = uniq(docrels_list,   lambda r: (r.get("source"), r.get("target"), r.get("rel_type")))
-        
+        # 6. 관계 데이터 정렬 (중복은 Cypher DISTINCT와 파싱 단계에서 이미 제거됨)
         # 원산지 관계를 항목별로 그룹화
         isfrom_list = sorted(isfrom_list, key=lambda x: (x.get("item", ""), x.get("origin", "")))
         # 영양성분 관계를 항목별로 그룹화  
@@ -219,8 +375,33 @@ class GraphDBSearchService:
     async def close(self):
         await self.client.close()
 
+    def invalidate(self):
+        """키워드/조회 결과 캐시를 비웁니다 (그래프 데이터 갱신 후 호출)."""
+        invalidate_graph_search_cache()
+
+    async def _fetch_rows(self, lucene: str) -> List[Dict[str, Any]]:
+        tasks = [
+            self._run_indexed_query(ORIGIN_INDEX,   lucene),
+            self._run_indexed_query(NUTRIENT_INDEX, lucene),
+            self._run_indexed_query(DOC_INDEX,      lucene),
+            self._run_rel_indexed_query(REL_INDEX,    lucene),
+        ]
+        res_origin, res_nutrient, res_doc, res_rel = await asyncio.gather(*tasks, return_exceptions=False)
+        rows = (res_origin or []) + (res_nutrient or []) + (res_doc or []) + (res_rel or [])
+        _debug(f"Retrieved raw results - origin:{len(res_origin)} / nutrient:{len(res_nutrient)} / doc:{len(res_doc)}/ rel:{len(res_rel)} / total:{len(rows)}")
+        return rows
+
     # ---------- Keyword Extraction ----------
     async def _extract_keywords(self, q: str) -> Dict[str, List[str]]:
+        # 대소문자/공백 차이만 있는 질문은 같은 키로 취급
+        key = " ".join(q.lower().split())
+        try:
+            return await _KEYWORD_CACHE.get_or_set(key, lambda: self._extract_keywords_llm(q))
+        except Exception as e:
+            _debug(f"LLM keyword extraction failed: {e}")
+            return self._keyword_fallback(q)
+
+    async def _extract_keywords_llm(self, q: str) -> Dict[str, List[str]]:
         prompt = f"""
 다음 질문에서 그래프 검색에 사용할 핵심 키워드를 추출하세요.
 - 농산물/수산물/축산물 품목명 (예: 사과, 배추, 고등어)
@@ -235,32 +416,17 @@ class GraphDBSearchService:
 JSON 예:
 {{ "keywords": ["사과","제주도","비타민C","당도"] }}
 """
-        try:
-            txt = await self.llm.ainvoke(prompt)
-            m = re.search(r"\{[\s\S]*\}", txt)
-            if m:
-                txt = m.group(0)
-            data = json.loads(txt)
-            _debug(f"LLM keywords: {data}")
-            if "keywords" not in data or not isinstance(data["keywords"], list):
-                data["keywords"] = []
-            return data
-        except Exception as e:
-            _debug(f"LLM keyword extraction failed: {e}")
-            return self._keyword_fallback(q)
+        data = json.loads(await self.llm.ainvoke(prompt))
+        _debug(f"LLM keywords: {data}")
+        if not isinstance(data, dict):
+            data = {}
+        if "keywords" not in data or not isinstance(data["keywords"], list):
+            data["keywords"] = []
+        return data
 
     def _keyword_fallback(self, q: str) -> Dict[str, List[str]]:
-        # 농업/식품 관련 불용어 확장
-        stop = {
-            "의","을","를","이","가","에","에서","로","으로","와","과","도","만","부터","까지",
-            "알려줘","검색","찾아","정보","어디","무엇","언제","어떤","어느","얼마","몇",
-            "있는","있나","있어","보여줘","말해줘","대해","관한","관련","대한","중에서",
-            "뭐야","뭔가","그거","그것","이거","저거","하나","좀","잠깐","그냥","한번"
-        }
-        
-        # 한글, 영문, 숫자만 추출
-        words = re.findall(r'[가-힣a-zA-Z0-9]+', q)
-        terms = [w for w in words if len(w) > 1 and w not in stop]
+        # 한글, 영문, 숫자로 된 2글자 이상 단어 중 불용어가 아닌 것만 한 번의 정규식 스캔으로 추출
+        terms = _KEYWORD_TOKEN_RE.findall(q)
         
         # 우선순위: 긴 단어 먼저 (품목명이 보통 2-3글자 이상)
         terms = sorted(terms, key=len, reverse=True)[:8]
@@ -268,34 +434,24 @@ JSON 예:
 
     # ---------- Fulltext OR query builder ----------
     def _build_fulltext_query(self, keywords: List[str]) -> str:
-        def esc(t: str) -> str:
-            # Lucene 특수문자 이스케이프
-            t = t.replace("\\", "\\\\").replace('"', '\\"')
-            return f'"{t}"'
-        
-        if not keywords:
-            return ""
-            
-        # 키워드 우선순위 조정: 긴 키워드에 부스트 점수 적용
-        boosted_terms = []
-        for k in keywords:
-            escaped = esc(k)
-            # 3글자 이상 키워드는 중요도 부스트
-            if len(k) >= 3:
-                boosted_terms.append(f"{escaped}^2.0")  
-            else:
-                boosted_terms.append(escaped)
-                
-        return " OR ".join(boosted_terms)
+        # Lucene 특수문자 이스케이프 후 따옴표로 감싸고, 3글자 이상 키워드는 중요도 부스트
+        return " OR ".join(
+            f'"{k.translate(_LUCENE_ESCAPE)}"{"^2.0" if len(k) >= 3 else ""}' for k in keywords
+        )
 
     # ---------- Indexed fulltext runner ----------
     async def _run_indexed_query(self, index_name: str, lucene_query: str) -> List[Dict[str, Any]]:
-        q = self._build_indexed_query(index_name)
-        return await self._run_async(q, {"kw": lucene_query})
+        return await self._batcher(index_name, self._build_indexed_query).submit(lucene_query)
     
     async def _run_rel_indexed_query(self, index_name: str, lucene_query: str) -> List[Dict[str, Any]]:
-        q = self._build_rel_indexed_query(index_name)
-        return await self._run_async(q, {"kw": lucene_query})
+        return await self._batcher(index_name, self._build_rel_indexed_query).submit(lucene_query)
+
+    def _batcher(self, index_name: str, build_query) -> "_FulltextBatcher":
+        batcher = self._batchers.get(index_name)
+        if batcher is None:
+            batcher = _FulltextBatcher(self._run_async, build_query(index_name))
+            self._batchers[index_name] = batcher
+        return batcher
 
     # ---------- Row parsing ----------
     def _parse_rows(
@@ -306,120 +462,101 @@ JSON 예:
     nutrients_list: List[Dict[str, Any]],
     docrels_list: List[Dict[str, Any]],
     ):
+        # 여러 인덱스/노드에서 같은 관계가 중복으로 나오므로 분류 시점에 (타입, 양 끝, ...) 키로 한 번만 추가
+        seen_rels: set = set()
         for r in rows:
-            n = r["n"]; m = r.get("m"); rel = r.get("r"); score = float(r.get("score", 0.0))
-            s_node   = r.get("s")
-            e_node   = r.get("e")
-            rt     = str(r.get("rel_type") or "").lower()
+            score = float(r.get("score", 0.0))
 
-            # n 노드 점수만 유지(기존 로직 그대로)
-            n_fmt = self._format_node(n, score)
+            # n 노드 점수만 유지(기존 로직 그대로) - 노드당 한 번만 포맷
+            n_fmt = self._format_node(r["nid"], r.get("nlabels") or [], r.get("nprops") or {}, score)
             node_bucket[n_fmt["id"]] = self._keep_max_score(node_bucket.get(n_fmt["id"]), n_fmt)
 
-            # 관계/상대 노드 없으면 패스
-            if not m or not rel or not s_node or not e_node:
-                continue
+            # 노드 인덱스 결과는 neighbors 리스트, 관계 인덱스 결과는 행 자체가 하나의 관계
+            neighbors = r.get("neighbors")
+            if neighbors is None:
+                neighbors = (r,)
 
-            # 관계 속성
-            try:
-                rel_props = dict(rel)
-            except Exception:
-                rel_props = {}
+            for nb in neighbors:
+                self._classify_relation(nb, isfrom_list, nutrients_list, docrels_list, seen_rels)
 
-            # 표시 이름(스킵 방지용으로 보강)
-            def node_display(node) -> str:
-                try:
-                    p = dict(node)
-                    # 우선순위 키
-                    for k in ("name","product","food","ingredient","title","city","region","koName","enName","id","uuid"):
-                        v = p.get(k)
-                        if isinstance(v, str) and v.strip():
-                            return v.strip()
-                    # 아무 문자열 속성이나 하나
-                    for v in p.values():
-                        if isinstance(v, str) and v.strip():
-                            return v.strip()
-                except Exception:
-                    pass
-                # 마지막 폴백: element id
-                try:
-                    return getattr(node, "element_id", "") or "UNKNOWN"
-                except Exception:
-                    return "UNKNOWN"
-
-            # === 버킷/방향 확정 매핑 ===
-            # === 관계 타입/방향 기반 확정 분기 ===
-            if rt == "isfrom":
-                item_name   = node_display(s_node)  # s=Ingredient
-                origin_name = node_display(e_node)  # e=Origin
-                isfrom_list.append({
-                    "item": item_name,
-                    "origin": origin_name,
-                    "count": rel_props.get("count"),
-                    "farm": rel_props.get("farm"),
-                    "category": rel_props.get("category"),
-                    "fishState": rel_props.get("fishState"),
-                })
-            elif rt == "hasnutrient":
-                item_name     = node_display(s_node)              # s=Food
-                nutrient_name = dict(e_node).get("name") if e_node else None
-                nutrient_name = nutrient_name or node_display(e_node)  # e=Nutrient
-                nutrients_list.append({
-                    "item": item_name,
-                    "nutrient": nutrient_name,
-                    "value": rel_props.get("value"),
-                })
-            elif rt == "relation":
-                src_name = node_display(s_node)  # s=source entity
-                tgt_name = node_display(e_node)  # e=target entity
-                
-                # 관계 타입: 속성의 type이 있으면 사용, 없으면 관계타입(rt) 사용
-                actual_rel_type = rel_props.get("type") or rt
-                
-                # 문서 정보: doc 또는 document 속성 확인
-                doc_info = rel_props.get("doc") or rel_props.get("document")
-                
-                docrels_list.append({
-                    "source": src_name,
-                    "target": tgt_name,
-                    "rel_type": actual_rel_type,
-                    "doc": doc_info,
-                })
+    def _classify_relation(
+    self,
+    nb: Dict[str, Any],
+    isfrom_list: List[Dict[str, Any]],
+    nutrients_list: List[Dict[str, Any]],
+    docrels_list: List[Dict[str, Any]],
+    seen_rels: set,
+    ):
+        # s/e는 Cypher에서 계산된 표시 이름, props는 관계 속성 중 필요한 필드만
+        src_name = nb.get("s")
+        tgt_name = nb.get("e")
+        rt       = str(nb.get("rel_type") or "").lower()
+
+        # 관계 양 끝 노드가 없으면 패스
+        if not src_name or not tgt_name:
+            return
+
+        rel_props = nb.get("props") or {}
+
+        # === 버킷/방향 확정 매핑 ===
+        # === 관계 타입/방향 기반 확정 분기 ===
+        if rt == "isfrom":
+            # s=Ingredient, e=Origin
+            key = (rt, src_name, tgt_name)
+            if key in seen_rels:
+                return
+            seen_rels.add(key)
+            isfrom_list.append({
+                "item": src_name,
+                "origin": tgt_name,
+                "count": rel_props.get("count"),
+                "farm": rel_props.get("farm"),
+                "category": rel_props.get("category"),
+                "fishState": rel_props.get("fishState"),
+            })
+        elif rt == "hasnutrient":
+            # s=Food, e=Nutrient
+            key = (rt, src_name, tgt_name)
+            if key in seen_rels:
+                return
+            seen_rels.add(key)
+            nutrients_list.append({
+                "item": src_name,
+                "nutrient": tgt_name,
+                "value": rel_props.get("value"),
+                "unit": rel_props.get("unit"),
+            })
+        elif rt == "relation":
+            # s=source entity, e=target entity
+            # 관계 타입: 속성의 type이 있으면 사용, 없으면 관계타입(rt) 사용
+            actual_rel_type = rel_props.get("type") or rt
+            key = (rt, src_name, tgt_name, actual_rel_type)
+            if key in seen_rels:
+                return
+            seen_rels.add(key)
+            
+            # 문서 정보: doc 또는 document 속성 확인
+            doc_info = rel_props.get("doc") or rel_props.get("document")
+            
+            docrels_list.append({
+                "source": src_name,
+                "target": tgt_name,
+                "rel_type": actual_rel_type,
+                "doc": doc_info,
+            })
 
     # ---------- Helpers ----------
     async def _run_async(self, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         return await self.client.run(query, params or {})
 
-    def _format_node(self, node, score: float) -> Dict[str, Any]:
-        try:
-            props = dict(node)
-        except Exception:
-            props = {}
-        try:
-            if hasattr(node, 'labels'):
-                labels = list(node.labels)
-            elif isinstance(node, dict) and 'labels' in node:
-                labels = node['labels'] if isinstance(node['labels'], list) else [node['labels']]
-            else:
-                labels = []
-        except Exception:
-            labels = []
-        # elementId 추출
-        eid = None
-        for attr in ("element_id", "id", "identity"):
-            if hasattr(node, attr):
-                try:
-                    val = getattr(node, attr)
-                    eid = str(val) if val is not None else None
-                    if eid: break
-                except Exception:
-                    continue
+    def _format_node(self, nid: str, labels: List[str], props: Dict[str, Any], score: float) -> Dict[str, Any]:
         ntype = labels[0] if labels else "Node"
         return {
-            "id": eid or json.dumps(props, ensure_ascii=False),
+            "id": nid,
             "type": ntype,
             "labels": labels,
-            "properties": props,
+            # 맵 프로젝션은 없는 속성을 null로 채우므로 제거 (보고서의 기본값 처리 유지)
+            "properties": {k: v for k, v in props.items() if v is not None},
             "score": score,
             "search_type": "fulltext",  # 본 쿼리는 항상 fulltext
         }
@@ -493,25 +630,29 @@ JSON 예:
         # 실제 관계 데이터가 있는 경우에만 상세 표시
         if isfrom:
             lines.append(f"원산지 관계 정보 ({len(isfrom)}건):")
-            for i, r in enumerate(isfrom, 1):
-                suffix = f" (농장수 {int(r['count'])}개)" if r.get("count") is not None else ""
-                lines.append(f"  {i}. {r['item']} → {r['origin']}{suffix}")
+            lines.extend(
+                f"  {i}. {r['item']} → {r['origin']}"
+                + (f" (농장수 {int(count)}개)" if (count := r.get("count")) is not None else "")
+                for i, r in enumerate(isfrom, 1)
+            )
             lines.append("")
 
         if nutrients:
             lines.append(f"영양성분 관계 정보 ({len(nutrients)}건):")
-            for i, n in enumerate(nutrients, 1):
-                amount = ""
-                if n.get("value") is not None:
-                    amount = f" (양: {n['value']}{n.get('unit','') or ''})"
-                lines.append(f"  {i}. {n['item']} - {n['nutrient']}{amount}")
+            lines.extend(
+                f"  {i}. {n['item']} - {n['nutrient']}"
+                + (f" (양: {value}{n.get('unit') or ''})" if (value := n.get("value")) is not None else "")
+                for i, n in enumerate(nutrients, 1)
+            )
             lines.append("")
 
         if docrels:
             lines.append(f"문서 관계 정보 ({len(docrels)}건):")
-            for i, d in enumerate(docrels, 1):
-                rtype = f" (type: {d['rel_type']})" if d.get("rel_type") else ""
-                lines.append(f"  {i}. {d['source']} - {d['target']}{rtype}")
+            lines.extend(
+                f"  {i}. {d['source']} - {d['target']}"
+                + (f" (type: {rtype})" if (rtype := d.get("rel_type")) else "")
+                for i, d in enumerate(docrels, 1)
+            )
             lines.append("")
 
         # 데이터 한계 및 권장사항 추가
@@ -557,46 +698,47 @@ class GraphQueryOptimizer:
 # =========================
 # Public Entrypoints
 # =========================
+def invalidate_graph_search_cache():
+    """그래프 검색 키워드/조회 결과 캐시 전체 삭제"""
+    _KEYWORD_CACHE.clear()
+    _ROWS_CACHE.clear()
+
+
+# 실행 중인 루프 안에서 동기 진입점이 호출될 때 검색을 돌릴 전용 스레드 (호출마다 풀을 만들지 않음)
+_SYNC_SEARCH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="neo4j-sync")
+
+
 def neo4j_search_sync(query: str) -> str:
     """스레드/프로세스 어디서나 호출 가능한 동기 진입점"""
     max_retries = 3
     retry_delay = 1.0
     
     for attempt in range(max_retries):
-        svc = None
         try:
-            svc = GraphDBSearchService()
-            
+            # 일회성 루프에서 실행되므로 서비스(드라이버)는 그 루프 안에서 만들고 닫음 (neo4j_graph_search_once)
             # 기존 이벤트 루프가 있는지 확인
             try:
                 asyncio.get_running_loop()
                 # 이미 실행 중인 루프가 있으면 ThreadPool에서 실행
                 _debug(f"Found running loop, using ThreadPoolExecutor (attempt {attempt + 1})")
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(_run_search_in_new_loop, svc, query)
-                    return future.result(timeout=30)  # 30초 타임아웃 추가
+                future = _SYNC_SEARCH_EXECUTOR.submit(_run_search_in_new_loop, query)
+                return future.result(timeout=30)  # 30초 타임아웃 추가
             except RuntimeError:
                 # 실행 중인 루프가 없으면 새 루프 생성
                 _debug(f"No running loop, creating new event loop (attempt {attempt + 1})")
                 loop = asyncio.new_event_loop()
                 try:
                     asyncio.set_event_loop(loop)
-                    return loop.run_until_complete(svc.search(query))
+                    return loop.run_until_complete(neo4j_graph_search_once(query))
                 finally:
                     loop.close()
                     asyncio.set_event_loop(None)
                     
         except (BlockingIOError, OSError, ConnectionError, TimeoutError) as e:
             _debug(f"Neo4j connection error on attempt {attempt + 1}: {e}")
-            if svc:
-                try:
-                    svc.close()
-                except:
-                    pass
             
             if attempt < max_retries - 1:
                 _debug(f"Retrying in {retry_delay} seconds...")
-                import time
                 time.sleep(retry_delay)
                 retry_delay *= 2  # 지수 백오프
                 continue
@@ -606,27 +748,16 @@ def neo4j_search_sync(query: str) -> str:
                 
         except Exception as e:
             _debug(f"Unexpected error on attempt {attempt + 1}: {e}")
-            if svc:
-                try:
-                    svc.close()
-                except:
-                    pass
             return f"Neo4j 동기 검색 오류: {e}"
-        finally:
-            if svc:
-                try:
-                    svc.close()
-                except:
-                    pass
 
 
-def _run_search_in_new_loop(svc: 'GraphDBSearchService', query: str) -> str:
+def _run_search_in_new_loop(query: str) -> str:
     """새로운 이벤트 루프에서 검색 실행"""
     loop = asyncio.new_event_loop()
     try:
         asyncio.set_event_loop(loop)
         # 타임아웃과 함께 실행
-        task = svc.search(query)
+        task = neo4j_graph_search_once(query)
         return loop.run_until_complete(asyncio.wait_for(task, timeout=25))
     except asyncio.TimeoutError:
         _debug("Neo4j search timed out after 25 seconds")
@@ -649,8 +780,43 @@ def _run_search_in_new_loop(svc: 'GraphDBSearchService', query: str) -> str:
             asyncio.set_event_loop(None)
 
 
+# 공유 검색 서비스 (드라이버 커넥션 풀을 요청 간 재사용)
+# 비동기 드라이버는 생성된 이벤트 루프에 묶이므로 그 루프에서 호출될 때만 공유
+_SHARED_SERVICE: Optional[GraphDBSearchService] = None
+_SHARED_SERVICE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SHARED_SERVICE_LOCK = threading.Lock()
+
+
+def get_service() -> Optional[GraphDBSearchService]:
+    """현재 이벤트 루프용 공유 서비스를 반환 (다른 루프가 이미 소유 중이면 None)"""
+    global _SHARED_SERVICE, _SHARED_SERVICE_LOOP
+    loop = asyncio.get_running_loop()
+    with _SHARED_SERVICE_LOCK:
+        if _SHARED_SERVICE is None or _SHARED_SERVICE_LOOP.is_closed():
+            _SHARED_SERVICE = GraphDBSearchService()
+            _SHARED_SERVICE_LOOP = loop
+        return _SHARED_SERVICE if _SHARED_SERVICE_LOOP is loop else None
+
+
+async def close_shared_service():
+    """공유 서비스의 드라이버 종료 (서버 종료 시 호출)"""
+    global _SHARED_SERVICE, _SHARED_SERVICE_LOOP
+    with _SHARED_SERVICE_LOCK:
+        svc, _SHARED_SERVICE, _SHARED_SERVICE_LOOP = _SHARED_SERVICE, None, None
+    if svc:
+        await svc.close()
+
+
 async def neo4j_graph_search(query: str) -> str:
     """에이전트에서 직접 await할 수 있는 비동기 진입점"""
+    svc = get_service()
+    if svc is None:
+        return await neo4j_graph_search_once(query)
+    return await svc.search(query)
+
+
+async def neo4j_graph_search_once(query: str) -> str:
+    """일회성 이벤트 루프(동기 래퍼)용 진입점 - 호출마다 드라이버를 만들고 닫음"""
     svc = GraphDBSearchService()
     try:
         return await svc.search(query)
@@ -9,7 +9,7 @@ from pypdf import PdfReader
 
 # 각 RAG 툴의 메인 함수를 import
 from ..database.postgres_rag_tool import postgres_rdb_search
-from ..database.neo4j_rag_tool import neo4j_graph_search
+from ..database.neo4j_rag_tool import neo4j_graph_search_once
 from ..database.elasticsearch.elastic_search_rag_tool import MultiIndexRAGSearchEngine, RAGConfig
 
 
@@ -529,7 +529,8 @@ def graph_db_search(query: str) -> str:
         loop = asyncio.new_event_loop()
         try:
             asyncio.set_event_loop(loop)
-            return loop.run_until_complete(neo4j_graph_search(query))
+            # 일회성 루프이므로 공유 드라이버 대신 호출마다 닫히는 서비스 사용
+            return loop.run_until_complete(neo4j_graph_search_once(query))
         finally:
             loop.close()
             asyncio.set_event_loop(None)
@@ -1,7 +1,7 @@
 from ...core.config.report_config import TeamType, ReportType, Language
+from ..json_utils import find_json_object
 from langchain_google_genai import ChatGoogleGenerativeAI
 import json
-import re
 
 class QueryAnalyzer:
     """질문 분석기 - 팀 타입, 언어, 복잡도 분석"""
@@ -94,9 +94,9 @@ class QueryAnalyzer:
             response = llm.invoke(prompt)
             result_text = response.content.strip()
 
-            json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
+            json_str = find_json_object(result_text)
+            if json_str:
+                result = json.loads(json_str)
             else:
                 result = json.loads(result_text)
 
@@ -0,0 +1,92 @@
+"""
+비동기 TTL + LRU 캐시
+동일한 외부 검색 호출(arXiv, RDB, 스크래핑)의 반복 실행을 줄이기 위한 캐시
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _OwnerCancelled(Exception):
+    """값을 계산하던 호출자가 취소됨 (같은 키를 기다리던 호출자는 다시 시도)"""
+
+
+class AsyncTTLCache:
+    """asyncio 환경에서 사용하는 TTL 기반 LRU 캐시
+
+    - capacity를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - ttl(초)이 지난 항목은 만료 처리
+    - 같은 키에 대한 동시 요청은 하나의 실행 결과를 공유 (thundering herd 방지)
+    - 실행하던 호출자가 취소되면 기다리던 호출자 중 하나가 이어서 실행
+    - 저장된 값은 모든 이벤트 루프/스레드가 공유하고, 실행 중인 요청은 루프별로 공유
+      (다른 루프의 future는 await 할 수 없으므로)
+    - 빈 결과(None, 빈 문자열/리스트)는 일시적 실패일 수 있으므로 저장하지 않음
+    """
+
+    def __init__(self, capacity: int = 256, ttl: float = 900.0):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # (이벤트 루프, 키) -> 실행 중인 요청의 future
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+        # 모듈 수준 인스턴스가 특정 이벤트 루프에 묶이지 않도록 threading.Lock 사용 (잠금 구간에서 await 금지)
+        self._lock = threading.Lock()
+
+    async def get_or_set(self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시된 값이 있으면 반환하고, 없으면 coro_factory()를 실행해 저장 후 반환합니다."""
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, key)
+        while True:
+            with self._lock:
+                entry = self._data.get(key)
+                if entry is not None:
+                    expires_at, value = entry
+                    if expires_at > time.monotonic():
+                        self._data.move_to_end(key)
+                        return value
+                    del self._data[key]
+
+                future = self._inflight.get(inflight_key)
+                is_owner = future is None
+                if is_owner:
+                    future = loop.create_future()
+                    self._inflight[inflight_key] = future
+
+            if is_owner:
+                break
+            try:
+                return await asyncio.shield(future)
+            except _OwnerCancelled:
+                # 실행하던 호출자만 취소된 것이므로 이 호출자가 다시 시도 (필요하면 새 소유자가 됨)
+                continue
+
+        try:
+            value = await coro_factory()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(inflight_key, None)
+            future.set_exception(_OwnerCancelled() if isinstance(e, asyncio.CancelledError) else e)
+            future.exception()  # 대기자가 없을 때 'never retrieved' 경고 방지
+            raise
+
+        with self._lock:
+            self._inflight.pop(inflight_key, None)
+            if value:
+                self._data[key] = (time.monotonic() + self.ttl, value)
+                self._data.move_to_end(key)
+                while len(self._data) > self.capacity:
+                    self._data.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def invalidate(self, key: Hashable):
+        """특정 키의 저장된 값을 제거합니다 (원본 데이터가 변경된 경우)."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """저장된 모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,30 @@
+"""
+백그라운드 태스크 관리
+결과를 기다리지 않는(fire-and-forget) asyncio 태스크가 실행 중에 GC되지 않도록 강한 참조를 유지
+"""
+import asyncio
+from typing import Any, Coroutine, Optional, Set
+
+# 이벤트 루프는 태스크를 약한 참조로만 들고 있으므로 완료될 때까지 여기서 참조 유지
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_task_done(task: asyncio.Task):
+    """완료된 태스크의 참조를 해제하고, 처리되지 않은 예외가 있으면 출력합니다."""
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        print(f"⚠️ 백그라운드 태스크 오류 ({task.get_name()}): {exc}")
+
+
+def spawn_background_task(coro: Coroutine[Any, Any, Any], name: Optional[str] = None) -> asyncio.Task:
+    """실행 중인 이벤트 루프에 태스크를 만들고 완료될 때까지 참조를 유지합니다.
+
+    결과를 await 하지 않는 태스크는 asyncio.create_task 대신 이 함수로 생성합니다.
+    """
+    task = asyncio.get_running_loop().create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
@@ -0,0 +1,35 @@
+"""
+LLM 응답 JSON 추출 유틸리티
+응답 텍스트에서 첫 번째 JSON 객체를 정규식 백트래킹 없이 한 번의 선형 스캔으로 찾음
+"""
+import re
+from typing import Optional
+
+# 문자열 리터럴(이스케이프 포함), 닫히지 않은 따옴표, 중괄호만 골라내는 토큰 정규식
+_JSON_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[{}]', re.DOTALL)
+
+
+def find_json_object(text: str, start: int = 0) -> Optional[str]:
+    """텍스트의 start 위치 이후 첫 '{'와 짝이 맞는 '}'까지의 JSON 객체 문자열을 반환합니다.
+
+    문자열 리터럴 내부의 중괄호와 이스케이프된 따옴표는 무시하며,
+    짝이 맞는 객체가 없으면 None을 반환합니다.
+    """
+    start = text.find('{', start)
+    if start == -1:
+        return None
+
+    # 문자 단위 대신 의미 있는 토큰 사이를 정규식 엔진(C)으로 건너뛰며 스캔
+    depth = 0
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:match.end()]
+        elif token == '"':
+            # 닫히지 않은 문자열 리터럴
+            return None
+    return None
@@ -0,0 +1,56 @@
+"""
+애플리케이션 로그 출력 설정
+모듈 로거들은 핸들러 없이 루트로 전파만 하고, 실제 출력(stdout 쓰기)은 여기서 설치한
+큐 리스너 스레드 하나가 담당 (이벤트 루프에서 flush 대기 방지)
+"""
+import atexit
+import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# 앱 패키지 로거 (app.main, app.core.agents.*, app.utils.session_logger 등의 부모)
+_APP_LOGGER_NAME = __name__.split(".")[0]
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: Optional[str] = None):
+    """루트 로거에 큐 핸들러를 설치하고 앱 로거 레벨을 설정합니다 (여러 번 호출해도 한 번만 적용).
+
+    루트에 이미 설정된 핸들러가 있으면 그대로 리스너 뒤로 옮겨 기존 설정을 유지하고,
+    없으면 stdout 핸들러를 사용합니다. 앱 로그 레벨은 APP_LOG_LEVEL(기본 INFO)로 지정하며
+    외부 라이브러리 로그는 기존처럼 WARNING 이상만 출력됩니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    if not handlers:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        handlers = [stream_handler]
+        if root.level == logging.NOTSET or root.level < logging.WARNING:
+            root.setLevel(logging.WARNING)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    logging.getLogger(_APP_LOGGER_NAME).setLevel((level or os.getenv("APP_LOG_LEVEL", "INFO")).upper())
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """큐에 남은 로그를 모두 출력하고 리스너 스레드를 종료합니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
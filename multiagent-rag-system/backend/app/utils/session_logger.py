@@ -3,10 +3,15 @@
 각 사용자 세션마다 독립적인 로그 출력 제공
 """
 import uuid
+import sys
+import logging
 import threading
+from contextvars import ContextVar
 from typing import Dict, List, Optional
 from datetime import datetime
-import sys
+
+# 세션 로그의 콘솔 출력 로거 (출력 설정은 utils.logging_setup, DEBUG 로그는 APP_LOG_LEVEL=DEBUG 일 때만 기록/출력)
+_console_logger = logging.getLogger(__name__)
 
 
 class SessionLogger:
@@ -16,8 +21,14 @@ class SessionLogger:
         self._session_logs: Dict[str, List[Dict]] = {}
         self._lock = threading.Lock()
     
-    def log(self, session_id: str, message: str, level: str = "INFO", component: str = "System"):
-        """세션별 로그 추가"""
+    @staticmethod
+    def is_enabled_for(level: int) -> bool:
+        """해당 레벨의 로그가 콘솔에 출력되는지 여부"""
+        return _console_logger.isEnabledFor(level)
+
+    def log(self, session_id: str, message: str, level: str = "INFO", component: str = "System",
+            exc_info: bool = False):
+        """세션별 로그 추가 (세션 로그 API용 기록은 레벨과 무관하게 항상 보관)"""
         with self._lock:
             if session_id not in self._session_logs:
                 self._session_logs[session_id] = []
@@ -31,10 +42,11 @@ class SessionLogger:
             }
             
             self._session_logs[session_id].append(log_entry)
-            
-            # 콘솔에 세션 구분자와 함께 출력
-            session_prefix = f"[{session_id[:8]}] {component}"
-            print(f"{session_prefix}: {message}")
+
+        # 콘솔에는 활성화된 레벨만 세션 구분자와 함께 출력 (락 밖에서 큐에 넣기만 함)
+        levelno = logging.getLevelName(level)
+        if _console_logger.isEnabledFor(levelno):
+            _console_logger.log(levelno, "[%s] %s: %s", session_id[:8], component, message, exc_info=exc_info)
     
     def get_session_logs(self, session_id: str) -> List[Dict]:
         """특정 세션의 모든 로그 반환"""
@@ -72,22 +84,36 @@ class SessionContextLogger:
     def __init__(self, session_id: str, component: str = "System"):
         self.session_id = session_id
         self.component = component
+
+    def isEnabledFor(self, level: int) -> bool:
+        """logging.Logger와 같은 방식으로 콘솔 출력 레벨 활성화 여부 확인"""
+        return session_logger.is_enabled_for(level)
     
-    def info(self, message: str):
+    def _log(self, level: int, message: str, args: tuple, exc_info: bool = False):
+        # 세션 로그 API에는 모든 레벨을 보관하므로 %-인자는 항상 포맷 (콘솔 출력만 레벨로 거름)
+        if args:
+            message = message % args
+        session_logger.log(self.session_id, message, logging.getLevelName(level), self.component, exc_info=exc_info)
+
+    def info(self, message: str, *args):
         """정보 레벨 로그"""
-        session_logger.log(self.session_id, message, "INFO", self.component)
+        self._log(logging.INFO, message, args)
     
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """에러 레벨 로그"""
-        session_logger.log(self.session_id, message, "ERROR", self.component)
+        self._log(logging.ERROR, message, args)
     
-    def warning(self, message: str):
+    def exception(self, message: str, *args):
+        """에러 레벨 로그 + 처리 중인 예외의 트레이스백 (출력은 로그 스레드에서 수행)"""
+        self._log(logging.ERROR, message, args, exc_info=True)
+    
+    def warning(self, message: str, *args):
         """경고 레벨 로그"""
-        session_logger.log(self.session_id, message, "WARNING", self.component)
+        self._log(logging.WARNING, message, args)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args):
         """디버그 레벨 로그"""
-        session_logger.log(self.session_id, message, "DEBUG", self.component)
+        self._log(logging.DEBUG, message, args)
 
 
 def get_session_logger(session_id: str, component: str = "System") -> SessionContextLogger:
@@ -101,17 +127,18 @@ def print_session_separated(session_id: str, component: str, message: str):
     print(f"{session_prefix}: {message}")
 
 
-# 현재 실행 중인 세션 컨텍스트를 저장하는 스레드 로컬 저장소
-import threading
-_thread_local = threading.local()
+# 현재 실행 중인 세션 컨텍스트 저장소
+# (ContextVar라 스레드별로는 기존과 같고, 같은 스레드의 동시 스트리밍 태스크끼리도 섞이지 않음)
+_current_session_id: ContextVar[Optional[str]] = ContextVar("current_session_id", default=None)
 
 def set_current_session(session_id: str):
-    """현재 스레드의 세션 ID 설정"""
-    _thread_local.session_id = session_id
+    """현재 실행 컨텍스트(스레드/태스크)의 세션 ID 설정"""
+    _current_session_id.set(session_id)
 
-def get_current_session() -> str:
-    """현재 스레드의 세션 ID 가져오기"""
-    return getattr(_thread_local, 'session_id', 'unknown')
+def get_current_session(default: Optional[str] = 'unknown') -> Optional[str]:
+    """현재 실행 컨텍스트의 세션 ID 가져오기"""
+    session_id = _current_session_id.get()
+    return default if session_id is None else session_id
 
 def session_print(component: str, message: str):
     """현재 세션의 로그 출력 (session_id가 자동으로 설정됨)"""